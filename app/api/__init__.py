@@ -0,0 +1,6 @@
+"""
+HTTP JSON API of the CV-Based Job Finder application.
+
+Exposes CV analysis, query generation, job search, batch scoring and CV
+optimization without the Streamlit UI; run it with run_api.py.
+"""
@@ -0,0 +1,58 @@
+from typing import List, Dict, Any, Optional
+from pydantic import BaseModel, Field
+
+
+class CVRequest(BaseModel):
+    """Request carrying a CV analysis, as returned by POST /cv/analyze."""
+
+    cv_analysis: Dict[str, Any]
+
+
+class CVAnalysisResponse(BaseModel):
+    cv_analysis: Dict[str, Any]
+    fingerprint: str
+
+
+class QueriesResponse(BaseModel):
+    queries: List[str]
+
+
+class SearchRequest(BaseModel):
+    queries: List[str] = Field(min_length=1)
+    location: str = ""
+    limit_per_query: int = Field(5, ge=1, le=50)
+
+
+class SearchResponse(BaseModel):
+    jobs: List[Dict[str, Any]]
+    throttled_queries: List[str]
+
+
+class Job(BaseModel):
+    """A job listing to score; listings are identified by URL, or by title, company and location."""
+
+    title: str = ""
+    company: str = ""
+    location: str = ""
+    url: Optional[str] = None
+    description: str = ""
+
+
+class ScoreRequest(CVRequest):
+    jobs: List[Job] = Field(min_length=1)
+
+
+class ScoreResponse(BaseModel):
+    results: Dict[str, Dict[str, Any]]
+    errors: Dict[str, str]
+    degraded: List[str]
+
+
+class OptimizeRequest(CVRequest):
+    target_job_titles: List[str] = Field(min_length=1)
+    reuse_saved: bool = True
+
+
+class OptimizeResponse(BaseModel):
+    results: Dict[str, Dict[str, Any]]
+    combined: Dict[str, List[str]]
@@ -0,0 +1,279 @@
+import asyncio
+import json
+import math
+from contextlib import asynccontextmanager
+from typing import Dict, Any, AsyncIterator, Callable, List, Optional
+from fastapi import APIRouter, Depends, FastAPI, File, Header, HTTPException, UploadFile
+from fastapi.responses import JSONResponse, StreamingResponse
+from starlette.concurrency import run_in_threadpool
+
+from app.api.schemas import (
+    CVRequest, CVAnalysisResponse, QueriesResponse, SearchRequest, SearchResponse,
+    ScoreRequest, ScoreResponse, OptimizeRequest, OptimizeResponse,
+)
+from app.utils.admission import AdmissionRejected, admission_scope
+from app.utils.config import API_KEYS, API_MAX_UPLOAD_BYTES, init_app
+from app.utils.cv_model import CVAnalysis, CVAnalysisError
+from app.utils.fingerprint import content_hash
+from app.utils.rate_limiter import ThrottledError
+from app.utils.resources import get_resource
+from app.utils.scoring import BatchScorer
+
+# Media type of streamed responses: one JSON object per line
+NDJSON = "application/x-ndjson"
+
+# Seconds between checks for new results while streaming a batch score
+STREAM_POLL_INTERVAL = 0.1
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Each worker process validates the configuration; shared resources are
+    # created on first use and closed when the process exits
+    init_app()
+    yield
+
+
+class TenantScope:
+    """ASGI middleware attributing each request's LLM usage to its tenant: a valid API key, or else the client address."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        key = dict(scope["headers"]).get(b"x-api-key", b"").decode("latin-1")
+        client = scope.get("client")
+        # Only configured keys name a tenant, so made-up keys can't claim fresh fair-share
+        # slots; keys are hashed so they don't show up in logs or metrics
+        if key in API_KEYS:
+            tenant = f"key:{content_hash(key)}"
+        else:
+            tenant = f"client:{client[0] if client else 'unknown'}"
+        # Streamed bodies are produced inside this call, so they stay in the scope too
+        with admission_scope(tenant):
+            await self.app(scope, receive, send)
+
+
+def api_key(x_api_key: Optional[str] = Header(None)) -> str:
+    """
+    Authenticate a request by its X-API-Key header.
+
+    Returns:
+        The request's API key (empty if none was sent and none is required)
+
+    Raises:
+        HTTPException: 401 if API keys are configured and the key isn't one of them
+    """
+    if API_KEYS and x_api_key not in API_KEYS:
+        raise HTTPException(status_code=401, detail="Invalid or missing API key")
+    return x_api_key or ""
+
+
+async def _call(fn: Callable[..., Any], *args, **kwargs) -> Any:
+    """Run a blocking call (LLM request, scraping, SQLite) off the event loop; its failures become 502s."""
+    try:
+        return await run_in_threadpool(fn, *args, **kwargs)
+    except (HTTPException, AdmissionRejected):
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=502, detail=str(e))
+
+
+def _cv(cv_analysis: Dict[str, Any]) -> CVAnalysis:
+    """Validate a CV analysis sent by a client."""
+    try:
+        return CVAnalysis.from_dict(cv_analysis)
+    except CVAnalysisError as e:
+        raise HTTPException(status_code=422, detail=f"Invalid CV analysis: {e}")
+
+
+def _ndjson(events: AsyncIterator[Dict[str, Any]]) -> StreamingResponse:
+    """Stream events as newline-delimited JSON."""
+    async def lines():
+        async for event in events:
+            yield json.dumps(event, default=str) + "\n"
+    return StreamingResponse(lines(), media_type=NDJSON)
+
+
+router = APIRouter(dependencies=[Depends(api_key)])
+
+
+@router.post("/cv/analyze", response_model=CVAnalysisResponse)
+async def analyze_cv(file: UploadFile = File(...)):
+    """Analyze an uploaded PDF CV."""
+    content = await file.read(API_MAX_UPLOAD_BYTES + 1)
+    if len(content) > API_MAX_UPLOAD_BYTES:
+        raise HTTPException(status_code=413, detail=f"CV exceeds {API_MAX_UPLOAD_BYTES} bytes")
+    if not content.startswith(b"%PDF"):
+        raise HTTPException(status_code=415, detail="CV must be a PDF file")
+
+    # Stored like UI uploads: resubmitting the same CV reuses its extracted text
+    path = await _call(get_resource("upload_store").save, content, "cv.pdf")
+    cv_analysis = await _call(get_resource("cv_parser").parse_cv, path)
+
+    if "error" in cv_analysis:
+        raise HTTPException(status_code=502, detail=cv_analysis["error"])
+    return {"cv_analysis": cv_analysis.to_dict(), "fingerprint": cv_analysis.fingerprint}
+
+
+@router.post("/queries", response_model=QueriesResponse)
+async def generate_queries(request: CVRequest):
+    """Generate job search queries for a CV."""
+    cv_analysis = _cv(request.cv_analysis)
+    queries = await _call(get_resource("llm_client").generate_job_search_queries, cv_analysis)
+    return {"queries": queries}
+
+
+async def _search(request: SearchRequest) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Search each query in turn, like search_multiple_queries.
+
+    Yields:
+        Per query, a dictionary with 'query' and either 'jobs' (listings not found
+        by an earlier query), 'throttled' or 'error'
+    """
+    searcher = get_resource("job_searcher")
+    seen = set()
+    for query in dict.fromkeys(request.queries):
+        try:
+            results = await run_in_threadpool(searcher.search_jobs, query, request.location, request.limit_per_query)
+        except ThrottledError:
+            yield {"query": query, "throttled": True}
+            continue
+        except Exception as e:
+            yield {"query": query, "error": str(e)}
+            continue
+        jobs = []
+        for job in results:
+            url = job.get("url")
+            if url in seen:
+                continue
+            if url:
+                seen.add(url)
+            jobs.append(job)
+        yield {"query": query, "jobs": jobs}
+
+
+@router.post("/search", response_model=SearchResponse)
+async def search(request: SearchRequest):
+    """Search jobs for several queries and return every listing found."""
+    jobs: List[Dict[str, Any]] = []
+    throttled_queries: List[str] = []
+    async for event in _search(request):
+        jobs.extend(event.get("jobs", []))
+        if event.get("throttled"):
+            throttled_queries.append(event["query"])
+    return {"jobs": jobs, "throttled_queries": throttled_queries}
+
+
+@router.post("/search/stream")
+async def search_stream(request: SearchRequest):
+    """Search jobs for several queries, streaming each query's listings (NDJSON) as soon as it is searched."""
+    return _ndjson(_search(request))
+
+
+async def _score(request: ScoreRequest) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Score jobs against a CV concurrently, reusing stored scores.
+
+    Yields:
+        A dictionary per job as soon as it is scored, with 'job_key' and either
+        'result' (plus 'degraded' if the local scorer answered) or 'error'; then
+        a final one with 'done', 'completed' and 'total'
+    """
+    cv_analysis = _cv(request.cv_analysis)
+    jobs = [job.model_dump() for job in request.jobs]
+    scorer = BatchScorer(
+        get_resource("advanced_features"), get_resource("score_store"), fallback=get_resource("local_scorer")
+    )
+    await _call(scorer.start, cv_analysis, jobs)
+
+    reported = set()
+    try:
+        while True:
+            # Check before taking the snapshot so the last one holds every result
+            running = scorer.running
+            snapshot = scorer.snapshot()
+            degraded = set(snapshot["degraded"])
+            for key, result in snapshot["results"].items():
+                if key not in reported:
+                    reported.add(key)
+                    yield {"job_key": key, "result": result, "degraded": key in degraded}
+            for key, error in snapshot["errors"].items():
+                if key not in reported:
+                    reported.add(key)
+                    yield {"job_key": key, "error": error}
+            if not running:
+                break
+            await asyncio.sleep(STREAM_POLL_INTERVAL)
+        yield {"done": True, "completed": snapshot["completed"], "total": snapshot["total"]}
+    finally:
+        # A client that disconnects mid-stream stops the jobs not yet started
+        scorer.cancel()
+
+
+@router.post("/score", response_model=ScoreResponse)
+async def score(request: ScoreRequest):
+    """Score jobs against a CV; results are keyed by job URL (or title, company and location)."""
+    results: Dict[str, Dict[str, Any]] = {}
+    errors: Dict[str, str] = {}
+    degraded: List[str] = []
+    async for event in _score(request):
+        if "result" in event:
+            results[event["job_key"]] = event["result"]
+            if event["degraded"]:
+                degraded.append(event["job_key"])
+        elif "error" in event:
+            errors[event["job_key"]] = event["error"]
+    return {"results": results, "errors": errors, "degraded": degraded}
+
+
+@router.post("/score/stream")
+async def score_stream(request: ScoreRequest):
+    """Score jobs against a CV, streaming each score (NDJSON) as soon as it is available."""
+    # Validate before the response starts, so a bad CV is still a 422
+    _cv(request.cv_analysis)
+    return _ndjson(_score(request))
+
+
+@router.post("/optimize", response_model=OptimizeResponse)
+async def optimize(request: OptimizeRequest):
+    """Recommend CV changes for several target job titles, plus the ones they share."""
+    cv_analysis = _cv(request.cv_analysis)
+    advanced_features = get_resource("advanced_features")
+    results = await _call(
+        advanced_features.optimize_cv_for_titles,
+        cv_analysis, request.target_job_titles,
+        store=get_resource("score_store") if request.reuse_saved else None,
+    )
+    return {"results": results, "combined": advanced_features.combine_optimizations(results)}
+
+
+@router.get("/metrics")
+async def metrics():
+    """Load of this worker process: LLM admission queue depths, waits and rejections, and upload storage use."""
+    return {"admission": get_resource("admission").metrics(), "uploads": get_resource("upload_store").stats()}
+
+
+app = FastAPI(title="CV-Based Job Finder API", lifespan=lifespan)
+app.include_router(router)
+app.add_middleware(TenantScope)
+
+
+@app.exception_handler(AdmissionRejected)
+async def admission_rejected(request, exc: AdmissionRejected):
+    """Answer requests the admission controller turned away with 429 Too Many Requests."""
+    return JSONResponse(
+        status_code=429,
+        content={"detail": str(exc)},
+        headers={"Retry-After": str(math.ceil(exc.retry_after))},
+    )
+
+
+@app.get("/health")
+async def health():
+    """Liveness check; doesn't require an API key."""
+    return {"status": "ok"}
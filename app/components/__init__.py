@@ -6,16 +6,42 @@ This module contains the components used in the application, including:
 - Job Search: For searching job opportunities
 - CV Optimizer: For optimizing CVs for specific job roles
 - Job Compatibility: For scoring CV compatibility with job descriptions
+
+Components are imported on first access, like the utilities in app.utils.
 """
 
-from app.components.cv_analyzer import CVAnalyzerComponent
-from app.components.job_search import JobSearchComponent
-from app.components.cv_optimizer import CVOptimizerComponent
-from app.components.job_compatibility import JobCompatibilityComponent
+import importlib
+from typing import TYPE_CHECKING
+
+_EXPORTS = {
+    'CVAnalyzerComponent': 'app.components.cv_analyzer',
+    'JobSearchComponent': 'app.components.job_search',
+    'CVOptimizerComponent': 'app.components.cv_optimizer',
+    'JobCompatibilityComponent': 'app.components.job_compatibility',
+}
+
+if TYPE_CHECKING:
+    from app.components.cv_analyzer import CVAnalyzerComponent
+    from app.components.job_search import JobSearchComponent
+    from app.components.cv_optimizer import CVOptimizerComponent
+    from app.components.job_compatibility import JobCompatibilityComponent
 
 __all__ = [
     'CVAnalyzerComponent',
     'JobSearchComponent',
     'CVOptimizerComponent',
     'JobCompatibilityComponent',
-]
\ No newline at end of file
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,69 @@
+import streamlit as st
+import time
+import uuid
+from typing import Any, Callable, Hashable, Optional
+from app.utils.fingerprint import content_hash
+from app.utils.resources import get_resource
+from app.utils.tasks import Task
+
+
+def session_id() -> str:
+    """Return an identifier of the current browser session, stable across reruns."""
+    if "session_id" not in st.session_state:
+        st.session_state["session_id"] = uuid.uuid4().hex
+    return st.session_state["session_id"]
+
+
+def submit_task(key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Task:
+    """Run fn(task, *args, **kwargs) in the background for this session, unless a task with this key exists."""
+    return get_resource("task_runner").submit(session_id(), key, fn, *args, **kwargs)
+
+
+def get_task(key: Hashable) -> Optional[Task]:
+    """Return this session's task for a key, if any."""
+    return get_resource("task_runner").get(session_id(), key)
+
+
+def discard_task(key: Hashable):
+    """Cancel this session's task for a key and forget its result."""
+    get_resource("task_runner").discard(session_id(), key)
+
+
+def wait_for_task(task: Task, message: str, interval: float = 0.25) -> Task:
+    """
+    Show a task's progress until it finishes or is cancelled, with a button to cancel it.
+
+    Interacting with any widget reruns the script and abandons this wait, not the
+    task: the next rerun finds the task by its key and resumes waiting.
+
+    Args:
+        task: Task to wait for
+        message: Text shown while waiting
+        interval: Seconds between polls
+
+    Returns:
+        The task
+    """
+    if task.done:
+        return task
+
+    cancel_placeholder = st.empty()
+    if cancel_placeholder.button("Cancel", key=f"cancel_task_{content_hash(repr(task.key))}"):
+        task.cancel()
+
+    progress_placeholder = st.empty()
+    while not task.done and not task.cancelled:
+        snapshot = task.snapshot()
+        text = f"{message} {snapshot['message']}".strip()
+        if snapshot["total"]:
+            progress_placeholder.progress(
+                min(snapshot["completed"] / snapshot["total"], 1.0),
+                text=f"{text} ({snapshot['completed']} of {snapshot['total']})"
+            )
+        else:
+            progress_placeholder.info(text)
+        time.sleep(interval)
+
+    cancel_placeholder.empty()
+    progress_placeholder.empty()
+    return task
@@ -10,14 +10,18 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.utils import CVParser, OpenRouterClient
+from app.utils.resources import get_resource
+from app.utils.cv_model import CVAnalysis
+from app.utils.tasks import DONE, FAILED
+from app.components.background import session_id, submit_task, get_task, wait_for_task
+from app.components.session_data import store_value, load_value
 
 class CVAnalyzerComponent:
     """Streamlit component for CV upload and analysis."""
     
     def __init__(self):
-        self.cv_parser = CVParser()
-        self.llm_client = OpenRouterClient()
+        self.cv_parser = get_resource("cv_parser")
+        self.llm_client = get_resource("llm_client")
         
     def render(self) -> Tuple[bool, Optional[Dict[str, Any]], Optional[str]]:
         """
@@ -43,29 +47,46 @@ class CVAnalyzerComponent:
             cv_path = self.cv_parser.save_uploaded_cv(uploaded_file)
             
         # Check if analysis has already been done
-        if "cv_analysis" in st.session_state and "cv_path" in st.session_state and st.session_state["cv_path"] == cv_path:
-            cv_analysis = st.session_state["cv_analysis"]
+        cv_analysis = load_value("cv_analysis")
+        if cv_analysis is not None and st.session_state.get("cv_path") == cv_path:
             self._display_cv_analysis(cv_analysis)
             return True, cv_analysis, cv_path
         
-        # Analyze the CV
+        # Analyze the CV in the background, so a rerun while waiting doesn't restart the analysis
+        task_key = ("analyze_cv", cv_path, getattr(uploaded_file, "file_id", None))
         analyze_button = st.button("Analyze CV")
         
         if analyze_button:
-            with st.spinner("Analyzing your CV... This may take a moment."):
-                try:
-                    cv_analysis = self.cv_parser.parse_cv(cv_path)
-                    
-                    # Store the analysis in session state
-                    st.session_state["cv_analysis"] = cv_analysis
-                    st.session_state["cv_path"] = cv_path
-                    
-                    self._display_cv_analysis(cv_analysis)
-                    return True, cv_analysis, cv_path
-                except Exception as e:
-                    st.error(f"Error analyzing CV: {e}")
-                    return False, None, None
+            task = submit_task(task_key, lambda task: self.cv_parser.parse_cv(cv_path))
+            # Start on the job search (queries, then a first search) the moment the analysis lands
+            prefetcher = get_resource("prefetcher")
+            current_session = session_id()
+            
+            def prefetch(task):
+                if task.state == DONE and isinstance(task.result, CVAnalysis):
+                    prefetcher.start(current_session, task.result)
+            
+            task.add_done_callback(prefetch)
+        else:
+            task = get_task(task_key)
+        
+        if task is None:
+            return False, None, None
         
+        wait_for_task(task, "Analyzing your CV... This may take a moment.")
+        if task.state == DONE:
+            cv_analysis = task.result
+            
+            # Store the analysis in session state
+            store_value("cv_analysis", cv_analysis)
+            st.session_state["cv_path"] = cv_path
+            
+            self._display_cv_analysis(cv_analysis)
+            return True, cv_analysis, cv_path
+        if task.state == FAILED:
+            st.error(f"Error analyzing CV: {task.error}")
+        else:
+            st.info("CV analysis cancelled.")
         return False, None, None
     
     def _display_cv_analysis(self, cv_analysis: Dict[str, Any]):
@@ -84,51 +105,26 @@ class CVAnalyzerComponent:
                 st.text_area("Raw Response", cv_analysis["raw_content"], height=300)
             return
         
-        # Display skills
-        if "skills" in cv_analysis:
-            st.write("**Skills:**")
-            if isinstance(cv_analysis["skills"], list):
-                for skill in cv_analysis["skills"]:
-                    st.write(f"- {skill}")
-            else:
-                st.write(cv_analysis["skills"])
-        
-        # Display experience
-        if "experience" in cv_analysis:
-            st.write("**Experience:**")
-            if isinstance(cv_analysis["experience"], list):
-                for exp in cv_analysis["experience"]:
-                    st.write(f"- {exp}")
-            else:
-                st.write(cv_analysis["experience"])
-        
-        # Display education
-        if "education" in cv_analysis:
-            st.write("**Education:**")
-            if isinstance(cv_analysis["education"], list):
-                for edu in cv_analysis["education"]:
-                    st.write(f"- {edu}")
-            else:
-                st.write(cv_analysis["education"])
-        
-        # Display job titles
-        if "job_titles" in cv_analysis:
-            st.write("**Job Titles:**")
-            if isinstance(cv_analysis["job_titles"], list):
-                for title in cv_analysis["job_titles"]:
-                    st.write(f"- {title}")
-            else:
-                st.write(cv_analysis["job_titles"])
-        
-        # Display relevant job keywords
-        if "relevant_job_keywords" in cv_analysis:
-            st.write("**Relevant Job Keywords:**")
-            if isinstance(cv_analysis["relevant_job_keywords"], list):
-                for keyword in cv_analysis["relevant_job_keywords"]:
-                    st.write(f"- {keyword}")
+        # Every field of a validated analysis is a list (grouped skills are a dictionary of lists)
+        sections = [
+            ("skills", "Skills"),
+            ("experience", "Experience"),
+            ("education", "Education"),
+            ("job_titles", "Job Titles"),
+            ("relevant_job_keywords", "Relevant Job Keywords"),
+        ]
+        for field, label in sections:
+            value = cv_analysis.get(field)
+            if not value:
+                continue
+            st.write(f"**{label}:**")
+            if isinstance(value, dict):
+                for category, items in value.items():
+                    st.write(f"- {category}: {', '.join(map(str, items))}")
             else:
-                st.write(cv_analysis["relevant_job_keywords"])
+                for item in value:
+                    st.write(f"- {item}")
         
         # Display raw JSON for debugging
         with st.expander("View Raw Analysis Data"):
-            st.json(cv_analysis)
\ No newline at end of file
+            st.json(cv_analysis.to_dict() if isinstance(cv_analysis, CVAnalysis) else cv_analysis)
\ No newline at end of file
@@ -1,7 +1,7 @@
 import streamlit as st
 import os
 import sys
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, List
 
 # Add the project root directory to Python path if not already there
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -9,13 +9,14 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.utils import AdvancedFeatures
+from app.utils.resources import get_resource
 
 class CVOptimizerComponent:
     """Streamlit component for CV optimization."""
     
     def __init__(self):
-        self.advanced_features = AdvancedFeatures()
+        self.advanced_features = get_resource("advanced_features")
+        self.score_store = get_resource("score_store")
         
     def render(self, cv_analysis: Optional[Dict[str, Any]] = None):
         """
@@ -32,18 +33,108 @@ class CVOptimizerComponent:
         
         st.write("Get tailored recommendations to optimize your CV for specific job roles.")
         
-        # Input for target job title
-        target_job_title = st.text_input("Target Job Title", 
-                                         placeholder="e.g., Senior Software Engineer, Data Scientist, Product Manager")
+        # Input for target job titles (one per line to compare several roles)
+        target_job_titles_text = st.text_area(
+            "Target Job Titles (one per line)",
+            placeholder="e.g., Senior Software Engineer\nData Scientist\nProduct Manager",
+            height=120
+        )
+        target_job_titles = list(dict.fromkeys(
+            title.strip() for title in target_job_titles_text.splitlines() if title.strip()
+        ))
+        
+        reuse_saved = st.checkbox(
+            "Reuse saved recommendations for the same or a similar title",
+            value=True,
+            help="Titles are matched after expanding abbreviations and normalizing seniority and word order."
+        )
         
-        if target_job_title and st.button("Get Optimization Recommendations"):
-            with st.spinner("Generating CV optimization recommendations..."):
+        if target_job_titles and st.button("Get Optimization Recommendations"):
+            with st.spinner(f"Generating CV optimization recommendations for {len(target_job_titles)} role(s)..."):
                 try:
-                    optimization_results = self.advanced_features.optimize_cv(cv_analysis, target_job_title)
-                    self._display_optimization_results(optimization_results, target_job_title)
+                    results = self.advanced_features.optimize_cv_for_titles(
+                        cv_analysis,
+                        target_job_titles,
+                        store=self.score_store if reuse_saved else None
+                    )
+                    if len(results) == 1:
+                        title, optimization_results = next(iter(results.items()))
+                        self._display_optimization_results(optimization_results, title)
+                    else:
+                        self._display_multi_target_results(results)
                 except Exception as e:
                     st.error(f"Error generating optimization recommendations: {e}")
     
+    def _display_multi_target_results(self, results: Dict[str, Dict[str, Any]]):
+        """
+        Display CV optimization results for several target jobs with a combined summary.
+        
+        Args:
+            results: Optimization recommendations by target job title
+        """
+        combined = self.advanced_features.combine_optimizations(results)
+        titles = list(results)
+        tabs = st.tabs(["Combined"] + titles)
+        
+        with tabs[0]:
+            st.subheader(f"CV Optimization for {len(titles)} Roles")
+            failed = [title for title, result in results.items() if "error" in result]
+            if failed:
+                st.warning(f"Could not generate recommendations for: {', '.join(failed)}")
+            
+            if combined["skills_to_add"]:
+                st.write("**Skills to Add (recommended for several roles):**")
+                for skill in combined["skills_to_add"]:
+                    st.write(f"- {skill}")
+            if combined["skills_to_emphasize"]:
+                st.write("**Skills to Emphasize (recommended for several roles):**")
+                for skill in combined["skills_to_emphasize"]:
+                    st.write(f"- {skill}")
+            if not combined["skills_to_add"] and not combined["skills_to_emphasize"]:
+                st.write("No recommendations are shared between the roles; see each role's tab.")
+            
+            st.markdown("---")
+            st.download_button(
+                label="Download Combined Optimization Report",
+                data=self._combined_report(results, combined),
+                file_name="cv_optimization_combined.md",
+                mime="text/markdown"
+            )
+        
+        for tab, title in zip(tabs[1:], titles):
+            with tab:
+                self._display_optimization_results(results[title], title)
+    
+    def _combined_report(self, results: Dict[str, Dict[str, Any]], combined: Dict[str, List[str]]) -> str:
+        """Build a markdown report covering every target job."""
+        sections = [
+            f"# CV Optimization Report for {len(results)} Roles",
+            f"Target roles: {', '.join(results)}",
+            f"## Skills to Add for Several Roles\n{self._format_list_or_text(combined['skills_to_add'])}",
+            f"## Skills to Emphasize for Several Roles\n{self._format_list_or_text(combined['skills_to_emphasize'])}",
+        ]
+        for title, result in results.items():
+            if "error" in result:
+                sections.append(f"## {title}\nCould not generate recommendations: {result['error']}")
+                continue
+            sections.append(f"""## {title}
+
+### Skills to Add
+{self._format_list_or_text(result.get('skills_to_add', []))}
+
+### Skills to Emphasize
+{self._format_list_or_text(result.get('skills_to_emphasize', []))}
+
+### Experiences to Emphasize
+{self._format_list_or_text(result.get('experiences_to_emphasize', []))}
+
+### Items to Remove or De-emphasize
+{self._format_list_or_text(result.get('items_to_remove', []))}
+
+### General Recommendations
+{self._format_list_or_text(result.get('general_recommendations', []))}""")
+        return "\n\n".join(sections) + "\n"
+    
     def _display_optimization_results(self, optimization_results: Dict[str, Any], target_job_title: str):
         """
         Display CV optimization results.
@@ -54,6 +145,16 @@ class CVOptimizerComponent:
         """
         st.subheader(f"CV Optimization for {target_job_title}")
         
+        cache_match = optimization_results.get("cache_match")
+        if cache_match:
+            if cache_match["title"] == target_job_title:
+                st.caption("Showing the saved recommendations for this CV and role.")
+            else:
+                st.caption(
+                    f"Reusing the recommendations for '{cache_match['title']}' "
+                    f"(matched as '{cache_match['canonical_title']}', {cache_match['similarity']:.0%} similar)."
+                )
+        
         # Check if there was an error
         if "error" in optimization_results:
             st.error(f"Error in optimization: {optimization_results['error']}")
@@ -1,7 +1,7 @@
 import streamlit as st
 import os
 import sys
-import pandas as pd
+import time
 from typing import Dict, Any, Optional, List, Union
 
 # Add the project root directory to Python path if not already there
@@ -10,13 +10,22 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.utils import AdvancedFeatures
+from app.utils.config import BATCH_SCORING_TOP_K
+from app.utils.scoring import BatchScorer, job_key, job_description_text, parse_score
+from app.utils.fingerprint import cv_fingerprint, content_hash
+from app.utils.local_scoring import IncrementalScorer
+from app.utils.resources import get_resource
+from app.utils.tasks import DONE, FAILED
+from app.components.background import submit_task, get_task, wait_for_task
 
 class JobCompatibilityComponent:
     """Streamlit component for job compatibility scoring."""
     
     def __init__(self):
-        self.advanced_features = AdvancedFeatures()
+        self.advanced_features = get_resource("advanced_features")
+        self.ranker = get_resource("ranker")
+        self.score_store = get_resource("score_store")
+        self.local_scorer = get_resource("local_scorer")
         
     def render(self, cv_analysis: Optional[Dict[str, Any]] = None, job_search_results: Optional[List[Dict[str, Any]]] = None):
         """
@@ -45,10 +54,12 @@ class JobCompatibilityComponent:
     
     def _render_from_job_search(self, cv_analysis: Dict[str, Any], job_search_results: Optional[List[Dict[str, Any]]]):
         """Render the job compatibility from job search results."""
-        if not job_search_results:
+        if job_search_results is None or len(job_search_results) == 0:
             st.info("Please search for jobs first to calculate compatibility scores.")
             return
         
+        import pandas as pd
+
         # Convert job search results to DataFrame for display if it's not already
         if isinstance(job_search_results, pd.DataFrame):
             df = job_search_results
@@ -60,40 +71,201 @@ class JobCompatibilityComponent:
         if all(col in df.columns for col in display_columns):
             display_df = df[display_columns].copy()
             
+            # Pre-rank all jobs locally so the most relevant ones are listed (and scored) first
+            jobs = df.to_dict("records")
+            ranking = self.ranker.rank(cv_analysis, jobs, top_k=len(jobs))
+            relevance = dict(ranking)
+            
             # Add a select column
             selected_job_index = st.selectbox(
-                "Select a job to calculate compatibility score:",
-                range(len(display_df)),
-                format_func=lambda i: f"{display_df.iloc[i]['title']} at {display_df.iloc[i]['company']}"
+                "Select a job to calculate compatibility score (sorted by local relevance):",
+                [index for index, _ in ranking],
+                format_func=lambda i: (
+                    f"{display_df.iloc[i]['title']} at {display_df.iloc[i]['company']} "
+                    f"(relevance {relevance[i]:.0%})"
+                )
+            )
+            
+            selected_job = jobs[selected_job_index]
+            
+            # Instant local estimate while the detailed LLM analysis is a click away
+            local_results = self.local_scorer.score(
+                cv_analysis, job_description_text(selected_job), selected_job.get('title', '')
             )
+            st.caption(f"Instant local estimate: {local_results['overall_score']}% overall match")
             
-            selected_job = df.iloc[selected_job_index].to_dict() if isinstance(df, pd.DataFrame) else job_search_results[selected_job_index]
+            self._render_single_score(
+                cv_analysis,
+                job_key(selected_job),
+                job_description_text(selected_job),
+                selected_job.get('title', ''),
+                selected_job.get('company', ''),
+                start=st.button("Calculate Compatibility Score"),
+                slot="search_score_task"
+            )
             
-            if st.button("Calculate Compatibility Score"):
-                with st.spinner("Calculating job compatibility score..."):
-                    try:
-                        # Extract job description
-                        job_description = selected_job.get('description', '')
-                        if not job_description:
-                            job_description = f"Job Title: {selected_job.get('title', '')}\nCompany: {selected_job.get('company', '')}\nLocation: {selected_job.get('location', '')}"
-                        
-                        # Calculate compatibility score
-                        compatibility_results = self.advanced_features.calculate_job_match_score(
-                            cv_analysis, 
-                            job_description
-                        )
-                        
-                        # Display results
-                        self._display_compatibility_results(
-                            compatibility_results, 
-                            selected_job.get('title', 'Selected Job'),
-                            selected_job.get('company', '')
-                        )
-                    except Exception as e:
-                        st.error(f"Error calculating compatibility score: {e}")
+            st.divider()
+            self._render_batch_scoring(cv_analysis, [jobs[index] for index, _ in ranking])
         else:
             st.error("Job search results do not contain the expected columns.")
     
+    def _render_batch_scoring(self, cv_analysis: Dict[str, Any], ranked_jobs: List[Dict[str, Any]]):
+        """
+        Render the "score all jobs" batch mode.
+        
+        Only the most relevant jobs are sent to the LLM, concurrently in the background
+        and most relevant first; the others keep their local estimate. Results are
+        persisted in the score store so reruns (and later batches) don't recompute them.
+        
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+            ranked_jobs: Job listings ordered by local relevance
+        """
+        st.subheader("Score All Jobs")
+        
+        # Scores are only valid for the CV they were computed against
+        cv_hash = cv_fingerprint(cv_analysis)
+        if st.session_state.get("compatibility_scores_cv") != cv_hash:
+            st.session_state["compatibility_scores"] = {}
+            st.session_state["degraded_scores"] = {}
+            st.session_state["compatibility_scores_cv"] = cv_hash
+        scores = st.session_state["compatibility_scores"]
+        # Local fallbacks for jobs whose detailed scoring failed: shown in the table,
+        # but kept out of scores so the jobs stay pending and are retried
+        degraded_scores = st.session_state.setdefault("degraded_scores", {})
+        local_scores = self._local_scores(cv_analysis, ranked_jobs)
+        
+        # Pick up scores stored by earlier sessions or page loads with one bulk lookup
+        unscored = {
+            job_key(job): self.advanced_features.match_score_key(cv_analysis, job_key(job), job_description_text(job))
+            for job in ranked_jobs if job_key(job) not in scores
+        }
+        if unscored:
+            stored = self.score_store.get_many(unscored.values())
+            scores.update({key: stored[store_key] for key, store_key in unscored.items() if store_key in stored})
+        
+        # Detailed scores are expensive, so they are limited to the top of the local ranking
+        top_k = st.number_input(
+            "Most relevant jobs to score in detail",
+            min_value=1,
+            max_value=len(ranked_jobs),
+            value=min(BATCH_SCORING_TOP_K or len(ranked_jobs), len(ranked_jobs)),
+        )
+        pending_jobs = [job for job in ranked_jobs[:top_k] if job_key(job) not in scores]
+        scorer = st.session_state.get("batch_scorer")
+        
+        if scorer is not None and scorer.running:
+            if st.button("Cancel Scoring"):
+                scorer.cancel()
+        elif pending_jobs:
+            label = "Score All Jobs" if top_k == len(ranked_jobs) else f"Score Top {top_k} Jobs"
+            if st.button(f"{label} ({len(pending_jobs)} not yet scored)"):
+                scorer = BatchScorer(self.advanced_features, self.score_store, fallback=self.local_scorer)
+                scorer.start(cv_analysis, pending_jobs)
+                st.session_state["batch_scorer"] = scorer
+        
+        progress_placeholder = st.empty()
+        table_placeholder = st.empty()
+        
+        # Poll the background scorer, updating the progress bar and table as results land
+        while scorer is not None:
+            # Check before taking the snapshot, so the last snapshot holds every result
+            running = scorer.running
+            snapshot = scorer.snapshot()
+            degraded = set(snapshot["degraded"])
+            for key, result in snapshot["results"].items():
+                if key in degraded:
+                    degraded_scores[key] = result
+                else:
+                    scores[key] = result
+                    degraded_scores.pop(key, None)
+            if snapshot["total"]:
+                status = "cancelled" if scorer.cancelled else "scored"
+                progress_placeholder.progress(
+                    snapshot["completed"] / snapshot["total"],
+                    text=f"{snapshot['completed']} of {snapshot['total']} jobs {status}"
+                )
+            self._render_score_table(ranked_jobs, {**degraded_scores, **scores}, local_scores, table_placeholder)
+            if not running:
+                for key, error in snapshot["errors"].items():
+                    st.warning(f"Could not score {key}: {error}")
+                if snapshot["degraded"]:
+                    st.warning(
+                        f"Detailed scoring failed for {len(snapshot['degraded'])} jobs; "
+                        "their scores are local estimates and will be retried next time."
+                    )
+                st.session_state.pop("batch_scorer", None)
+                return
+            time.sleep(0.5)
+        
+        self._render_score_table(ranked_jobs, {**degraded_scores, **scores}, local_scores, table_placeholder)
+    
+    def _local_scores(self, cv_analysis: Dict[str, Any], ranked_jobs: List[Dict[str, Any]]) -> Dict[str, int]:
+        """
+        Compute the instant local overall score of every job.
+        
+        Sub-scores are kept across reruns, so editing the CV only recomputes the
+        dimensions (skills, experience, education) and jobs the edit affects.
+        """
+        if "incremental_scorer" not in st.session_state:
+            st.session_state["incremental_scorer"] = IncrementalScorer(self.local_scorer)
+        scorer = st.session_state["incremental_scorer"]
+        
+        previous_cv = scorer.cv_analysis
+        results = scorer.update(
+            cv_analysis,
+            [(job_key(job), job_description_text(job), job.get("title", "")) for job in ranked_jobs]
+        )
+        stats = scorer.last_stats
+        if previous_cv is not None and previous_cv != cv_analysis:
+            recomputed = stats["skills"] + stats["experience"] + stats["education"]
+            st.caption(
+                f"CV changed: re-scored {recomputed} of {3 * (stats['jobs'] - stats['new_jobs'])} "
+                "local sub-scores, reused the rest."
+            )
+        return {key: result["overall_score"] for key, result in results.items()}
+    
+    def _render_score_table(
+        self,
+        ranked_jobs: List[Dict[str, Any]],
+        scores: Dict[str, Dict[str, Any]],
+        local_scores: Dict[str, int],
+        placeholder
+    ):
+        """Render a sortable table of every job: detailed scores where available, local estimates for all."""
+        rows = []
+        for job in ranked_jobs:
+            result = scores.get(job_key(job))
+            if result is None or "error" in result:
+                result = {}
+            rows.append({
+                "Overall": parse_score(result.get("overall_score")) if result else None,
+                "Local": local_scores.get(job_key(job)),
+                "Skills": parse_score(result.get("skills_match")) if result else None,
+                "Experience": parse_score(result.get("experience_match")) if result else None,
+                "Education": parse_score(result.get("education_match")) if result else None,
+                "Title": job.get("title", ""),
+                "Company": job.get("company", ""),
+                "Location": job.get("location", ""),
+                "URL": job.get("url", ""),
+            })
+        if not rows:
+            return
+        
+        import pandas as pd
+
+        table = pd.DataFrame(rows).sort_values(["Overall", "Local"], ascending=False, na_position="last")
+        placeholder.dataframe(
+            table,
+            column_config={
+                "Overall": st.column_config.ProgressColumn("Overall", format="%d%%", min_value=0, max_value=100),
+                "Local": st.column_config.NumberColumn("Local estimate", format="%d%%"),
+                "URL": st.column_config.LinkColumn("Link"),
+            },
+            hide_index=True,
+            use_container_width=True
+        )
+    
     def _render_manual_entry(self, cv_analysis: Dict[str, Any]):
         """Render the job compatibility with manual job description entry."""
         st.subheader("Enter Job Details Manually")
@@ -106,19 +278,107 @@ class JobCompatibilityComponent:
             height=300
         )
         
-        if job_title and job_description and st.button("Calculate Compatibility Score"):
-            with st.spinner("Calculating job compatibility score..."):
-                try:
-                    # Calculate compatibility score
-                    compatibility_results = self.advanced_features.calculate_job_match_score(
-                        cv_analysis, 
-                        f"Job Title: {job_title}\nCompany: {company}\n\n{job_description}"
-                    )
-                    
-                    # Display results
-                    self._display_compatibility_results(compatibility_results, job_title, company)
-                except Exception as e:
-                    st.error(f"Error calculating compatibility score: {e}")
+        if job_title and job_description:
+            self._render_single_score(
+                cv_analysis,
+                f"manual:{content_hash(f'{job_title}|{company}')}",
+                f"Job Title: {job_title}\nCompany: {company}\n\n{job_description}",
+                job_title,
+                company,
+                start=st.button("Calculate Compatibility Score"),
+                slot="manual_score_task"
+            )
+    
+    def _render_single_score(
+        self,
+        cv_analysis: Dict[str, Any],
+        job_id: str,
+        job_description: str,
+        job_title: str,
+        company: str,
+        start: bool,
+        slot: str
+    ):
+        """
+        Score one job in the background and display the result.
+        
+        The task is remembered under slot in the session state, so its result
+        stays on screen (and a rerun while scoring keeps waiting) until another
+        job is selected.
+        
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+            job_id: Canonical job ID
+            job_description: The job description text
+            job_title: The job title
+            company: The company name
+            start: Whether to start scoring (the button was clicked)
+            slot: Session state key remembering the task
+        """
+        key = ("match_score", cv_fingerprint(cv_analysis), job_id, content_hash(job_description))
+        if start:
+            st.session_state[slot] = key
+            # Calculate compatibility score (or load it from the score store)
+            submit_task(key, lambda task: self._score_job(cv_analysis, job_id, job_description, job_title))
+        if st.session_state.get(slot) != key:
+            return
+        task = get_task(key)
+        if task is None:
+            return
+        
+        wait_for_task(task, "Calculating job compatibility score...")
+        if task.state == DONE:
+            outcome = task.result
+            if outcome["stored"]:
+                st.caption("Showing the saved score for this CV and job.")
+            if outcome["error"]:
+                st.warning(f"Detailed scoring is unavailable ({outcome['error']}); showing the local estimate instead.")
+            
+            # Display results
+            self._display_compatibility_results(outcome["results"], job_title or "Selected Job", company)
+        elif task.state == FAILED:
+            st.error(f"Error calculating compatibility score: {task.error}")
+        else:
+            st.info("Scoring cancelled.")
+    
+    def _score_job(self, cv_analysis: Dict[str, Any], job_id: str, job_description: str, job_title: str = "") -> Dict[str, Any]:
+        """
+        Score a job, reusing a stored score for the same CV, job, description, model and prompt.
+        
+        Falls back to the local scorer if the LLM is unavailable or returns an unusable answer.
+        Runs as a background task, so it reports what happened instead of writing to the page.
+        
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+            job_id: Canonical job ID
+            job_description: The job description text
+            job_title: The job title (used by the local fallback)
+            
+        Returns:
+            Dictionary with 'results' (compatibility scores and recommendations),
+            'stored' (whether they are a saved score) and 'error' (why the local
+            estimate was used instead, if it was)
+        """
+        key = self.advanced_features.match_score_key(cv_analysis, job_id, job_description)
+        compatibility_results = self.score_store.get(key)
+        if compatibility_results is not None:
+            return {"results": compatibility_results, "stored": True, "error": None}
+        
+        try:
+            compatibility_results = self.advanced_features.calculate_job_match_score(cv_analysis, job_description)
+        except Exception as e:
+            compatibility_results = {"error": str(e)}
+        
+        if "error" in compatibility_results:
+            # Degraded mode: answer locally, but don't persist it so the LLM score is retried next time
+            return {
+                "results": self.local_scorer.score(cv_analysis, job_description, job_title),
+                "stored": False,
+                "error": compatibility_results["error"],
+            }
+        
+        self.score_store.put(key, compatibility_results)
+        return {"results": compatibility_results, "stored": False, "error": None}
     
     def _display_compatibility_results(self, compatibility_results: Dict[str, Any], job_title: str, company: str = ""):
         """
@@ -139,44 +399,26 @@ class JobCompatibilityComponent:
                 st.text_area("Raw Response", compatibility_results["raw_content"], height=300)
             return
         
-        # Display overall score
-        overall_score = compatibility_results.get("overall_score", 0)
-        if isinstance(overall_score, str) and "%" in overall_score:
-            try:
-                overall_score = int(overall_score.rstrip("%"))
-            except ValueError:
-                overall_score = 0
+        if compatibility_results.get("source") == "local":
+            st.caption("Estimated locally from skill overlap, years of experience and education level.")
         
+        # Display overall score
+        overall_score = parse_score(compatibility_results.get("overall_score"))
         st.metric("Overall Match Score", f"{overall_score}%")
         
         # Create columns for detailed scores
         col1, col2, col3 = st.columns(3)
         
         with col1:
-            skills_score = compatibility_results.get("skills_match", {}).get("score", 0)
-            if isinstance(skills_score, str) and "%" in skills_score:
-                try:
-                    skills_score = int(skills_score.rstrip("%"))
-                except ValueError:
-                    skills_score = 0
+            skills_score = parse_score(compatibility_results.get("skills_match"))
             st.metric("Skills Match", f"{skills_score}%")
             
         with col2:
-            experience_score = compatibility_results.get("experience_match", {}).get("score", 0)
-            if isinstance(experience_score, str) and "%" in experience_score:
-                try:
-                    experience_score = int(experience_score.rstrip("%"))
-                except ValueError:
-                    experience_score = 0
+            experience_score = parse_score(compatibility_results.get("experience_match"))
             st.metric("Experience Match", f"{experience_score}%")
             
         with col3:
-            education_score = compatibility_results.get("education_match", {}).get("score", 0)
-            if isinstance(education_score, str) and "%" in education_score:
-                try:
-                    education_score = int(education_score.rstrip("%"))
-                except ValueError:
-                    education_score = 0
+            education_score = parse_score(compatibility_results.get("education_match"))
             st.metric("Education Match", f"{education_score}%")
         
         # Display missing skills
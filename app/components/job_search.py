@@ -1,8 +1,7 @@
 import streamlit as st
-import pandas as pd
 import os
 import sys
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, TYPE_CHECKING
 
 # Add the project root directory to Python path if not already there
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -10,21 +9,36 @@ project_root = os.path.dirname(os.path.dirname(current_dir))
 if project_root not in sys.path:
     sys.path.insert(0, project_root)
 
-from app.utils import LinkedInJobSearch, OpenRouterClient, MockLinkedInJobSearch
+from app.utils import MockLinkedInJobSearch
 from app.utils.config import USE_MOCK_JOB_SEARCH
+from app.utils.resources import get_resource
+from app.utils.query_planner import QueryPlanner
+from app.utils.fingerprint import cv_fingerprint
+from app.utils.tasks import DONE, FAILED
+from app.utils.prefetch import queries_task_key, search_task_key, generate_queries, search_jobs
+from app.components.background import session_id, submit_task, get_task, discard_task, wait_for_task
+from app.components.session_data import store_value, load_value, derived_value
+
+# pandas is imported when results are displayed, keeping the first page load light
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Choices of job listings shown per page
+RESULTS_PAGE_SIZES = [25, 50, 100]
 
 class JobSearchComponent:
     """Streamlit component for job search."""
     
     def __init__(self):
         # Use mock implementation if configured or as a fallback
+        # Shared searcher, client and crawler come from the process-wide resource registry
+        self.job_searcher = get_resource("job_searcher")
         if USE_MOCK_JOB_SEARCH:
-            self.job_searcher = MockLinkedInJobSearch()
             st.info("Using mock job search implementation for demonstration purposes.")
-        else:
-            self.job_searcher = LinkedInJobSearch()
         
-        self.llm_client = OpenRouterClient()
+        self.llm_client = get_resource("llm_client")
+        self.crawler = get_resource("crawler")
+        self.query_planner = QueryPlanner(self.crawler.store)
         
     def render(self, cv_analysis: Optional[Dict[str, Any]] = None):
         """
@@ -32,22 +46,29 @@ class JobSearchComponent:
         
         Args:
             cv_analysis: Dictionary with CV analysis results
+            
+        Returns:
+            DataFrame with the current job search results, if any
         """
         st.header("Job Search")
         
         if cv_analysis is None:
             st.info("Please analyze your CV first to get job recommendations.")
-            return
+            return None
         
-        # Generate search queries if not already done
-        if "search_queries" not in st.session_state:
-            with st.spinner("Generating job search queries..."):
-                try:
-                    search_queries = self.llm_client.generate_job_search_queries(cv_analysis)
-                    st.session_state["search_queries"] = search_queries
-                except Exception as e:
-                    st.error(f"Error generating search queries: {e}")
-                    st.session_state["search_queries"] = []
+        # Generate search queries for this CV if not already done; usually the prefetcher
+        # started the task when the CV was analyzed, so this only picks up its result
+        cv_hash = cv_fingerprint(cv_analysis)
+        if "search_queries" not in st.session_state or st.session_state.get("search_queries_cv") != cv_hash:
+            task = submit_task(queries_task_key(cv_analysis), generate_queries, self.llm_client, cv_analysis)
+            wait_for_task(task, "Generating job search queries...")
+            if task.state == DONE:
+                st.session_state["search_queries"] = task.result
+            else:
+                if task.state == FAILED:
+                    st.error(f"Error generating search queries: {task.error}")
+                st.session_state["search_queries"] = []
+            st.session_state["search_queries_cv"] = cv_hash
         
         search_queries = st.session_state.get("search_queries", [])
         
@@ -91,58 +112,172 @@ class JobSearchComponent:
         # Add option to use mock implementation
         use_mock = st.checkbox("Use mock data (for testing)", value=USE_MOCK_JOB_SEARCH)
         if use_mock and not isinstance(self.job_searcher, MockLinkedInJobSearch):
-            self.job_searcher = MockLinkedInJobSearch()
+            self.job_searcher = get_resource("mock_job_searcher")
             st.info("Switched to mock job search implementation.")
         elif not use_mock and isinstance(self.job_searcher, MockLinkedInJobSearch):
-            self.job_searcher = LinkedInJobSearch()
+            self.job_searcher = get_resource("linkedin_job_searcher")
             st.info("Switched to real LinkedIn job search implementation.")
             
-        # Search button
-        search_button = st.button("Search Jobs")
+        # Search and save buttons
+        col1, col2 = st.columns(2)
+        with col1:
+            search_button = st.button("Search Jobs")
+        with col2:
+            save_button = st.button("Save Queries for Background Refresh")
+            
+        if save_button and search_queries:
+            for query in search_queries:
+                self.crawler.store.add_saved_search(session_id(), query, location, results_per_query)
+            self.crawler.trigger(session_id())
+            st.success(f"Saved {len(search_queries)} queries. Results will be refreshed in the background.")
         
         if search_button and search_queries:
-            with st.spinner("Searching for jobs... This may take a moment."):
-                try:
-                    # Perform job search
-                    job_results = self.job_searcher.search_multiple_queries(
-                        search_queries, 
-                        location, 
-                        results_per_query
-                    )
-                    
-                    # Store results in session state
-                    st.session_state["job_results"] = job_results
-                    
-                    # Display results
-                    self._display_job_results(job_results)
-                except Exception as e:
-                    st.error(f"Error searching for jobs: {e}")
-                    
-                    # Fallback to mock implementation if real search fails
-                    if not isinstance(self.job_searcher, MockLinkedInJobSearch):
-                        st.warning("Falling back to mock job search implementation.")
-                        self.job_searcher = MockLinkedInJobSearch()
-                        
-                        try:
-                            # Try with mock implementation
-                            job_results = self.job_searcher.search_multiple_queries(
-                                search_queries, 
-                                location, 
-                                results_per_query
-                            )
-                            
-                            # Store results in session state
-                            st.session_state["job_results"] = job_results
-                            
-                            # Display results
-                            self._display_job_results(job_results)
-                        except Exception as e2:
-                            st.error(f"Error with mock job search: {e2}")
-        elif "job_results" in st.session_state:
+            # Skip queries that are near-duplicates of, or historically subsumed by, another query
+            planned_queries, merged_queries = self.query_planner.plan(search_queries, location)
+            if merged_queries:
+                st.caption(
+                    f"Running {len(planned_queries)} of {len(search_queries)} queries; merged: "
+                    + "; ".join(f"'{query}' into '{covering}'" for query, covering in merged_queries.items())
+                )
+                
+            self._submit_search(planned_queries, location, results_per_query)
+        
+        job_results = load_value("job_results")
+        if st.session_state.get("job_search_task") is not None:
+            self._render_search_task()
+        elif job_results is not None:
             # Display previously found results
-            self._display_job_results(st.session_state["job_results"])
+            self._display_job_results(job_results)
+        else:
+            self._render_prefetched_search(cv_analysis)
+            
+        # Shared search cache statistics (only the real LinkedIn searcher is cached)
+        cache = getattr(self.job_searcher, "cache", None)
+        if cache is not None:
+            metrics = cache.metrics()
+            lookups = metrics["hits"] + metrics["stale_hits"] + metrics["misses"]
+            if lookups:
+                st.caption(
+                    f"Search cache: {metrics['hit_rate']:.0%} hit rate over {lookups} searches, "
+                    f"{metrics['entries']} cached queries"
+                )
+            
+        self._render_saved_searches()
+        
+        return load_value("job_results")
+        
+    def _submit_search(self, queries: List[str], location: str, results_per_query: int):
+        """Start searching in the background; the search is remembered so later reruns keep waiting for it."""
+        key = search_task_key(queries, location, results_per_query, isinstance(self.job_searcher, MockLinkedInJobSearch))
+        st.session_state["job_search_task"] = key
+        submit_task(key, search_jobs, self.job_searcher, queries, location, results_per_query)
+    
+    def _render_prefetched_search(self, cv_analysis: Dict[str, Any]):
+        """Show the results of the search started in the background when the CV was analyzed, if any."""
+        task = get_resource("prefetcher").prefetched_search(session_id(), cv_analysis)
+        if task is None:
+            return
+        
+        wait_for_task(task, "Searching the suggested queries...")
+        if task.state != DONE:
+            return
+        
+        job_results = task.result
+        # The session keeps the results (offloaded if large), so the task's copy is dropped
+        store_value("job_results", job_results)
+        discard_task(task.key)
+        st.caption(
+            f"Showing results for the first {len(task.key[1])} suggested queries, found in the background. "
+            "Click Search Jobs to search every query."
+        )
+        self._display_job_results(job_results)
+    
+    def _render_search_task(self):
+        """Wait for the background search, then store and display its results."""
+        key = st.session_state["job_search_task"]
+        task = get_task(key)
+        if task is None:
+            st.session_state.pop("job_search_task", None)
+            return
+        
+        wait_for_task(task, "Searching for jobs... This may take a moment.")
+        st.session_state.pop("job_search_task", None)
+        
+        if task.state == DONE:
+            job_results = task.result
+            
+            # Store results in session state (offloaded if large) and drop the task's copy
+            store_value("job_results", job_results)
+            discard_task(key)
+            
+            # Throttled queries are reported separately so they are not mistaken for "no jobs"
+            throttled_queries = job_results.attrs.get("throttled_queries", [])
+            if throttled_queries:
+                st.warning(
+                    "LinkedIn is rate limiting requests; these queries were skipped and can be retried "
+                    f"shortly: {', '.join(throttled_queries)}"
+                )
+            
+            # Display results
+            self._display_job_results(job_results)
+        elif task.state == FAILED:
+            _, queries, location, results_per_query, used_mock = key
+            if used_mock:
+                st.error(f"Error with mock job search: {task.error}")
+                return
+            st.error(f"Error searching for jobs: {task.error}")
+            
+            # Fallback to mock implementation if real search fails
+            st.warning("Falling back to mock job search implementation.")
+            self.job_searcher = get_resource("mock_job_searcher")
+            self._submit_search(list(queries), location, results_per_query)
+            self._render_search_task()
+        else:
+            st.info("Job search cancelled.")
+    
+    def _render_saved_searches(self):
+        """Display saved searches and the results precomputed by the background crawler."""
+        saved_searches = self.crawler.store.list_saved_searches(session_id())
+        if not saved_searches:
+            return
+            
+        import pandas as pd
+
+        st.subheader("Saved Searches")
+        
+        for search in saved_searches:
+            col1, col2 = st.columns([3, 1])
+            with col1:
+                location = f" in {search['location']}" if search["location"] else ""
+                last_run = pd.to_datetime(search["last_run_at"], unit="s") if search["last_run_at"] else None
+                status = f"last refreshed {last_run:%Y-%m-%d %H:%M} UTC" if last_run is not None else "pending first refresh"
+                st.write(f"**{search['query']}**{location} ({status})")
+            with col2:
+                if st.button("Remove", key=f"remove_saved_search_{search['id']}"):
+                    self.crawler.store.remove_saved_search(session_id(), search["id"])
+                    st.rerun()
+                    
+        if st.button("Refresh Saved Searches Now"):
+            self.crawler.trigger(session_id())
+            st.info("Saved searches will be refreshed in the background.")
+            
+        saved_results = self.crawler.store.get_results(session_id())
+        if not saved_results:
+            return
             
-    def _display_job_results(self, job_results: pd.DataFrame):
+        results_df = pd.DataFrame(saved_results)
+        new_count = int(results_df["is_new"].sum())
+        if new_count:
+            st.success(f"{new_count} new job postings since the previous refresh.")
+        results_df.insert(0, "new", results_df["is_new"].map({True: "🆕", False: ""}))
+        st.dataframe(
+            results_df[["new", "title", "company", "location", "query", "url"]],
+            column_config={"url": st.column_config.LinkColumn("Link")},
+            hide_index=True,
+            use_container_width=True
+        )
+            
+    def _display_job_results(self, job_results: "pd.DataFrame"):
         """
         Display job search results.
         
@@ -158,56 +293,62 @@ class JobSearchComponent:
         # Display number of results
         st.write(f"Found {len(job_results)} job listings.")
         
-        # Add a filter for job titles
-        all_titles = job_results["title"].unique().tolist()
+        # The filter index is built once per result set and kept across reruns (and
+        # shared by sessions with the same results); like pandas, its numpy import waits until now
+        from app.utils.job_index import JobResultsIndex
+        index = derived_value("job_results", "filter_index", JobResultsIndex)
+        if index is None:
+            index = JobResultsIndex(job_results)
+        
+        # Add filters for job titles, companies and locations
         selected_titles = st.multiselect(
             "Filter by job title",
-            options=all_titles,
+            options=index.options("title"),
             default=[]
         )
-        
-        # Add a filter for companies
-        all_companies = job_results["company"].unique().tolist()
         selected_companies = st.multiselect(
             "Filter by company",
-            options=all_companies,
+            options=index.options("company"),
             default=[]
         )
-        
-        # Add a filter for locations
-        all_locations = job_results["location"].unique().tolist()
         selected_locations = st.multiselect(
             "Filter by location",
-            options=all_locations,
+            options=index.options("location"),
             default=[]
         )
         
         # Apply filters
-        filtered_results = job_results.copy()
-        if selected_titles:
-            filtered_results = filtered_results[filtered_results["title"].isin(selected_titles)]
-        if selected_companies:
-            filtered_results = filtered_results[filtered_results["company"].isin(selected_companies)]
-        if selected_locations:
-            filtered_results = filtered_results[filtered_results["location"].isin(selected_locations)]
+        rows = index.filter({
+            "title": selected_titles,
+            "company": selected_companies,
+            "location": selected_locations,
+        })
             
         # Display filtered results
-        if filtered_results.empty:
+        if len(rows) == 0:
             st.warning("No job listings match the selected filters.")
             return
             
-        # Display job listings
-        for _, job in filtered_results.iterrows():
-            with st.container():
-                col1, col2 = st.columns([3, 1])
-                
-                with col1:
-                    st.markdown(f"### [{job['title']}]({job['url']})")
-                    st.write(f"**Company:** {job['company']}")
-                    st.write(f"**Location:** {job['location']}")
-                    st.write(f"**Search Query:** {job['query']}")
-                    
-                with col2:
-                    st.markdown(f"[Apply on LinkedIn]({job['url']})")
-                    
-                st.divider()
\ No newline at end of file
+        # Display one page of job listings as a single table
+        col1, col2 = st.columns(2)
+        with col1:
+            page_size = st.selectbox("Listings per page", RESULTS_PAGE_SIZES)
+        page_count = (len(rows) + page_size - 1) // page_size
+        with col2:
+            # The widget resets to the first page whenever the number of pages changes
+            page = st.number_input("Page", min_value=1, max_value=page_count, value=1) if page_count > 1 else 1
+        
+        first = (page - 1) * page_size
+        st.caption(f"Showing listings {first + 1}-{min(first + page_size, len(rows))} of {len(rows)}")
+        st.dataframe(
+            index.page(rows, page - 1, page_size)[["title", "company", "location", "query", "url"]],
+            column_config={
+                "title": "Title",
+                "company": "Company",
+                "location": "Location",
+                "query": "Search Query",
+                "url": st.column_config.LinkColumn("Apply on LinkedIn"),
+            },
+            hide_index=True,
+            use_container_width=True
+        )
\ No newline at end of file
@@ -0,0 +1,48 @@
+import streamlit as st
+from typing import Any, Callable
+from app.utils.resources import get_resource
+from app.utils.session_store import SpilledValue
+
+
+def store_value(key: str, value: Any):
+    """Keep a value in the session, or just a handle to it if it is large (the value goes to the shared session store)."""
+    st.session_state[key] = get_resource("session_store").offload(value) if value is not None else None
+
+
+def load_value(key: str, default: Any = None) -> Any:
+    """Return a value kept with store_value(), or default if it is missing or expired."""
+    value = st.session_state.get(key, default)
+    if not isinstance(value, SpilledValue):
+        return value
+    loaded = get_resource("session_store").load(value)
+    if loaded is None:
+        del st.session_state[key]
+        return default
+    return loaded
+
+
+def derived_value(key: str, name: str, factory: Callable[[Any], Any]) -> Any:
+    """
+    Return an object computed from a value kept with store_value(), e.g. an index over it.
+
+    It is computed once per value: large values share it with every session
+    holding the same value, small ones keep it in the session next to the value.
+
+    Args:
+        key: Session key of the value
+        name: Name of the derived object
+        factory: Called with the value to compute the object
+
+    Returns:
+        The derived object, or None if the value is missing or expired
+    """
+    value = st.session_state.get(key)
+    if isinstance(value, SpilledValue):
+        return get_resource("session_store").derived(value, name, factory)
+    if value is None:
+        return None
+    cache_key = f"{key}_{name}"
+    cached = st.session_state.get(cache_key)
+    if cached is None or cached[0] is not value:
+        cached = st.session_state[cache_key] = (value, factory(value))
+    return cached[1]
@@ -15,6 +15,10 @@ from app.components import (
     CVOptimizerComponent,
     JobCompatibilityComponent
 )
+from app.components.background import session_id
+from app.components.session_data import load_value
+from app.utils.admission import set_tenant
+from app.utils.config import init_app
 
 def main():
     # Set page configuration
@@ -25,11 +29,11 @@ def main():
         initial_sidebar_state="expanded"
     )
     
-    # Initialize session state variables if they don't exist
-    if "cv_analysis" not in st.session_state:
-        st.session_state.cv_analysis = None
-    if "job_search_results" not in st.session_state:
-        st.session_state.job_search_results = None
+    # Validate the configuration and create the data folder (kept out of module imports)
+    init_app()
+    
+    # LLM requests made while rendering count against this session's admission budget
+    set_tenant(session_id())
     
     # Custom CSS
     st.markdown("""
@@ -118,10 +122,8 @@ def main():
     with tab1:
         analysis_complete, cv_analysis, cv_path = cv_analyzer.render()
         
-        # Store analysis results in session state
+        # The analyzer keeps the analysis in session state itself
         if analysis_complete and cv_analysis:
-            st.session_state.cv_analysis = cv_analysis
-            st.session_state.cv_path = cv_path
             st.success("CV analysis complete! You can now proceed to other tabs.")
             
             # Add a button to navigate to job search tab
@@ -140,14 +142,13 @@ def main():
     # Job Search tab
     with tab2:
         # Get analysis results from session state
-        cv_analysis = st.session_state.get("cv_analysis", None)
+        cv_analysis = load_value("cv_analysis")
         
         # Render job search component
         job_search_results = job_search.render(cv_analysis)
         
-        # Store job search results in session state
+        # The job search keeps its results in session state itself
         if job_search_results is not None:
-            st.session_state.job_search_results = job_search_results
             st.success("Job search complete! You can now optimize your CV or calculate job compatibility.")
             
             # Add buttons to navigate to other tabs
@@ -180,7 +181,7 @@ def main():
     # CV Optimization tab
     with tab3:
         # Get analysis results from session state
-        cv_analysis = st.session_state.get("cv_analysis", None)
+        cv_analysis = load_value("cv_analysis")
         
         # Render CV optimizer component
         cv_optimizer.render(cv_analysis)
@@ -188,8 +189,8 @@ def main():
     # Job Compatibility tab
     with tab4:
         # Get analysis results and job results from session state
-        cv_analysis = st.session_state.get("cv_analysis", None)
-        job_search_results = st.session_state.get("job_search_results", None)
+        cv_analysis = load_value("cv_analysis")
+        job_search_results = load_value("job_results")
         
         # Render job compatibility component
         job_compatibility.render(cv_analysis, job_search_results)
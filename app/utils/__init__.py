@@ -1,13 +1,55 @@
 """Utilities for the CV-Based Job Finder application."""
 
-from .cv_parser import CVParser
-from .llm import OpenRouterClient
-from .job_search import LinkedInJobSearch
-from .mock_job_search import MockLinkedInJobSearch
+import importlib
+from typing import TYPE_CHECKING
+
+# Public names and the modules defining them. They are imported on first
+# access (PEP 562), so "from app.utils import CVAnalysis" doesn't load the
+# LinkedIn scraper, the PDF reader or the HTTP client.
+_EXPORTS = {
+    "CVParser": ".cv_parser",
+    "OpenRouterClient": ".llm",
+    "LinkedInJobSearch": ".job_search",
+    "MockLinkedInJobSearch": ".mock_job_search",
+    "SyntheticJobGenerator": ".synthetic_jobs",
+    "AdvancedFeatures": ".advanced_features",
+    "CVAnalysis": ".cv_model",
+    "ResourceRegistry": ".resources",
+    "get_resource": ".resources",
+}
+
+if TYPE_CHECKING:
+    from .cv_parser import CVParser
+    from .llm import OpenRouterClient
+    from .job_search import LinkedInJobSearch
+    from .mock_job_search import MockLinkedInJobSearch
+    from .synthetic_jobs import SyntheticJobGenerator
+    from .advanced_features import AdvancedFeatures
+    from .cv_model import CVAnalysis
+    from .resources import ResourceRegistry, get_resource
 
 __all__ = [
     "CVParser",
     "OpenRouterClient",
     "LinkedInJobSearch",
-    "MockLinkedInJobSearch"
-]
\ No newline at end of file
+    "MockLinkedInJobSearch",
+    "SyntheticJobGenerator",
+    "AdvancedFeatures",
+    "CVAnalysis",
+    "ResourceRegistry",
+    "get_resource"
+]
+
+
+def __getattr__(name: str):
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    # Cache it so later lookups don't go through __getattr__
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
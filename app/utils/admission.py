@@ -0,0 +1,283 @@
+import contextvars
+import heapq
+import itertools
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+from typing import Dict, Any, Callable, Iterator, List, Optional, Tuple
+from .config import LLM_CONCURRENCY, TENANT_LLM_RATE, TENANT_LLM_BURST, ADMISSION_MAX_WAIT
+
+# Workloads competing for LLM capacity: someone waits on interactive requests
+# (CV analysis, query generation, single scores, optimization), not on batch scoring
+INTERACTIVE = "interactive"
+BATCH = "batch"
+
+# Share of the LLM capacity each workload gets while several are queued
+WORKLOAD_WEIGHTS = {INTERACTIVE: 4.0, BATCH: 1.0}
+
+# Tenant of work done outside any session or API request
+DEFAULT_TENANT = "anonymous"
+
+# Tenants whose rate state is remembered
+_MAX_TENANTS = 10_000
+
+# Recent wait times kept per workload for the percentiles in metrics()
+_WAIT_SAMPLES = 1000
+
+_tenant: contextvars.ContextVar[str] = contextvars.ContextVar("admission_tenant", default=DEFAULT_TENANT)
+_workload: contextvars.ContextVar[str] = contextvars.ContextVar("admission_workload", default=INTERACTIVE)
+
+
+class AdmissionRejected(Exception):
+    """Raised when an LLM request can't be admitted within the maximum wait."""
+
+    def __init__(self, tenant: str, workload: str, reason: str, retry_after: float):
+        self.tenant = tenant
+        self.workload = workload
+        self.reason = reason
+        self.retry_after = retry_after
+        super().__init__(f"Too many {workload} requests ({reason}), retry after {retry_after:.0f}s")
+
+
+def current_scope() -> Tuple[str, str]:
+    """Return the (tenant, workload) the current code runs on behalf of."""
+    return _tenant.get(), _workload.get()
+
+
+def set_tenant(tenant: str):
+    """Attribute the rest of the current context (e.g. a Streamlit script run) to a tenant."""
+    _tenant.set(tenant)
+
+
+@contextmanager
+def admission_scope(tenant: Optional[str] = None, workload: Optional[str] = None) -> Iterator[None]:
+    """Attribute the LLM requests made inside the block to a tenant and/or workload."""
+    tokens = []
+    if tenant is not None:
+        tokens.append((_tenant, _tenant.set(tenant)))
+    if workload is not None:
+        tokens.append((_workload, _workload.set(workload)))
+    try:
+        yield
+    finally:
+        for var, token in reversed(tokens):
+            var.reset(token)
+
+
+def bind_scope(fn: Callable[..., Any], workload: Optional[str] = None) -> Callable[..., Any]:
+    """
+    Wrap fn to run in the caller's admission scope from any thread.
+
+    Context variables don't follow work handed to a thread pool, so functions
+    submitted to one are bound first.
+
+    Args:
+        fn: Function to wrap
+        workload: Workload overriding the caller's
+    """
+    tenant, current_workload = current_scope()
+    workload = workload or current_workload
+
+    def run(*args, **kwargs):
+        with admission_scope(tenant, workload):
+            return fn(*args, **kwargs)
+    return run
+
+
+class _TenantState:
+    """Token bucket and fair-queuing finish tags of one tenant."""
+
+    __slots__ = ("tokens", "updated", "finish")
+
+    def __init__(self, tokens: float, updated: float):
+        self.tokens = tokens
+        self.updated = updated
+        self.finish: Dict[str, float] = {}
+
+
+class _Waiter:
+    __slots__ = ("workload", "start", "event", "granted", "abandoned")
+
+    def __init__(self, workload: str, start: float):
+        self.workload = workload
+        self.start = start
+        self.event = threading.Event()
+        self.granted = False
+        self.abandoned = False
+
+
+class AdmissionController:
+    """
+    Fair-share admission of LLM requests across tenants (sessions or API keys) and workloads.
+
+    Each tenant draws from a token bucket, so a burst is served right away but a
+    sustained flood is paced (and rejected once the wait would exceed max_wait).
+    At most max_concurrency requests run at once; when they are all taken,
+    requests queue and are admitted by start-time fair queuing over (tenant,
+    workload) flows: every flow gets its weighted share, so one tenant's batch
+    scoring can't delay another tenant's analysis, and interactive requests go
+    ahead of batch ones.
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = LLM_CONCURRENCY,
+        tenant_rate: float = TENANT_LLM_RATE,
+        tenant_burst: float = TENANT_LLM_BURST,
+        max_wait: float = ADMISSION_MAX_WAIT,
+        weights: Optional[Dict[str, float]] = None,
+    ):
+        """
+        Initialize the controller.
+
+        Args:
+            max_concurrency: Maximum LLM requests in flight across all tenants
+            tenant_rate: Sustained LLM requests per second per tenant (0 disables the limit)
+            tenant_burst: Requests a tenant may make at once before being paced
+            max_wait: Seconds a request may wait for admission before it is rejected
+            weights: Share of each workload (default WORKLOAD_WEIGHTS)
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.tenant_rate = tenant_rate
+        self.tenant_burst = max(1.0, tenant_burst)
+        self.max_wait = max_wait
+        self.weights = dict(weights or WORKLOAD_WEIGHTS)
+        self._tenants: "OrderedDict[str, _TenantState]" = OrderedDict()
+        self._queue: List[Tuple[float, int, _Waiter]] = []
+        self._sequence = itertools.count()
+        self._virtual_time = 0.0
+        self._in_flight = 0
+        self._queued: Dict[str, int] = {}
+        self._max_queued = 0
+        self._admitted: Dict[str, int] = {}
+        self._rejected: Dict[str, int] = {}
+        self._waits: Dict[str, deque] = {}
+        self._lock = threading.Lock()
+
+    def _tenant(self, tenant: str, now: float) -> _TenantState:
+        """Return a tenant's state with its bucket refilled; the caller holds the lock."""
+        state = self._tenants.get(tenant)
+        if state is None:
+            state = self._tenants[tenant] = _TenantState(self.tenant_burst, now)
+            if len(self._tenants) > _MAX_TENANTS:
+                self._tenants.popitem(last=False)
+        self._tenants.move_to_end(tenant)
+        state.tokens = min(self.tenant_burst, state.tokens + (now - state.updated) * self.tenant_rate)
+        state.updated = now
+        return state
+
+    def _reject(self, tenant: str, workload: str, reason: str, retry_after: float) -> AdmissionRejected:
+        """Count a rejection and build its exception; the caller holds the lock."""
+        self._rejected[workload] = self._rejected.get(workload, 0) + 1
+        return AdmissionRejected(tenant, workload, reason, retry_after)
+
+    def _record_wait(self, workload: str, waited: float):
+        """Count an admission; the caller holds the lock."""
+        self._admitted[workload] = self._admitted.get(workload, 0) + 1
+        self._waits.setdefault(workload, deque(maxlen=_WAIT_SAMPLES)).append(waited)
+
+    def acquire(self, tenant: Optional[str] = None, workload: Optional[str] = None):
+        """
+        Block until an LLM request may be sent; release() must follow.
+
+        Args:
+            tenant: Tenant making the request (default: the current scope's)
+            workload: Workload of the request (default: the current scope's)
+
+        Raises:
+            AdmissionRejected: If the tenant's rate or the queue would make the request wait longer than max_wait
+        """
+        scope_tenant, scope_workload = current_scope()
+        tenant = tenant or scope_tenant
+        workload = workload or scope_workload
+        arrived = time.monotonic()
+
+        # Reserve a token; the bucket may go negative, which spaces the tenant's requests out
+        if self.tenant_rate > 0:
+            with self._lock:
+                state = self._tenant(tenant, arrived)
+                delay = (1.0 - state.tokens) / self.tenant_rate if state.tokens < 1.0 else 0.0
+                if delay > self.max_wait:
+                    raise self._reject(tenant, workload, "rate limit", delay)
+                state.tokens -= 1.0
+            if delay > 0:
+                time.sleep(delay)
+
+        with self._lock:
+            now = time.monotonic()
+            state = self._tenant(tenant, now)
+            start = max(self._virtual_time, state.finish.get(workload, 0.0))
+            state.finish[workload] = start + 1.0 / self.weights.get(workload, 1.0)
+            # Slots are handed straight to queued requests, so a free slot means nobody is queued
+            if self._in_flight < self.max_concurrency:
+                self._in_flight += 1
+                self._virtual_time = start
+                self._record_wait(workload, now - arrived)
+                return
+            waiter = _Waiter(workload, start)
+            heapq.heappush(self._queue, (state.finish[workload], next(self._sequence), waiter))
+            self._queued[workload] = self._queued.get(workload, 0) + 1
+            self._max_queued = max(self._max_queued, len(self._queue))
+
+        remaining = self.max_wait - (time.monotonic() - arrived)
+        if not waiter.event.wait(max(0.0, remaining)):
+            with self._lock:
+                if not waiter.granted:
+                    waiter.abandoned = True
+                    self._queued[workload] -= 1
+                    raise self._reject(tenant, workload, "queue full", self.max_wait)
+        with self._lock:
+            self._record_wait(workload, time.monotonic() - arrived)
+
+    def release(self):
+        """Finish a request, handing its slot to the queued request with the earliest finish tag."""
+        with self._lock:
+            while self._queue:
+                _, _, waiter = heapq.heappop(self._queue)
+                if waiter.abandoned:
+                    continue
+                waiter.granted = True
+                self._queued[waiter.workload] -= 1
+                self._virtual_time = waiter.start
+                waiter.event.set()
+                return
+            self._in_flight -= 1
+
+    @contextmanager
+    def admit(self, tenant: Optional[str] = None, workload: Optional[str] = None) -> Iterator[None]:
+        """Hold an admission for the duration of the block."""
+        self.acquire(tenant, workload)
+        try:
+            yield
+        finally:
+            self.release()
+
+    def metrics(self) -> Dict[str, Any]:
+        """
+        Return the controller's load.
+
+        Returns:
+            Dictionary with 'in_flight', 'capacity', 'queued' (total and per
+            workload), 'max_queued', 'tenants', and per workload 'admitted',
+            'rejected' and recent 'wait_p50'/'wait_p95' seconds
+        """
+        with self._lock:
+            waits = {}
+            for workload, samples in self._waits.items():
+                ordered = sorted(samples)
+                waits[workload] = {
+                    "wait_p50": ordered[len(ordered) // 2],
+                    "wait_p95": ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))],
+                }
+            return {
+                "in_flight": self._in_flight,
+                "capacity": self.max_concurrency,
+                "queued": sum(self._queued.values()),
+                "queued_by_workload": dict(self._queued),
+                "max_queued": self._max_queued,
+                "tenants": len(self._tenants),
+                "admitted": dict(self._admitted),
+                "rejected": dict(self._rejected),
+                "waits": waits,
+            }
@@ -1,13 +1,27 @@
 import json
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List, Tuple
+from .admission import bind_scope
+from .config import OPTIMIZATION_CONCURRENCY
 from .llm import OpenRouterClient
+from .skills import get_skill_ontology, flatten_skills
+from .fingerprint import cv_fingerprint, content_hash, canonical_json
+from .score_store import ScoreKey
+from .titles import TitleIndex, canonical_title
 
 class AdvancedFeatures:
     """Advanced AI-powered features for the CV-Based Job Finder application."""
     
-    def __init__(self, llm_client=None):
+    # Bump whenever the job match prompt changes so stored scores are invalidated
+    MATCH_PROMPT_VERSION = "2"
+    
+    # Bump whenever the CV optimization prompt changes so stored optimizations are invalidated
+    OPTIMIZE_PROMPT_VERSION = "2"
+    
+    def __init__(self, llm_client=None, skill_ontology=None):
         """Initialize the advanced features with an LLM client."""
         self.llm_client = llm_client or OpenRouterClient()
+        self.skill_ontology = skill_ontology or get_skill_ontology()
     
     def optimize_cv(self, cv_analysis: Dict[str, Any], target_job_title: str) -> Dict[str, Any]:
         """
@@ -20,10 +34,7 @@ class AdvancedFeatures:
         Returns:
             Dictionary with optimization recommendations
         """
-        prompt = [
-            {"role": "system", "content": "You are an expert CV optimization assistant. Your task is to provide specific, actionable recommendations to optimize a CV for a target job."},
-            {"role": "user", "content": f"Based on this CV analysis and target job '{target_job_title}', provide specific recommendations to optimize the CV. Include what skills to add, what experiences to emphasize, and what to remove or de-emphasize. Format your response as JSON with the following keys: 'skills_to_add', 'skills_to_emphasize', 'experiences_to_emphasize', 'items_to_remove', and 'general_recommendations'.\n\nCV Analysis: {json.dumps(cv_analysis, indent=2)}"}
-        ]
+        prompt = self._optimization_prompt(cv_analysis, target_job_title)
         
         response = self.llm_client.chat_completion(prompt, temperature=0.3)
         content = self.llm_client.extract_content(response)
@@ -46,6 +57,133 @@ class AdvancedFeatures:
                 "raw_content": content
             }
     
+    def _optimization_prompt(self, cv_analysis: Dict[str, Any], target_job_title: str) -> List[Dict[str, str]]:
+        """
+        Build the CV optimization prompt.
+        
+        Everything up to and including the CV analysis is identical for every target title
+        of a CV, so providers that cache prompt prefixes can reuse it; only the title varies.
+        """
+        return [
+            {"role": "system", "content": "You are an expert CV optimization assistant. Your task is to provide specific, actionable recommendations to optimize a CV for a target job. Include what skills to add, what experiences to emphasize, and what to remove or de-emphasize. Format your response as JSON with the following keys: 'skills_to_add', 'skills_to_emphasize', 'experiences_to_emphasize', 'items_to_remove', and 'general_recommendations'."},
+            {"role": "user", "content": f"CV Analysis: {canonical_json(cv_analysis)}\n\nBased on this CV analysis, provide specific recommendations to optimize the CV for the target job '{target_job_title}'."}
+        ]
+    
+    def optimize_cv_for_titles(
+        self,
+        cv_analysis: Dict[str, Any],
+        target_job_titles: List[str],
+        max_workers: int = OPTIMIZATION_CONCURRENCY,
+        store=None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Generate CV optimization recommendations for several target jobs concurrently.
+        
+        The first title is optimized on its own so the provider can cache the shared
+        prompt prefix (instructions and CV analysis) before the others are sent in parallel.
+        
+        Titles are compared by canonical form and fuzzy similarity ("Sr. Data Scientist"
+        matches "Senior Data Scientist"), so a role is only optimized once per CV: a
+        matching title in the same batch or, with a store, one optimized earlier is
+        reused. Reused results carry a 'cache_match' entry naming the title they came from.
+        
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+            target_job_titles: The job titles to optimize the CV for
+            max_workers: Maximum number of concurrent requests
+            store: ScoreStore consulted for and updated with optimizations
+            
+        Returns:
+            Dictionary mapping each (distinct) title to its optimization recommendations
+        """
+        titles = list(dict.fromkeys(title.strip() for title in target_job_titles if title.strip()))
+        if not titles:
+            return {}
+        
+        cv_hash = cv_fingerprint(cv_analysis)
+        model = self.llm_client.model
+        stored = store.optimized_titles(cv_hash, model, self.OPTIMIZE_PROMPT_VERSION) if store is not None else {}
+        stored_canonical = {title: canonical for canonical, title in stored.items()}
+        index = TitleIndex(list(stored.values()))
+        
+        results: Dict[str, Dict[str, Any]] = {}
+        matches: Dict[str, Tuple[str, float]] = {}
+        pending: List[str] = []
+        for title in titles:
+            match = index.nearest(title)
+            if match is not None:
+                matched_title, _, similarity = match
+                if matched_title not in stored_canonical:
+                    # Another phrasing of a title earlier in this batch
+                    matches[title] = (matched_title, similarity)
+                    continue
+                result = store.get_optimization(cv_hash, stored_canonical[matched_title], model, self.OPTIMIZE_PROMPT_VERSION)
+                if result is not None:
+                    results[title] = result
+                    matches[title] = (matched_title, similarity)
+                    continue
+            pending.append(title)
+            index.add(title)
+        
+        def optimize(title: str) -> Dict[str, Any]:
+            try:
+                return self.optimize_cv(cv_analysis, title)
+            except Exception as e:
+                return {"error": str(e)}
+        
+        if pending:
+            results[pending[0]] = optimize(pending[0])
+        if len(pending) > 1:
+            with ThreadPoolExecutor(max_workers=max(1, max_workers), thread_name_prefix="optimize-cv") as executor:
+                # Pool threads don't inherit the caller's admission scope
+                results.update(zip(pending[1:], executor.map(bind_scope(optimize), pending[1:])))
+        if store is not None:
+            for title in pending:
+                store.put_optimization(
+                    cv_hash, canonical_title(title), model, self.OPTIMIZE_PROMPT_VERSION, title, results[title]
+                )
+        
+        for title, (matched_title, similarity) in matches.items():
+            results[title] = {
+                **results.get(title, results.get(matched_title, {})),
+                "cache_match": {
+                    "title": matched_title,
+                    "canonical_title": canonical_title(matched_title),
+                    "similarity": round(similarity, 2),
+                },
+            }
+        return {title: results[title] for title in titles}
+    
+    def combine_optimizations(self, results: Dict[str, Dict[str, Any]]) -> Dict[str, List[str]]:
+        """
+        Find the recommendations shared by several target jobs.
+        
+        Args:
+            results: Optimization recommendations by target job title
+            
+        Returns:
+            Dictionary with 'skills_to_add' and 'skills_to_emphasize', each listing the skills
+            recommended for at least two targets, most widely recommended first
+        """
+        combined = {}
+        successful = []
+        for title, result in results.items():
+            matched_title = result.get("cache_match", {}).get("title", title)
+            # Phrasings of the same role share one result and count once
+            if "error" in result or (matched_title != title and matched_title in results):
+                continue
+            successful.append(result)
+        for field in ("skills_to_add", "skills_to_emphasize"):
+            counts: Dict[str, int] = {}
+            for result in successful:
+                for skill in set(self.skill_ontology.normalize_skills(flatten_skills(result.get(field)))):
+                    counts[skill] = counts.get(skill, 0) + 1
+            combined[field] = sorted(
+                (skill for skill, count in counts.items() if count >= 2),
+                key=lambda skill: (-counts[skill], skill)
+            )
+        return combined
+    
     def calculate_job_match_score(self, cv_analysis: Dict[str, Any], job_description: str) -> Dict[str, Any]:
         """
         Calculate a compatibility score between a CV and job description.
@@ -59,7 +197,7 @@ class AdvancedFeatures:
         """
         prompt = [
             {"role": "system", "content": "You are an expert job compatibility analyst. Your task is to calculate how well a candidate's CV matches a job description and provide a detailed compatibility analysis."},
-            {"role": "user", "content": f"Calculate the compatibility between this CV and job description. Provide an overall match percentage and separate scores for skills match, experience match, and education match. Also identify missing skills and experiences that would improve the match. Format your response as JSON with the following keys: 'overall_score', 'skills_match', 'experience_match', 'education_match', 'missing_skills', 'missing_experiences', and 'recommendations'.\n\nCV Analysis: {json.dumps(cv_analysis, indent=2)}\n\nJob Description: {job_description}"}
+            {"role": "user", "content": f"Calculate the compatibility between this CV and job description. Provide an overall match percentage and separate scores for skills match, experience match, and education match. Also identify missing skills and experiences that would improve the match. Format your response as JSON with the following keys: 'overall_score', 'skills_match', 'experience_match', 'education_match', 'missing_skills', 'missing_experiences', and 'recommendations'.\n\nCV Analysis: {canonical_json(cv_analysis)}\n\nJob Description: {job_description}"}
         ]
         
         response = self.llm_client.chat_completion(prompt, temperature=0.3)
@@ -75,13 +213,55 @@ class AdvancedFeatures:
             else:
                 json_str = content
                 
-            return json.loads(json_str)
+            match_results = json.loads(json_str)
         except json.JSONDecodeError:
             # If JSON parsing fails, return a structured error
             return {
                 "error": "Failed to parse job match analysis",
                 "raw_content": content
             }
+        
+        self._merge_missing_skills(match_results, cv_analysis, job_description)
+        return match_results
+    
+    def _merge_missing_skills(self, match_results: Dict[str, Any], cv_analysis: Dict[str, Any], job_description: str):
+        """
+        Normalize the LLM's missing skills and add skills found locally in the job description.
+        
+        Args:
+            match_results: Parsed job match analysis, updated in place
+            cv_analysis: Dictionary with CV analysis results
+            job_description: The job description text
+        """
+        skills_match = match_results.get("skills_match")
+        if skills_match is None:
+            skills_match = match_results["skills_match"] = {}
+        if not isinstance(skills_match, dict):
+            return
+        
+        reported = flatten_skills(skills_match.get("missing_skills") or match_results.get("missing_skills"))
+        detected = self.skill_ontology.missing_skills(flatten_skills(cv_analysis.get("skills")), job_description)
+        skills_match["missing_skills"] = self.skill_ontology.normalize_skills(reported + detected)
+    
+    def match_score_key(self, cv_analysis: Dict[str, Any], job_id: str, job_description: str) -> ScoreKey:
+        """
+        Build the score store key for a job match score.
+        
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+            job_id: Canonical job ID (e.g. its URL)
+            job_description: The job description text that is scored
+            
+        Returns:
+            Key covering the CV, job, description, model and prompt version
+        """
+        return ScoreKey(
+            cv_fingerprint(cv_analysis),
+            job_id,
+            content_hash(job_description),
+            self.llm_client.model,
+            self.MATCH_PROMPT_VERSION,
+        )
     
     def extract_job_description(self, job_url: str) -> str:
         """
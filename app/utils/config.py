@@ -8,18 +8,123 @@ load_dotenv()
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_MODEL_1 = os.getenv("OPENROUTER_MODEL_1", "google/gemini-2.0-flash-001")
 OPENROUTER_MODEL_2 = os.getenv("OPENROUTER_MODEL_2", "google/gemini-2.0-flash-001")
+# Seconds to wait for OpenRouter to connect and answer; a hung request would hold an LLM slot forever
+OPENROUTER_TIMEOUT = float(os.getenv("OPENROUTER_TIMEOUT", "60"))
 
 # Application configuration
 CV_UPLOAD_FOLDER = os.path.join(os.path.dirname(os.path.dirname(__file__)), "data")
-os.makedirs(CV_UPLOAD_FOLDER, exist_ok=True)
+
+# Uploaded CVs and the artifacts derived from them: folder, total size cap in bytes, seconds an
+# unused CV is kept (0 keeps it until the size cap evicts it), seconds between compaction passes
+UPLOAD_STORE_PATH = os.getenv("UPLOAD_STORE_PATH", os.path.join(CV_UPLOAD_FOLDER, "uploads"))
+UPLOAD_STORE_MAX_BYTES = int(os.getenv("UPLOAD_STORE_MAX_BYTES", str(1024 * 1024 * 1024)))
+UPLOAD_STORE_MAX_AGE = float(os.getenv("UPLOAD_STORE_MAX_AGE", str(7 * 24 * 3600)))
+UPLOAD_COMPACTION_INTERVAL = float(os.getenv("UPLOAD_COMPACTION_INTERVAL", "600"))
+
+# Local SQLite store for saved searches and their precomputed results
+JOB_STORE_PATH = os.getenv("JOB_STORE_PATH", os.path.join(CV_UPLOAD_FOLDER, "jobs.db"))
+
+# Background refresh of saved searches
+SAVED_SEARCH_INTERVAL = float(os.getenv("SAVED_SEARCH_INTERVAL", "3600"))
+SAVED_SEARCH_JITTER = float(os.getenv("SAVED_SEARCH_JITTER", "0.1"))
+SAVED_SEARCH_CONCURRENCY = int(os.getenv("SAVED_SEARCH_CONCURRENCY", "2"))
+
+# Durable store of compatibility scores keyed by CV fingerprint and job
+SCORE_STORE_PATH = os.getenv("SCORE_STORE_PATH", os.path.join(CV_UPLOAD_FOLDER, "scores.db"))
+# Seconds a stored score or optimization is kept (0 keeps them forever)
+SCORE_STORE_TTL = float(os.getenv("SCORE_STORE_TTL", str(30 * 24 * 3600)))
+
+# Maximum number of concurrent LLM requests when scoring many jobs at once
+SCORING_CONCURRENCY = int(os.getenv("SCORING_CONCURRENCY", "4"))
+
+# Jobs "Score All Jobs" sends to the LLM by default: the most relevant ones by local
+# pre-ranking (the others keep their local estimate); 0 scores every job
+BATCH_SCORING_TOP_K = int(os.getenv("BATCH_SCORING_TOP_K", "20"))
+
+# Maximum number of concurrent LLM requests when optimizing a CV for several target titles
+OPTIMIZATION_CONCURRENCY = int(os.getenv("OPTIMIZATION_CONCURRENCY", "4"))
+
+# Admission of LLM requests: requests in flight across all sessions (and API clients) of a
+# process, sustained requests per second and burst per tenant (session or API key; a rate of
+# 0 disables the per-tenant limit), and seconds a request may wait before it is rejected
+LLM_CONCURRENCY = int(os.getenv("LLM_CONCURRENCY", "8"))
+TENANT_LLM_RATE = float(os.getenv("TENANT_LLM_RATE", "2.0"))
+TENANT_LLM_BURST = float(os.getenv("TENANT_LLM_BURST", "40"))
+ADMISSION_MAX_WAIT = float(os.getenv("ADMISSION_MAX_WAIT", "60"))
+
+# Background tasks (CV analysis, query generation, searches, scoring) shared by all sessions:
+# concurrent tasks, and seconds a finished task's result is kept for its session
+BACKGROUND_WORKERS = int(os.getenv("BACKGROUND_WORKERS", "8"))
+BACKGROUND_RESULT_TTL = float(os.getenv("BACKGROUND_RESULT_TTL", "3600"))
+
+# Large session values (job results, analyses) kept out of sessions: pickled size from which a value
+# is offloaded, memory kept for offloaded values per process, the shared SQLite store holding them,
+# its size cap and seconds an unused value is kept (sizes in bytes)
+SESSION_SPILL_THRESHOLD = int(os.getenv("SESSION_SPILL_THRESHOLD", str(64 * 1024)))
+SESSION_MEMORY_BYTES = int(os.getenv("SESSION_MEMORY_BYTES", str(256 * 1024 * 1024)))
+SESSION_STORE_PATH = os.getenv("SESSION_STORE_PATH", os.path.join(CV_UPLOAD_FOLDER, "session_data.db"))
+SESSION_STORE_MAX_BYTES = int(os.getenv("SESSION_STORE_MAX_BYTES", str(2 * 1024 * 1024 * 1024)))
+SESSION_STORE_TTL = float(os.getenv("SESSION_STORE_TTL", "86400"))
+
+# Speculative prefetch after a CV is analyzed: generated queries searched right away
+# (0 only generates the queries), and speculative requests allowed per session (0 disables it)
+PREFETCH_SEARCH_QUERIES = int(os.getenv("PREFETCH_SEARCH_QUERIES", "3"))
+PREFETCH_SESSION_BUDGET = int(os.getenv("PREFETCH_SESSION_BUDGET", "10"))
+
+# HTTP JSON API (run_api.py): bind address, worker processes, accepted API keys
+# (comma-separated; empty accepts every request) and the largest CV upload in bytes
+API_HOST = os.getenv("API_HOST", "127.0.0.1")
+API_PORT = int(os.getenv("API_PORT", "8000"))
+API_WORKERS = int(os.getenv("API_WORKERS", "4"))
+API_KEYS = frozenset(key.strip() for key in os.getenv("API_KEYS", "").split(",") if key.strip())
+API_MAX_UPLOAD_BYTES = int(os.getenv("API_MAX_UPLOAD_BYTES", str(10 * 1024 * 1024)))
 
 # LinkedIn search configuration
 LINKEDIN_JOBS_URL = "https://www.linkedin.com/jobs/search/"
 BROWSER_HEADLESS = os.getenv("BROWSER_USE_HEADLESS", "false").lower() == "true"
 
+# Adaptive politeness scheduling for LinkedIn requests (requests per second, shared by all sessions)
+LINKEDIN_INITIAL_RATE = float(os.getenv("LINKEDIN_INITIAL_RATE", "0.5"))
+LINKEDIN_MAX_RATE = float(os.getenv("LINKEDIN_MAX_RATE", "2.0"))
+LINKEDIN_MAX_RETRIES = int(os.getenv("LINKEDIN_MAX_RETRIES", "2"))
+# Longest a search waits for its LinkedIn slot (seconds); beyond it the query is reported as throttled
+LINKEDIN_MAX_WAIT = float(os.getenv("LINKEDIN_MAX_WAIT", "30"))
+
+# Process-wide cache of search results (seconds, seconds, bytes)
+SEARCH_CACHE_TTL = float(os.getenv("SEARCH_CACHE_TTL", "900"))
+SEARCH_CACHE_STALE_TTL = float(os.getenv("SEARCH_CACHE_STALE_TTL", "3600"))
+SEARCH_CACHE_MAX_BYTES = int(os.getenv("SEARCH_CACHE_MAX_BYTES", str(50 * 1024 * 1024)))
+
 # Use mock implementation for job search (for testing or when LinkedIn scraping fails)
 USE_MOCK_JOB_SEARCH = os.getenv("USE_MOCK_JOB_SEARCH", "false").lower() == "true"
 
-# Ensure API key is available
-if not OPENROUTER_API_KEY:
-    raise ValueError("OpenRouter API key not found. Please set OPENROUTER_API_KEY in your .env file.")
\ No newline at end of file
+# Size and seed of the synthetic corpus backing the mock job search (0 uses the built-in sample jobs)
+MOCK_JOB_CORPUS_SIZE = int(os.getenv("MOCK_JOB_CORPUS_SIZE", "0"))
+MOCK_JOB_CORPUS_SEED = int(os.getenv("MOCK_JOB_CORPUS_SEED", "42"))
+
+
+# Importing this module has no side effects; the functions below are called
+# explicitly when the application (or a resource needing them) starts
+
+def require_api_key() -> str:
+    """
+    Return the OpenRouter API key.
+
+    Raises:
+        ValueError: If no API key is configured
+    """
+    if not OPENROUTER_API_KEY:
+        raise ValueError("OpenRouter API key not found. Please set OPENROUTER_API_KEY in your .env file.")
+    return OPENROUTER_API_KEY
+
+
+def ensure_data_dir(path: str = CV_UPLOAD_FOLDER) -> str:
+    """Create a data folder (by default the upload folder) if it doesn't exist, and return it."""
+    os.makedirs(path, exist_ok=True)
+    return path
+
+
+def init_app():
+    """Validate the configuration and create the data folder; called once when the app starts."""
+    require_api_key()
+    ensure_data_dir()
\ No newline at end of file
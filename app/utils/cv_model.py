@@ -0,0 +1,225 @@
+import json
+import sys
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, Optional, Tuple, Union
+from .fingerprint import content_hash
+
+# Fields of a CV analysis requested from the LLM
+CV_FIELDS = ("skills", "experience", "education", "job_titles", "relevant_job_keywords")
+
+# Keys of experience entries whose values are job titles
+_TITLE_KEYS = frozenset({"title", "job_title", "position", "role"})
+
+# Keys naming a skill, title or keyword given as an object instead of a string
+_NAME_KEYS = ("name", "skill", "title", "keyword")
+
+Entry = Union[str, Dict[str, Any]]
+
+
+class CVAnalysisError(ValueError):
+    """Raised when an LLM answer can't be turned into a CV analysis."""
+
+
+def _strings(value: Any, split: bool = True) -> Tuple[str, ...]:
+    """
+    Coerce an LLM-shaped value into a tuple of distinct, interned, non-empty strings.
+
+    Dictionaries of categories and nested lists are flattened, and list items that
+    are objects contribute their name (e.g. {"name": "Python", "level": "expert"}).
+
+    Raises:
+        CVAnalysisError: If a list item is an object without a name
+    """
+    items = []
+
+    def collect(value: Any, in_list: bool):
+        if value is None:
+            return
+        if isinstance(value, str):
+            items.extend(value.split(",") if split else [value])
+        elif isinstance(value, dict):
+            if not in_list:
+                for item in value.values():
+                    collect(item, False)
+                return
+            name = next((value[key] for key in _NAME_KEYS if isinstance(value.get(key), str) and value[key].strip()), None)
+            if name is None:
+                raise CVAnalysisError(f"List item has none of the keys {', '.join(_NAME_KEYS)}: {value}")
+            collect(name, True)
+        elif isinstance(value, (list, tuple)):
+            for item in value:
+                collect(item, True)
+        else:
+            items.append(str(value))
+
+    collect(value, False)
+    return tuple(dict.fromkeys(sys.intern(item.strip()) for item in items if item.strip()))
+
+
+def _json_value(value: Any, key: Optional[str] = None) -> Any:
+    """Make a value JSON-safe, interning job titles found in it."""
+    if isinstance(value, dict):
+        return {str(k): _json_value(v, str(k)) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [_json_value(item) for item in value]
+    if isinstance(value, str):
+        return sys.intern(value.strip()) if key in _TITLE_KEYS else value
+    if value is None or isinstance(value, (bool, int, float)):
+        return value
+    return str(value)
+
+
+def _entries(value: Any) -> Tuple[Entry, ...]:
+    """Coerce an LLM-shaped experience or education value into a tuple of entries."""
+    if value is None:
+        return ()
+    if not isinstance(value, (list, tuple)):
+        value = [value]
+    return tuple(_json_value(entry) for entry in value if entry not in (None, "", {}, []))
+
+
+class CVAnalysis(Mapping):
+    """
+    Validated, compact CV analysis.
+
+    Skills, job titles and keywords are stored as tuples of interned strings, and
+    experience and education as tuples of entries (strings or JSON objects). The
+    object is treated as immutable and behaves like the JSON dictionary it was built from, so
+    code that reads cv_analysis["skills"] or cv_analysis.get("education") keeps
+    working; each field is always present as a list.
+    """
+
+    __slots__ = (
+        "skills", "skill_groups", "experience", "education", "job_titles", "relevant_job_keywords",
+        "extra", "_canonical",
+    )
+
+    def __init__(
+        self,
+        skills: Tuple[str, ...] = (),
+        experience: Tuple[Entry, ...] = (),
+        education: Tuple[Entry, ...] = (),
+        job_titles: Tuple[str, ...] = (),
+        relevant_job_keywords: Tuple[str, ...] = (),
+        skill_groups: Tuple[Tuple[str, Tuple[str, ...]], ...] = (),
+        extra: Optional[Dict[str, Any]] = None,
+    ):
+        """
+        Initialize a CV analysis from already validated fields; use from_dict for LLM output.
+
+        Args:
+            skills: All skills, flattened
+            experience: Experience entries
+            education: Education entries
+            job_titles: Job titles held
+            relevant_job_keywords: Keywords relevant for a job search
+            skill_groups: (category, skills) pairs if the skills were grouped by category
+            extra: Any other fields of the analysis, kept for round-tripping
+        """
+        self.skills = skills
+        self.experience = experience
+        self.education = education
+        self.job_titles = job_titles
+        self.relevant_job_keywords = relevant_job_keywords
+        self.skill_groups = skill_groups
+        self.extra = extra or {}
+        self._canonical: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data: Any) -> "CVAnalysis":
+        """
+        Validate an LLM-shaped CV analysis.
+
+        Args:
+            data: Parsed JSON answer of the CV analysis prompt
+
+        Returns:
+            CV analysis
+
+        Raises:
+            CVAnalysisError: If the answer is not a JSON object with any of the expected fields
+        """
+        if isinstance(data, CVAnalysis):
+            return data
+        if not isinstance(data, dict):
+            raise CVAnalysisError(f"Expected a JSON object, got {type(data).__name__}")
+        if "error" in data:
+            raise CVAnalysisError(str(data["error"]))
+        if not any(field in data for field in CV_FIELDS):
+            raise CVAnalysisError(f"None of the expected fields ({', '.join(CV_FIELDS)}) are present")
+
+        skills = data.get("skills")
+        skill_groups = ()
+        if isinstance(skills, dict):
+            skill_groups = tuple((sys.intern(str(category)), _strings(group)) for category, group in skills.items())
+        return cls(
+            skills=_strings(skills),
+            experience=_entries(data.get("experience")),
+            education=_entries(data.get("education")),
+            job_titles=_strings(data.get("job_titles"), split=False),
+            relevant_job_keywords=_strings(data.get("relevant_job_keywords")),
+            skill_groups=skill_groups,
+            extra={key: _json_value(value) for key, value in data.items() if key not in CV_FIELDS},
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the analysis as a plain JSON dictionary (grouped skills stay grouped)."""
+        return {key: self[key] for key in self}
+
+    def canonical_json(self) -> str:
+        """
+        Serialize the analysis compactly and canonically (sorted keys, no whitespace).
+
+        Used both in prompts, where whitespace only costs tokens, and for hashing.
+        """
+        if self._canonical is None:
+            self._canonical = json.dumps(
+                self.to_dict(), sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str
+            )
+        return self._canonical
+
+    @classmethod
+    def from_json(cls, text: str) -> "CVAnalysis":
+        """Load an analysis serialized with canonical_json."""
+        return cls.from_dict(json.loads(text))
+
+    @property
+    def fingerprint(self) -> str:
+        """Stable hash of the analysis content."""
+        return content_hash(self.canonical_json())
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "skills" and self.skill_groups:
+            return {category: list(group) for category, group in self.skill_groups}
+        if key in CV_FIELDS:
+            return list(getattr(self, key))
+        return self.extra[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from CV_FIELDS
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return len(CV_FIELDS) + len(self.extra)
+
+    def __contains__(self, key: object) -> bool:
+        return key in CV_FIELDS or key in self.extra
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, CVAnalysis):
+            return self.canonical_json() == other.canonical_json()
+        return Mapping.__eq__(self, other)
+
+    def __hash__(self) -> int:
+        return hash(self.canonical_json())
+
+    def __repr__(self) -> str:
+        return f"CVAnalysis({self.canonical_json()})"
+
+    def __getstate__(self):
+        return self.canonical_json()
+
+    def __setstate__(self, state: str):
+        other = CVAnalysis.from_json(state)
+        for slot in CVAnalysis.__slots__:
+            object.__setattr__(self, slot, getattr(other, slot))
@@ -1,14 +1,21 @@
-import os
-import PyPDF2
 from typing import Dict, Any, Optional
-from .config import CV_UPLOAD_FOLDER
 from .llm import OpenRouterClient
+from .resources import get_resource
+from .skills import SkillOntology, get_skill_ontology
+from .cv_model import CVAnalysis, CVAnalysisError
+
+# Artifact holding the text extracted from a stored CV
+TEXT_ARTIFACT = "text.txt"
 
 class CVParser:
     """Parser for extracting text and information from CV files."""
     
-    def __init__(self, llm_client: Optional[OpenRouterClient] = None):
+    def __init__(self, llm_client: Optional[OpenRouterClient] = None, skill_ontology: Optional[SkillOntology] = None,
+                 upload_store=None):
         self.llm_client = llm_client or OpenRouterClient()
+        self.skill_ontology = skill_ontology or get_skill_ontology()
+        # Uploads are content-addressed and size-capped, shared by every session
+        self.upload_store = upload_store or get_resource("upload_store")
         
     def extract_text_from_pdf(self, file_path: str) -> str:
         """
@@ -20,15 +27,27 @@ class CVParser:
         Returns:
             Extracted text content
         """
+        # A stored CV's text is extracted once and kept next to it
+        digest = self.upload_store.digest_of(file_path)
+        if digest is not None:
+            cached = self.upload_store.get_artifact(digest, TEXT_ARTIFACT)
+            if cached is not None:
+                return cached.decode("utf-8")
+        
+        import PyPDF2
+
         try:
             with open(file_path, 'rb') as file:
                 reader = PyPDF2.PdfReader(file)
                 text = ""
                 for page_num in range(len(reader.pages)):
                     text += reader.pages[page_num].extract_text()
-                return text
         except Exception as e:
             raise Exception(f"Error extracting text from PDF: {e}")
+        
+        if digest is not None:
+            self.upload_store.put_artifact(digest, TEXT_ARTIFACT, text.encode("utf-8"))
+        return text
     
     def parse_cv(self, file_path: str) -> Dict[str, Any]:
         """
@@ -38,19 +57,46 @@ class CVParser:
             file_path: Path to the CV file
             
         Returns:
-            Dictionary with extracted information
+            Validated CVAnalysis, or a dictionary with 'error' and 'raw_content' if the
+            LLM's answer could not be used
         """
-        # Extract text from the CV
-        cv_text = self.extract_text_from_pdf(file_path)
+        return self.analyze_text(self.extract_text_from_pdf(file_path))
+    
+    def analyze_text(self, cv_text: str) -> Dict[str, Any]:
+        """
+        Analyze the text of a CV.
         
+        Args:
+            cv_text: Text extracted from the CV
+            
+        Returns:
+            Validated CVAnalysis, or a dictionary with 'error' and 'raw_content' if the
+            LLM's answer could not be used
+        """
         # Use LLM to analyze the CV
         cv_analysis = self.llm_client.analyze_cv(cv_text)
+        if "error" in cv_analysis:
+            return cv_analysis
+        
+        # Validate once; everything downstream can rely on the fields' shapes
+        try:
+            analysis = CVAnalysis.from_dict(cv_analysis)
+        except CVAnalysisError as e:
+            return {"error": f"Unexpected CV analysis format: {e}", "raw_content": str(cv_analysis)}
         
-        return cv_analysis
+        # Keep the skills as the LLM wrote them and add their canonical names
+        # ("JS", "ECMAScript" -> "JavaScript") alongside for matching
+        if analysis.skills:
+            canonical_skills = self.skill_ontology.normalize_skills(analysis.skills)
+            analysis = CVAnalysis.from_dict(dict(analysis.to_dict(), canonical_skills=canonical_skills))
+        return analysis
     
     def save_uploaded_cv(self, uploaded_file) -> str:
         """
-        Save an uploaded CV file to the data directory.
+        Save an uploaded CV file to the upload store.
+        
+        Identical files (e.g. the same upload on every rerun, or the same CV from
+        two sessions) are stored once, and files with the same name don't collide.
         
         Args:
             uploaded_file: Streamlit uploaded file object
@@ -58,10 +104,4 @@ class CVParser:
         Returns:
             Path to the saved file
         """
-        os.makedirs(CV_UPLOAD_FOLDER, exist_ok=True)
-        file_path = os.path.join(CV_UPLOAD_FOLDER, uploaded_file.name)
-        
-        with open(file_path, "wb") as f:
-            f.write(uploaded_file.getbuffer())
-            
-        return file_path
\ No newline at end of file
+        return self.upload_store.save(bytes(uploaded_file.getbuffer()), uploaded_file.name)
\ No newline at end of file
@@ -0,0 +1,35 @@
+import hashlib
+import json
+from typing import Dict, Any
+
+
+def content_hash(text: str) -> str:
+    """Return a short, stable hash of a text."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+def canonical_json(value: Any) -> str:
+    """
+    Serialize a value canonically (sorted keys, no whitespace).
+
+    Objects with their own canonical_json method (like CVAnalysis) use it.
+    """
+    if hasattr(value, "canonical_json"):
+        return value.canonical_json()
+    return json.dumps(value, sort_keys=True, separators=(",", ":"), ensure_ascii=False, default=str)
+
+
+def cv_fingerprint(cv_analysis: Dict[str, Any]) -> str:
+    """
+    Return a stable hash of a CV analysis.
+
+    The analysis is serialized canonically (sorted keys, no whitespace), so
+    the fingerprint only changes when the content does.
+
+    Args:
+        cv_analysis: Dictionary with CV analysis results
+
+    Returns:
+        Hex digest identifying the analysis
+    """
+    return content_hash(canonical_json(cv_analysis))
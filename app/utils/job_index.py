@@ -0,0 +1,121 @@
+from collections import OrderedDict
+from typing import List, Dict, Iterable, Optional, Tuple, TYPE_CHECKING
+import numpy as np
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+# Columns job results can be filtered by
+FILTER_COLUMNS = ("title", "company", "location")
+
+Selection = Tuple[Tuple[str, Tuple[str, ...]], ...]
+
+
+class JobResultsIndex:
+    """
+    Per-value row index of a job results DataFrame, for filtering and paging without rescanning it.
+
+    For every filter column the rows holding each distinct value are precomputed
+    once (sorted row positions, taken from the categorical codes when the column is
+    categorical). A filter is then the union of its values' rows within a column
+    and the intersection across columns, and recently used filters are memoized.
+    """
+
+    def __init__(self, frame: "pd.DataFrame", columns: Iterable[str] = FILTER_COLUMNS, cache_size: int = 32):
+        """
+        Build the index.
+
+        Args:
+            frame: Job results, as returned by search_multiple_queries
+            columns: Columns to index (missing ones are skipped)
+            cache_size: Number of filtered views kept
+        """
+        import pandas as pd
+
+        self.frame = frame
+        self.cache_size = cache_size
+        self._options: Dict[str, List[str]] = {}
+        self._postings: Dict[str, Dict[str, np.ndarray]] = {}
+        self._cache: "OrderedDict[Selection, np.ndarray]" = OrderedDict()
+
+        for column in columns:
+            if column not in frame.columns:
+                continue
+            series = frame[column]
+            if isinstance(series.dtype, pd.CategoricalDtype):
+                codes = series.cat.codes.to_numpy()
+                categories = series.cat.categories
+            else:
+                codes, categories = pd.factorize(series)
+
+            # One stable sort groups the rows of each value, keeping them in row order;
+            # missing values (code -1) sort first and are skipped
+            order = np.argsort(codes, kind="stable")
+            counts = np.bincount(codes[codes >= 0], minlength=len(categories))
+            starts = np.concatenate(([0], np.cumsum(counts)[:-1])) + int((codes < 0).sum())
+            postings = {}
+            for code in np.flatnonzero(counts):
+                postings[str(categories[code])] = order[starts[code]:starts[code] + counts[code]]
+            self._postings[column] = postings
+            # Values in order of first appearance
+            self._options[column] = sorted(postings, key=lambda value: postings[value][0])
+
+    def __len__(self) -> int:
+        return len(self.frame)
+
+    def options(self, column: str) -> List[str]:
+        """Return the distinct values of a column, in order of first appearance."""
+        return list(self._options.get(column, []))
+
+    def filter(self, selections: Dict[str, Iterable[str]]) -> np.ndarray:
+        """
+        Return the positions of the rows matching a filter.
+
+        Args:
+            selections: Selected values per column; a row matches if, for every
+                column with a selection, its value is one of the selected ones
+
+        Returns:
+            Sorted row positions
+        """
+        key: Selection = tuple(
+            (column, tuple(sorted(set(values))))
+            for column, values in sorted(selections.items()) if values and column in self._postings
+        )
+        rows = self._cache.get(key)
+        if rows is not None:
+            self._cache.move_to_end(key)
+            return rows
+
+        if not key:
+            rows = np.arange(len(self.frame))
+        else:
+            mask: Optional[np.ndarray] = None
+            for column, values in key:
+                postings = self._postings[column]
+                column_mask = np.zeros(len(self.frame), dtype=bool)
+                for value in values:
+                    if value in postings:
+                        column_mask[postings[value]] = True
+                mask = column_mask if mask is None else mask & column_mask
+            rows = np.flatnonzero(mask)
+
+        self._cache[key] = rows
+        if len(self._cache) > self.cache_size:
+            self._cache.popitem(last=False)
+        return rows
+
+    def page(self, rows: np.ndarray, page: int, page_size: int) -> "pd.DataFrame":
+        """
+        Return one page of filtered rows.
+
+        Args:
+            rows: Row positions from filter()
+            page: Page number, starting at 0
+            page_size: Rows per page
+
+        Returns:
+            DataFrame with the page's rows
+        """
+        start = page * page_size
+        return self.frame.iloc[rows[start:start + page_size]]
@@ -1,29 +1,43 @@
-import time
+import threading
 import urllib.parse
-import pandas as pd
-from typing import List, Dict, Any
-from selenium import webdriver
-from selenium.webdriver.chrome.service import Service
-from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.common.by import By
-from selenium.webdriver.support.ui import WebDriverWait
-from selenium.webdriver.support import expected_conditions as EC
-from webdriver_manager.chrome import ChromeDriverManager
-from bs4 import BeautifulSoup
-import requests
-from fake_useragent import UserAgent
-from .config import LINKEDIN_JOBS_URL, BROWSER_HEADLESS
+from typing import List, Dict, Any, Callable, Optional, TYPE_CHECKING
+from .config import LINKEDIN_JOBS_URL, BROWSER_HEADLESS, LINKEDIN_MAX_RETRIES
+from .search_cache import get_search_cache, make_search_key
+from .rate_limiter import ThrottledError, THROTTLE_STATUS_CODES, get_scheduler, parse_retry_after
+from .job_table import JobTable
+from .resources import get_resource
+
+# selenium, webdriver_manager, BeautifulSoup/lxml and requests are imported where
+# they are used, so mock mode and CV-only sessions never pay for loading them
+if TYPE_CHECKING:
+    import pandas as pd
 
 class LinkedInJobSearch:
     """Class for searching and scraping job listings from LinkedIn."""
     
-    def __init__(self, headless: bool = BROWSER_HEADLESS):
+    # Filters applied to every search, part of the cache key
+    SEARCH_FILTERS = {
+        "sortBy": "R",  # Sort by relevance
+        "f_WT": "2",  # Remote jobs
+    }
+    
+    def __init__(self, headless: bool = BROWSER_HEADLESS, use_cache: bool = True, user_agent=None):
         self.headless = headless
         self.driver = None
-        self.ua = UserAgent()
+        self._driver_lock = threading.Lock()
+        self.cache = get_search_cache() if use_cache else None
+        # fake_useragent's dataset is slow to load, so it is shared process-wide
+        self.ua = user_agent or get_resource("user_agent")
+        self.scheduler = get_scheduler()
+        self.host = urllib.parse.urlparse(LINKEDIN_JOBS_URL).netloc
         
     def _setup_driver(self):
         """Set up the Selenium WebDriver with improved options."""
+        from selenium import webdriver
+        from selenium.webdriver.chrome.options import Options
+        from selenium.webdriver.chrome.service import Service
+        from webdriver_manager.chrome import ChromeDriverManager
+
         options = Options()
         if self.headless:
             options.add_argument("--headless=new")  # Use the new headless mode
@@ -61,6 +75,11 @@ class LinkedInJobSearch:
                 print(f"Error closing driver: {e}")
             finally:
                 self.driver = None
+
+    def close(self):
+        """Release the Selenium WebDriver, if one is open."""
+        with self._driver_lock:
+            self._close_driver()
                 
     def _search_jobs_with_requests(self, query: str, location: str = "", limit: int = 10) -> List[Dict[str, Any]]:
         """
@@ -73,13 +92,15 @@ class LinkedInJobSearch:
             
         Returns:
             List of job listings
+            
+        Raises:
+            ThrottledError: If LinkedIn throttled the request
         """
+        import requests
+        from bs4 import BeautifulSoup
+
         # Encode query parameters
-        params = {
-            "keywords": query,
-            "sortBy": "R",  # Sort by relevance
-            "f_WT": "2",  # Remote jobs
-        }
+        params = {"keywords": query, **self.SEARCH_FILTERS}
         
         if location:
             params["location"] = location
@@ -96,9 +117,22 @@ class LinkedInJobSearch:
             "Cache-Control": "max-age=0",
         }
         
+        self.scheduler.acquire(self.host)
+        try:
+            response = requests.get(url, headers=headers, timeout=30)
+        except Exception as e:
+            print(f"Error searching jobs with requests: {e}")
+            return []
+            
+        # A throttled request is not the same as "no jobs": back off instead of falling back to Selenium
+        if response.status_code in THROTTLE_STATUS_CODES:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            self.scheduler.record_throttle(self.host, retry_after)
+            raise ThrottledError(self.host, response.status_code, retry_after)
+            
         try:
-            response = requests.get(url, headers=headers)
             response.raise_for_status()
+            self.scheduler.record_success(self.host)
             
             soup = BeautifulSoup(response.text, "lxml")
             job_cards = soup.select(".job-search-card")
@@ -132,7 +166,7 @@ class LinkedInJobSearch:
     
     def search_jobs(self, query: str, location: str = "", limit: int = 10) -> List[Dict[str, Any]]:
         """
-        Search for jobs on LinkedIn.
+        Search for jobs on LinkedIn, served from the shared result cache when possible.
         
         Args:
             query: Job search query
@@ -141,13 +175,53 @@ class LinkedInJobSearch:
             
         Returns:
             List of job listings
+            
+        Raises:
+            ThrottledError: If LinkedIn kept throttling the request after all retries
         """
-        # First try with requests (more reliable)
-        results = self._search_jobs_with_requests(query, location, limit)
+        if self.cache is None:
+            return self._search_jobs_uncached(query, location, limit)
+        
+        key = make_search_key(query, location, limit, self.SEARCH_FILTERS)
+        results = self.cache.get_or_load(key, lambda: self._search_jobs_uncached(query, location, limit))
+        # Cached results may come from a differently phrased query; report the one the caller asked for
+        return [dict(job, query=query) for job in results]
+    
+    def _search_jobs_uncached(self, query: str, location: str = "", limit: int = 10) -> List[Dict[str, Any]]:
+        """Search for jobs on LinkedIn without consulting the cache."""
+        # First try with requests (more reliable), retrying throttled requests after the scheduler's backoff
+        for attempt in range(LINKEDIN_MAX_RETRIES + 1):
+            try:
+                results = self._search_jobs_with_requests(query, location, limit)
+                break
+            except ThrottledError as e:
+                # A host blocked for longer than the scheduler waits won't unblock between retries
+                if attempt == LINKEDIN_MAX_RETRIES or e.status_code is None:
+                    raise
         if results:
             return results
             
-        # Fall back to Selenium if requests approach didn't work
+        # Fall back to Selenium if requests approach didn't work; the driver is
+        # per-instance state, so serialize access for background revalidation
+        with self._driver_lock:
+            return self._search_jobs_with_selenium(query, location, limit)
+    
+    def _search_jobs_with_selenium(self, query: str, location: str = "", limit: int = 10) -> List[Dict[str, Any]]:
+        """
+        Search for jobs by driving a browser with Selenium.
+        
+        Args:
+            query: Job search query
+            location: Location for job search
+            limit: Maximum number of job listings to return
+            
+        Returns:
+            List of job listings
+        """
+        from selenium.webdriver.common.by import By
+        from selenium.webdriver.support import expected_conditions as EC
+        from selenium.webdriver.support.ui import WebDriverWait
+
         if not self.driver:
             self._setup_driver()
             
@@ -156,11 +230,7 @@ class LinkedInJobSearch:
             
         try:
             # Encode query parameters
-            params = {
-                "keywords": query,
-                "sortBy": "R",  # Sort by relevance
-                "f_WT": "2",  # Remote jobs
-            }
+            params = {"keywords": query, **self.SEARCH_FILTERS}
             
             if location:
                 params["location"] = location
@@ -168,6 +238,7 @@ class LinkedInJobSearch:
             url = f"{LINKEDIN_JOBS_URL}?{urllib.parse.urlencode(params)}"
             
             # Navigate to the search URL
+            self.scheduler.acquire(self.host)
             self.driver.get(url)
             
             # Wait for job listings to load
@@ -201,12 +272,20 @@ class LinkedInJobSearch:
                     continue
                     
             return results
+        except ThrottledError:
+            raise
         except Exception as e:
             raise Exception(f"Error searching for jobs: {e}")
         finally:
             self._close_driver()
             
-    def search_multiple_queries(self, queries: List[str], location: str = "", limit_per_query: int = 5) -> pd.DataFrame:
+    def search_multiple_queries(
+        self,
+        queries: List[str],
+        location: str = "",
+        limit_per_query: int = 5,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> "pd.DataFrame":
         """
         Search for jobs using multiple queries and return results as a DataFrame.
         
@@ -214,27 +293,31 @@ class LinkedInJobSearch:
             queries: List of job search queries
             location: Location for job search
             limit_per_query: Maximum number of job listings per query
+            progress: Called with (queries searched, total queries) after each
+                query; an exception it raises stops the search
             
         Returns:
-            DataFrame with job listings
+            DataFrame with job listings (title, company, location and query are
+            categorical); queries that stayed throttled are listed in
+            df.attrs["throttled_queries"]
         """
-        all_results = []
+        # Collect into a columnar table, skipping jobs already found by an earlier query
+        jobs = JobTable(unique_by="url")
+        throttled_queries = []
         
-        for query in queries:
+        for searched, query in enumerate(queries, start=1):
+            # Requests are paced by the shared politeness scheduler
             try:
                 results = self.search_jobs(query, location, limit_per_query)
-                all_results.extend(results)
-                # Add a small delay to avoid rate limiting
-                time.sleep(1)
+                jobs.extend(results)
+            except ThrottledError as e:
+                print(f"Search for '{query}' was throttled: {e}")
+                throttled_queries.append(query)
             except Exception as e:
                 print(f"Error searching for '{query}': {e}")
-                continue
+            if progress is not None:
+                progress(searched, len(queries))
                 
-        # Convert to DataFrame
-        if all_results:
-            df = pd.DataFrame(all_results)
-            # Remove duplicates based on URL
-            df = df.drop_duplicates(subset=["url"])
-            return df
-        else:
-            return pd.DataFrame(columns=["title", "company", "location", "url", "query"])
\ No newline at end of file
+        df = jobs.to_pandas()
+        df.attrs["throttled_queries"] = throttled_queries
+        return df
\ No newline at end of file
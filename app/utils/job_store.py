@@ -0,0 +1,251 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Dict, Any, Optional, Tuple
+from .admission import DEFAULT_TENANT
+from .config import JOB_STORE_PATH, ensure_data_dir
+
+_SAVED_SEARCHES = """
+CREATE TABLE IF NOT EXISTS {table} (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    owner TEXT NOT NULL,
+    query TEXT NOT NULL,
+    location TEXT NOT NULL DEFAULT '',
+    limit_per_query INTEGER NOT NULL DEFAULT 5,
+    created_at REAL NOT NULL,
+    last_run_at REAL,
+    next_run_at REAL NOT NULL DEFAULT 0,
+    UNIQUE (owner, query, location)
+);
+"""
+
+_SCHEMA = _SAVED_SEARCHES.format(table="saved_searches") + """
+CREATE TABLE IF NOT EXISTS search_runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    search_id INTEGER NOT NULL REFERENCES saved_searches(id) ON DELETE CASCADE,
+    started_at REAL NOT NULL,
+    finished_at REAL NOT NULL,
+    result_count INTEGER NOT NULL,
+    new_count INTEGER NOT NULL,
+    error TEXT
+);
+CREATE TABLE IF NOT EXISTS search_results (
+    search_id INTEGER NOT NULL REFERENCES saved_searches(id) ON DELETE CASCADE,
+    url TEXT NOT NULL,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    query TEXT,
+    first_seen_run INTEGER NOT NULL,
+    last_seen_run INTEGER NOT NULL,
+    first_seen_at REAL NOT NULL,
+    PRIMARY KEY (search_id, url)
+);
+CREATE INDEX IF NOT EXISTS idx_search_results_run ON search_results (search_id, last_seen_run);
+"""
+
+
+class JobStore:
+    """SQLite-backed local store for saved searches and their incrementally refreshed results."""
+
+    def __init__(self, path: str = JOB_STORE_PATH):
+        """
+        Open (and create if needed) the job store.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            ensure_data_dir(os.path.dirname(os.path.abspath(path)))
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        with self._lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._migrate()
+            self._conn.execute("PRAGMA foreign_keys=ON")
+            with self._conn:
+                self._conn.executescript(_SCHEMA)
+
+    def _migrate(self):
+        """
+        Give saved searches of stores created before they had owners an owner.
+
+        Those searches can't be attributed to anyone, so they go to DEFAULT_TENANT
+        rather than being shown to every user. The caller holds the lock.
+        """
+        columns = [row["name"] for row in self._conn.execute("PRAGMA table_info(saved_searches)")]
+        if not columns or "owner" in columns:
+            return
+        # Rebuilt with foreign keys off, so dropping the old table keeps the runs and results pointing at it
+        self._conn.execute("PRAGMA foreign_keys=OFF")
+        with self._conn:
+            self._conn.executescript(_SAVED_SEARCHES.format(table="saved_searches_new"))
+            self._conn.execute(
+                "INSERT INTO saved_searches_new "
+                "(id, owner, query, location, limit_per_query, created_at, last_run_at, next_run_at) "
+                "SELECT id, ?, query, location, limit_per_query, created_at, last_run_at, next_run_at "
+                "FROM saved_searches",
+                (DEFAULT_TENANT,),
+            )
+            self._conn.execute("DROP TABLE saved_searches")
+            self._conn.execute("ALTER TABLE saved_searches_new RENAME TO saved_searches")
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def add_saved_search(self, owner: str, query: str, location: str = "", limit_per_query: int = 5) -> int:
+        """
+        Save a search so the crawler refreshes it in the background.
+
+        Args:
+            owner: Tenant (session or API client) the search belongs to
+            query: Job search query
+            location: Location for job search
+            limit_per_query: Maximum number of job listings to fetch per run
+
+        Returns:
+            ID of the saved search (existing ID if it was already saved)
+        """
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO saved_searches (owner, query, location, limit_per_query, created_at) "
+                "VALUES (?, ?, ?, ?, ?) "
+                "ON CONFLICT (owner, query, location) DO UPDATE SET limit_per_query = excluded.limit_per_query",
+                (owner, query, location, limit_per_query, time.time()),
+            )
+            row = self._conn.execute(
+                "SELECT id FROM saved_searches WHERE owner = ? AND query = ? AND location = ?",
+                (owner, query, location),
+            ).fetchone()
+            return row["id"]
+
+    def remove_saved_search(self, owner: str, search_id: int):
+        """Delete one of an owner's saved searches together with its runs and results."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM saved_searches WHERE id = ? AND owner = ?", (search_id, owner))
+
+    def list_saved_searches(self, owner: str) -> List[Dict[str, Any]]:
+        """Return an owner's saved searches, oldest first."""
+        with self._lock:
+            rows = self._conn.execute("SELECT * FROM saved_searches WHERE owner = ? ORDER BY id", (owner,)).fetchall()
+        return [dict(row) for row in rows]
+
+    def due_searches(self, now: Optional[float] = None) -> List[Dict[str, Any]]:
+        """Return the saved searches of every owner whose next refresh time has passed."""
+        now = time.time() if now is None else now
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT * FROM saved_searches WHERE next_run_at <= ? ORDER BY next_run_at", (now,)
+            ).fetchall()
+        return [dict(row) for row in rows]
+
+    def schedule(self, search_id: int, next_run_at: float):
+        """Set the next refresh time of a saved search."""
+        with self._lock, self._conn:
+            self._conn.execute("UPDATE saved_searches SET next_run_at = ? WHERE id = ?", (next_run_at, search_id))
+
+    def record_run(
+        self,
+        search_id: int,
+        jobs: List[Dict[str, Any]],
+        started_at: float,
+        error: Optional[str] = None,
+    ) -> Tuple[Optional[int], List[str]]:
+        """
+        Store the results of a crawl run and diff them against previous runs.
+
+        Results are upserted by URL, so unchanged postings only have their
+        last-seen run bumped. Runs of a search removed while it was being
+        refreshed are discarded.
+
+        Args:
+            search_id: ID of the saved search
+            jobs: Job listings returned by the run
+            started_at: Time the run started
+            error: Error message if the run failed
+
+        Returns:
+            Tuple of the run ID (None if the search was removed) and the URLs that
+            were never seen before for this search
+        """
+        now = time.time()
+        with self._lock, self._conn:
+            if self._conn.execute("SELECT 1 FROM saved_searches WHERE id = ?", (search_id,)).fetchone() is None:
+                return None, []
+            known = {
+                row["url"]
+                for row in self._conn.execute("SELECT url FROM search_results WHERE search_id = ?", (search_id,))
+            }
+            new_urls = [job["url"] for job in jobs if job["url"] not in known]
+            run_id = self._conn.execute(
+                "INSERT INTO search_runs (search_id, started_at, finished_at, result_count, new_count, error) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (search_id, started_at, now, len(jobs), len(new_urls), error),
+            ).lastrowid
+            self._conn.executemany(
+                "INSERT INTO search_results "
+                "(search_id, url, title, company, location, query, first_seen_run, last_seen_run, first_seen_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?) "
+                "ON CONFLICT (search_id, url) DO UPDATE SET last_seen_run = excluded.last_seen_run, "
+                "title = excluded.title, company = excluded.company, location = excluded.location",
+                [
+                    (search_id, job["url"], job.get("title"), job.get("company"), job.get("location"),
+                     job.get("query"), run_id, run_id, now)
+                    for job in jobs
+                ],
+            )
+            self._conn.execute("UPDATE saved_searches SET last_run_at = ? WHERE id = ?", (now, search_id))
+        return run_id, new_urls
+
+    def get_results(self, owner: str, search_id: Optional[int] = None) -> List[Dict[str, Any]]:
+        """
+        Return the results of the latest successful run of each of an owner's saved searches.
+
+        Args:
+            owner: Tenant whose saved searches' results are returned
+            search_id: Restrict to a single saved search
+
+        Returns:
+            List of job listings; 'is_new' marks postings first seen in the latest
+            run (never set on a search's first run, which has nothing to diff against)
+        """
+        sql = (
+            "SELECT r.search_id, r.url, r.title, r.company, r.location, r.query, r.first_seen_at, "
+            "r.first_seen_run = latest.run_id AND latest.run_id > latest.first_run_id AS is_new "
+            "FROM search_results r "
+            "JOIN (SELECT search_id, MAX(id) AS run_id, MIN(id) AS first_run_id "
+            "FROM search_runs WHERE error IS NULL GROUP BY search_id) latest "
+            "ON r.search_id = latest.search_id AND r.last_seen_run = latest.run_id "
+            "JOIN saved_searches s ON s.id = r.search_id "
+            "WHERE s.owner = ?"
+        )
+        params: Tuple = (owner,)
+        if search_id is not None:
+            sql += " AND r.search_id = ?"
+            params += (search_id,)
+        sql += " ORDER BY is_new DESC, r.first_seen_at DESC"
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [dict(row, is_new=bool(row["is_new"])) for row in rows]
+
+    def urls_by_query(self) -> Dict[Tuple[str, str], set]:
+        """
+        Return every URL the crawler has ever found, grouped by the query and location searched.
+
+        Returns:
+            Mapping of (query, location of the saved search) to the set of job URLs returned for it
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT r.query, s.location AS searched_location, r.url "
+                "FROM search_results r JOIN saved_searches s ON s.id = r.search_id"
+            ).fetchall()
+        urls: Dict[Tuple[str, str], set] = {}
+        for row in rows:
+            urls.setdefault((row["query"] or "", row["searched_location"]), set()).add(row["url"])
+        return urls
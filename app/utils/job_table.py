@@ -0,0 +1,259 @@
+import sys
+from array import array
+from collections.abc import Mapping
+from typing import List, Dict, Any, Iterable, Iterator, Optional, Tuple, Union, TYPE_CHECKING
+
+# numpy and pandas are only needed for the conversions, so they are imported there
+if TYPE_CHECKING:
+    import numpy as np
+    import pandas as pd
+
+# Columns whose values repeat heavily and are stored dictionary-encoded
+CATEGORICAL_COLUMNS = ("title", "company", "location", "query")
+# Columns that are (nearly) unique per job and stored as plain strings; the
+# description is only listed as a column once some job has one
+STRING_COLUMNS = ("url", "description")
+_OPTIONAL_COLUMNS = frozenset({"description"})
+
+
+class _Dictionary:
+    """Dictionary encoding of one column: each distinct value is stored once and rows hold int32 codes."""
+
+    __slots__ = ("categories", "index", "codes")
+
+    def __init__(self):
+        self.categories: List[str] = []
+        self.index: Dict[str, int] = {}
+        self.codes = array("i")
+
+    def encode(self, value: Any) -> int:
+        value = "" if value is None else str(value)
+        code = self.index.get(value)
+        if code is None:
+            code = self.index[value] = len(self.categories)
+            self.categories.append(sys.intern(value))
+        return code
+
+    def append(self, value: Any):
+        code = self.encode(value)
+        try:
+            self.codes.append(code)
+        except BufferError:
+            # A pandas or Arrow view still shares the current codes; continue on a copy
+            self.codes = array("i", self.codes)
+            self.codes.append(code)
+
+
+class JobRow(Mapping):
+    """Read-only view of one row of a JobTable; reads like the job dictionary it replaces."""
+
+    __slots__ = ("_table", "_row")
+
+    def __init__(self, table: "JobTable", row: int):
+        self._table = table
+        self._row = row
+
+    def __getitem__(self, column: str) -> Any:
+        return self._table.value(column, self._row)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._table.columns)
+
+    def __len__(self) -> int:
+        return len(self._table.columns)
+
+    def __repr__(self) -> str:
+        return f"JobRow({self.to_dict()!r})"
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the row as a plain dictionary."""
+        return {column: self._table.value(column, self._row) for column in self._table.columns}
+
+
+class JobTable:
+    """
+    Columnar, memory-compact container of job listings.
+
+    Titles, companies, locations and queries repeat heavily across jobs, so they are
+    dictionary-encoded (one string per distinct value plus an int32 code per row).
+    URLs and descriptions are kept as plain string columns, and any other field as an
+    object column. Rows are exposed as lightweight JobRow views, and the table converts
+    to pandas categoricals or Arrow dictionary arrays without copying any strings.
+    """
+
+    def __init__(self, unique_by: Optional[str] = None):
+        """
+        Initialize an empty table.
+
+        Args:
+            unique_by: Column whose value identifies a job (e.g. "url"); rows repeating
+                a value already in the table are skipped
+        """
+        self.unique_by = unique_by
+        self._dictionaries: Dict[str, _Dictionary] = {column: _Dictionary() for column in CATEGORICAL_COLUMNS}
+        self._strings: Dict[str, List[Any]] = {column: [] for column in STRING_COLUMNS}
+        self._extra: Dict[str, List[Any]] = {}
+        self._seen: set = set()
+        self._present = {column for column in STRING_COLUMNS if column not in _OPTIONAL_COLUMNS}
+        self._length = 0
+
+    @classmethod
+    def from_records(cls, records: Iterable[Dict[str, Any]], unique_by: Optional[str] = None) -> "JobTable":
+        """Build a table from job dictionaries."""
+        table = cls(unique_by=unique_by)
+        table.extend(records)
+        return table
+
+    @property
+    def columns(self) -> Tuple[str, ...]:
+        """Columns present in the table."""
+        present = tuple(column for column in STRING_COLUMNS if column in self._present)
+        return CATEGORICAL_COLUMNS + present + tuple(self._extra)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[JobRow]:
+        return (JobRow(self, row) for row in range(self._length))
+
+    def __getitem__(self, row: Union[int, slice]) -> Union[JobRow, List[JobRow]]:
+        if isinstance(row, slice):
+            return [JobRow(self, index) for index in range(*row.indices(self._length))]
+        if row < 0:
+            row += self._length
+        if not 0 <= row < self._length:
+            raise IndexError(row)
+        return JobRow(self, row)
+
+    def append(self, job: Dict[str, Any]) -> bool:
+        """
+        Append a job.
+
+        Returns:
+            True if the job was added, False if it repeated a unique_by value
+        """
+        if self.unique_by is not None:
+            key = job.get(self.unique_by)
+            if key in self._seen:
+                return False
+            self._seen.add(key)
+
+        for column, dictionary in self._dictionaries.items():
+            dictionary.append(job.get(column))
+        for column, values in self._strings.items():
+            value = job.get(column) or ""
+            if value:
+                self._present.add(column)
+            values.append(value)
+        for column, value in job.items():
+            if column in self._dictionaries or column in self._strings:
+                continue
+            values = self._extra.get(column)
+            if values is None:
+                values = self._extra[column] = [None] * self._length
+            values.append(value)
+        self._length += 1
+        for values in self._extra.values():
+            if len(values) < self._length:
+                values.append(None)
+        return True
+
+    def extend(self, jobs: Iterable[Dict[str, Any]]) -> int:
+        """Append many jobs; returns how many were added."""
+        return sum(self.append(job) for job in jobs)
+
+    def value(self, column: str, row: int) -> Any:
+        """Return a single cell."""
+        dictionary = self._dictionaries.get(column)
+        if dictionary is not None:
+            return dictionary.categories[dictionary.codes[row]]
+        values = self._strings.get(column)
+        if values is None:
+            values = self._extra.get(column)
+            if values is None:
+                raise KeyError(column)
+        return values[row]
+
+    def column(self, column: str) -> List[Any]:
+        """Return a whole column as a list of values."""
+        dictionary = self._dictionaries.get(column)
+        if dictionary is not None:
+            categories = dictionary.categories
+            return [categories[code] for code in dictionary.codes]
+        if column in self._strings:
+            return list(self._strings[column])
+        if column in self._extra:
+            return list(self._extra[column])
+        raise KeyError(column)
+
+    def categories(self, column: str) -> List[str]:
+        """Return the distinct values of a dictionary-encoded column, in code order."""
+        return list(self._dictionaries[column].categories)
+
+    def codes(self, column: str) -> "np.ndarray":
+        """Return the codes of a dictionary-encoded column as an int32 array sharing the table's memory."""
+        import numpy as np
+
+        codes = self._dictionaries[column].codes
+        if not codes:
+            return np.zeros(0, dtype=np.int32)
+        return np.frombuffer(codes, dtype=np.int32)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Return every row as a plain dictionary."""
+        return [row.to_dict() for row in self]
+
+    def to_pandas(self) -> "pd.DataFrame":
+        """
+        Convert to a DataFrame with categorical columns for the dictionary-encoded fields.
+
+        Categories are shared with the table rather than re-encoded; pandas narrows the
+        int32 codes to its smallest code dtype, which is the only data copied.
+        """
+        import pandas as pd
+
+        data: Dict[str, Any] = {}
+        for column in self.columns:
+            dictionary = self._dictionaries.get(column)
+            if dictionary is not None:
+                data[column] = pd.Categorical.from_codes(
+                    self.codes(column), categories=pd.Index(dictionary.categories, dtype=object), validate=False
+                )
+            else:
+                data[column] = self._strings[column] if column in self._strings else self._extra[column]
+        return pd.DataFrame(data, columns=list(self.columns))
+
+    def to_arrow(self):
+        """
+        Convert to an Arrow table with dictionary arrays for the dictionary-encoded fields.
+
+        Requires pyarrow; the dictionary indices are built from the table's code arrays without copying.
+        """
+        try:
+            import pyarrow as pa
+        except ImportError as e:
+            raise ImportError("pyarrow is required for JobTable.to_arrow(); install it with 'pip install pyarrow'") from e
+
+        arrays = []
+        for column in self.columns:
+            dictionary = self._dictionaries.get(column)
+            if dictionary is not None:
+                arrays.append(pa.DictionaryArray.from_arrays(
+                    pa.array(self.codes(column), type=pa.int32()),
+                    pa.array(dictionary.categories, type=pa.string()),
+                ))
+            elif column in self._strings:
+                arrays.append(pa.array(self._strings[column], type=pa.string()))
+            else:
+                arrays.append(pa.array(self._extra[column]))
+        return pa.Table.from_arrays(arrays, names=list(self.columns))
+
+    def memory_usage(self) -> int:
+        """Approximate memory held by the table, in bytes."""
+        total = 0
+        for dictionary in self._dictionaries.values():
+            total += dictionary.codes.itemsize * len(dictionary.codes)
+            total += sum(sys.getsizeof(value) for value in dictionary.categories)
+        for values in list(self._strings.values()) + list(self._extra.values()):
+            total += sys.getsizeof(values) + sum(sys.getsizeof(value) for value in values)
+        return total
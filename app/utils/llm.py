@@ -1,15 +1,18 @@
-import requests
 import json
 from typing import List, Dict, Any, Optional
-from .config import OPENROUTER_API_KEY, OPENROUTER_MODEL_1
+from .config import OPENROUTER_MODEL_1, OPENROUTER_TIMEOUT, require_api_key
+from .fingerprint import canonical_json
+from .resources import get_resource
 
 class OpenRouterClient:
     """Client for interacting with the OpenRouter API."""
     
-    def __init__(self, api_key: str = OPENROUTER_API_KEY, model: str = OPENROUTER_MODEL_1):
-        self.api_key = api_key
+    def __init__(self, api_key: Optional[str] = None, model: str = OPENROUTER_MODEL_1, admission=None):
+        self.api_key = api_key or require_api_key()
         self.model = model
         self.base_url = "https://openrouter.ai/api/v1"
+        # Requests from every session share one concurrency budget and per-tenant rate limits
+        self.admission = admission or get_resource("admission")
         
     def chat_completion(
         self, 
@@ -27,12 +30,10 @@ class OpenRouterClient:
             
         Returns:
             Response from the API
+            
+        Raises:
+            AdmissionRejected: If the current tenant's request couldn't be admitted in time
         """
-        headers = {
-            "Authorization": f"Bearer {self.api_key}",
-            "Content-Type": "application/json"
-        }
-        
         payload = {
             "model": self.model,
             "messages": messages,
@@ -40,10 +41,24 @@ class OpenRouterClient:
             "max_tokens": max_tokens
         }
         
+        with self.admission.admit():
+            return self._post(payload)
+    
+    def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a chat completion payload to OpenRouter; stand-ins (e.g. in benchmarks) replace this transport."""
+        # Imported here so importing the client (e.g. in mock mode) stays cheap
+        import requests
+
+        headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        
         response = requests.post(
             f"{self.base_url}/chat/completions",
             headers=headers,
-            data=json.dumps(payload)
+            data=json.dumps(payload),
+            timeout=OPENROUTER_TIMEOUT
         )
         
         if response.status_code != 200:
@@ -106,7 +121,7 @@ class OpenRouterClient:
         """
         prompt = [
             {"role": "system", "content": "You are an expert job search assistant. Your task is to generate effective LinkedIn job search queries based on CV analysis."},
-            {"role": "user", "content": f"Based on this CV analysis, generate 3-5 effective LinkedIn job search queries. Each query should be optimized to find relevant job opportunities. Return only the list of queries, one per line.\n\nCV Analysis: {json.dumps(cv_analysis, indent=2)}"}
+            {"role": "user", "content": f"Based on this CV analysis, generate 3-5 effective LinkedIn job search queries. Each query should be optimized to find relevant job opportunities. Return only the list of queries, one per line.\n\nCV Analysis: {canonical_json(cv_analysis)}"}
         ]
         
         response = self.chat_completion(prompt, temperature=0.5)
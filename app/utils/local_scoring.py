@@ -0,0 +1,398 @@
+import re
+from datetime import date
+from typing import List, Dict, Any, Optional, Tuple, Set, Iterable
+from .ranking import flatten_text
+from .skills import SkillOntology, get_skill_ontology, flatten_skills
+
+# Weights of the sub-scores in the overall score
+SKILLS_WEIGHT = 0.5
+EXPERIENCE_WEIGHT = 0.3
+EDUCATION_WEIGHT = 0.2
+
+# Skills mentioned after one of these markers are nice-to-have and count half
+_OPTIONAL_MARKERS = re.compile(r"nice to have|preferred|bonus|a plus|desirable", re.IGNORECASE)
+_OPTIONAL_WEIGHT = 0.5
+
+# Seniority levels inferred from job titles
+_SENIORITY_PATTERNS: List[Tuple[int, re.Pattern]] = [
+    (0, re.compile(r"\b(intern|junior|jr|graduate|entry[- ]level|trainee)\b", re.IGNORECASE)),
+    (2, re.compile(r"\b(senior|sr)\b", re.IGNORECASE)),
+    (3, re.compile(r"\b(lead|staff|head)\b", re.IGNORECASE)),
+    (4, re.compile(r"\b(principal|director|architect|vp|chief)\b", re.IGNORECASE)),
+]
+_DEFAULT_SENIORITY = 1
+_SENIORITY_NAMES = {0: "junior", 1: "mid-level", 2: "senior", 3: "lead", 4: "principal"}
+
+# Education levels, highest first so the strongest mention wins
+_EDUCATION_PATTERNS: List[Tuple[int, re.Pattern]] = [
+    (4, re.compile(r"\b(phd|ph\.d|doctorate|doctoral)\b", re.IGNORECASE)),
+    (3, re.compile(r"\b(master'?s?|msc|m\.sc|mba|meng|m\.s)\b", re.IGNORECASE)),
+    (2, re.compile(r"\b(bachelor'?s?|bsc|b\.sc|ba|bs|b\.s|beng|undergraduate degree)\b", re.IGNORECASE)),
+    (1, re.compile(r"\b(associate'?s? degree|diploma)\b", re.IGNORECASE)),
+]
+_NO_DEGREE = re.compile(r"\b(no (formal )?degree|equivalent (practical )?experience)\b", re.IGNORECASE)
+_EDUCATION_NAMES = {0: "no degree", 1: "associate degree", 2: "bachelor's degree", 3: "master's degree", 4: "PhD"}
+
+# Which sub-scores each CV analysis field feeds; skills are also extracted from the experience text
+DIMENSIONS = ("skills", "experience", "education")
+CV_FIELD_DIMENSIONS = {
+    "skills": ("skills",),
+    "experience": ("skills", "experience"),
+    "job_titles": ("experience",),
+    "education": ("education",),
+}
+
+_YEARS_REQUIRED = re.compile(r"(\d{1,2})\s*\+?\s*(?:-\s*\d{1,2}\s*)?(?:years?|yrs?)", re.IGNORECASE)
+_YEAR_RANGE = re.compile(r"\b((?:19|20)\d{2})\s*(?:-|–|to)\s*((?:19|20)\d{2}|present|current|now)\b", re.IGNORECASE)
+
+
+def _seniority(title: str) -> int:
+    level = _DEFAULT_SENIORITY
+    for candidate, pattern in _SENIORITY_PATTERNS:
+        if pattern.search(title):
+            level = candidate
+    return level
+
+
+def _education_level(text: str) -> Optional[int]:
+    for level, pattern in _EDUCATION_PATTERNS:
+        if pattern.search(text):
+            return level
+    return None
+
+
+def _experience_years(experience: Any) -> float:
+    """Estimate total years of experience from an LLM-shaped experience value."""
+    explicit = 0.0
+    entries = experience if isinstance(experience, list) else [experience]
+    for entry in entries:
+        if isinstance(entry, dict):
+            for key in ("years", "duration_years", "years_of_experience"):
+                value = entry.get(key)
+                if value is None or value == "":
+                    continue
+                try:
+                    explicit += float(value)
+                    break
+                except (TypeError, ValueError):
+                    continue
+
+    text = flatten_text(experience)
+    mentioned = max((int(years) for years in _YEARS_REQUIRED.findall(text)), default=0)
+
+    # Merge date ranges ("2015 - 2019", "2019 - present") into a covered span
+    current_year = date.today().year
+    ranges = []
+    for start, end in _YEAR_RANGE.findall(text):
+        end_year = current_year if not end[0].isdigit() else int(end)
+        if int(start) <= end_year:
+            ranges.append((int(start), end_year))
+    spanned = 0
+    spanned_end = None
+    for start, end in sorted(ranges):
+        if spanned_end is not None and start < spanned_end:
+            spanned += max(0, end - spanned_end)
+            spanned_end = max(spanned_end, end)
+        else:
+            spanned += end - start
+            spanned_end = end
+
+    return float(max(explicit, mentioned, spanned))
+
+
+class LocalCompatibilityScorer:
+    """
+    Deterministic, LLM-free compatibility scoring between a CV analysis and a job.
+
+    Produces the same result shape as AdvancedFeatures.calculate_job_match_score,
+    so it can be shown as an instant first pass or used when the LLM is unavailable.
+    """
+
+    def __init__(self, skill_ontology: Optional[SkillOntology] = None):
+        """
+        Initialize the local scorer.
+
+        Args:
+            skill_ontology: Skill ontology used to extract and compare skills
+        """
+        self.skill_ontology = skill_ontology or get_skill_ontology()
+
+    def build_profile(self, cv_analysis: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Extract the structured facts the scorer needs from a CV analysis.
+
+        Building the profile once and reusing it keeps scoring many jobs cheap.
+
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+
+        Returns:
+            Dictionary with skill IDs, years of experience, seniority and education level
+        """
+        ontology = self.skill_ontology
+        skill_ids = [
+            skill_id for skill in flatten_skills(cv_analysis.get("skills")) for skill_id in ontology.entry_skill_ids(skill)
+        ]
+        skill_ids.extend(ontology.skill_ids(flatten_text(cv_analysis.get("experience"))))
+        # A tool counts for the broader skills it implies (Keras -> Deep Learning)
+        skill_ids = ontology.implied(skill_ids)
+
+        titles = flatten_text(cv_analysis.get("job_titles")) + " " + flatten_text(cv_analysis.get("experience"))
+        return {
+            "skill_ids": skill_ids,
+            "years": _experience_years(cv_analysis.get("experience")),
+            "seniority": max(
+                [_seniority(title) for title in flatten_skills(cv_analysis.get("job_titles"))] or [_seniority(titles)]
+            ),
+            "education": _education_level(flatten_text(cv_analysis.get("education"))) or 0,
+        }
+
+    def job_requirements(self, job_description: str, job_title: str = "") -> Dict[str, Any]:
+        """
+        Extract what a job asks for; parsing a job once lets it be re-scored against many CVs.
+
+        Args:
+            job_description: The job description text
+            job_title: The job title (used for seniority)
+
+        Returns:
+            Dictionary with weighted skill IDs, required years, seniority and education level
+        """
+        job_text = f"{job_title}\n{job_description}"
+        optional_from = _OPTIONAL_MARKERS.search(job_text)
+        optional_start = optional_from.start() if optional_from else len(job_text)
+
+        skills: Dict[str, float] = {}
+        for match in self.skill_ontology.extract(job_text):
+            weight = _OPTIONAL_WEIGHT if match.start >= optional_start else 1.0
+            skills[match.skill_id] = max(skills.get(match.skill_id, 0.0), weight)
+
+        return {
+            "skills": skills,
+            "years": min((int(years) for years in _YEARS_REQUIRED.findall(job_text)), default=0),
+            "seniority": _seniority(job_title or job_description.split("\n", 1)[0]),
+            "education": 0 if _NO_DEGREE.search(job_text) else (_education_level(job_text) or 0),
+        }
+
+    def score_skills(self, profile: Dict[str, Any], requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Score the weighted overlap between the CV's skills and the job's required and optional skills."""
+        weights = requirements["skills"]
+        if not weights:
+            return {"score": 50, "matched_skills": [], "missing_skills": []}
+
+        have = profile["skill_ids"]
+        matched = [skill_id for skill_id in weights if skill_id in have]
+        missing = [skill_id for skill_id in weights if skill_id not in have]
+        score = 100 * sum(weights[skill_id] for skill_id in matched) / sum(weights.values())
+        return {
+            "score": int(round(score)),
+            "matched_skills": [self.skill_ontology.name(skill_id) for skill_id in matched],
+            "missing_skills": [self.skill_ontology.name(skill_id) for skill_id in missing],
+        }
+
+    def score_experience(self, profile: Dict[str, Any], requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Score years of experience and seniority against the job's requirements."""
+        required_years = requirements["years"]
+        required_seniority = requirements["seniority"]
+        missing = []
+
+        score = 100.0
+        if required_years and profile["years"] < required_years:
+            score = 100.0 * profile["years"] / required_years
+            missing.append(f"{required_years}+ years of experience (CV shows about {profile['years']:.0f})")
+        seniority_gap = required_seniority - profile["seniority"]
+        if seniority_gap > 0:
+            score -= 15 * seniority_gap
+            missing.append(f"Experience at {_SENIORITY_NAMES[required_seniority]} level")
+
+        return {"score": int(round(max(score, 0))), "missing_experiences": missing}
+
+    def score_education(self, profile: Dict[str, Any], requirements: Dict[str, Any]) -> Dict[str, Any]:
+        """Score the CV's highest degree against the job's required degree."""
+        required = requirements["education"]
+        gap = required - profile["education"]
+        if gap <= 0:
+            return {"score": 100, "missing_education": []}
+        return {"score": max(0, 100 - 35 * gap), "missing_education": [_EDUCATION_NAMES[required]]}
+
+    def score_profile(self, profile: Dict[str, Any], job_description: str, job_title: str = "") -> Dict[str, Any]:
+        """
+        Score a prebuilt CV profile against a job.
+
+        Args:
+            profile: Profile from build_profile
+            job_description: The job description text
+            job_title: The job title (used for seniority)
+
+        Returns:
+            Dictionary with compatibility scores, missing skills/experiences and recommendations
+        """
+        requirements = self.job_requirements(job_description, job_title)
+        return self.combine(
+            self.score_skills(profile, requirements),
+            self.score_experience(profile, requirements),
+            self.score_education(profile, requirements),
+        )
+
+    def combine(self, skills: Dict[str, Any], experience: Dict[str, Any], education: Dict[str, Any]) -> Dict[str, Any]:
+        """Combine sub-scores into a result shaped like the LLM job match analysis."""
+        overall = (
+            SKILLS_WEIGHT * skills["score"]
+            + EXPERIENCE_WEIGHT * experience["score"]
+            + EDUCATION_WEIGHT * education["score"]
+        )
+
+        recommendations = []
+        if skills["missing_skills"]:
+            recommendations.append(f"Add or highlight experience with {', '.join(skills['missing_skills'][:5])}.")
+        if skills["matched_skills"]:
+            recommendations.append(f"Emphasize your {', '.join(skills['matched_skills'][:3])} experience.")
+        recommendations.extend(f"Address the gap: {gap}." for gap in experience["missing_experiences"])
+        recommendations.extend(f"The role asks for a {degree}." for degree in education["missing_education"])
+
+        return {
+            "overall_score": int(round(overall)),
+            "skills_match": skills,
+            "experience_match": experience,
+            "education_match": education,
+            "recommendations": recommendations,
+            "source": "local",
+        }
+
+    def score(self, cv_analysis: Dict[str, Any], job_description: str, job_title: str = "") -> Dict[str, Any]:
+        """
+        Score a CV analysis against a job.
+
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+            job_description: The job description text
+            job_title: The job title (used for seniority)
+
+        Returns:
+            Dictionary with compatibility scores, missing skills/experiences and recommendations
+        """
+        return self.score_profile(self.build_profile(cv_analysis), job_description, job_title)
+
+
+def diff_cv_analysis(old: Optional[Dict[str, Any]], new: Dict[str, Any]) -> Set[str]:
+    """
+    Work out which scoring dimensions differ between two CV analyses.
+
+    Args:
+        old: Previous CV analysis (None if there is none)
+        new: Current CV analysis
+
+    Returns:
+        Subset of DIMENSIONS whose inputs changed
+    """
+    if old is None:
+        return set(DIMENSIONS)
+    changed: Set[str] = set()
+    for field, dimensions in CV_FIELD_DIMENSIONS.items():
+        if old.get(field) != new.get(field):
+            changed.update(dimensions)
+    return changed
+
+
+class IncrementalScorer:
+    """
+    Keeps per-job local sub-scores so that editing the CV only recomputes what changed.
+
+    A CV change is diffed into the skills, experience and education dimensions, and
+    only the sub-scores of jobs that the change can affect are recomputed; e.g. adding
+    one skill only re-scores the skills of jobs that ask for it.
+    """
+
+    def __init__(self, scorer: Optional[LocalCompatibilityScorer] = None, max_jobs: int = 100_000):
+        """
+        Initialize the incremental scorer.
+
+        Args:
+            scorer: Local scorer used to compute the sub-scores
+            max_jobs: Number of jobs whose requirements and sub-scores are kept
+        """
+        self.scorer = scorer or LocalCompatibilityScorer()
+        self.max_jobs = max_jobs
+        self.cv_analysis: Optional[Dict[str, Any]] = None
+        self.profile: Optional[Dict[str, Any]] = None
+        self._requirements: Dict[str, Dict[str, Any]] = {}
+        self._sub_scores: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.last_stats: Dict[str, int] = {}
+
+    def _affected(self, dimension: str, old: Dict[str, Any], new: Dict[str, Any]):
+        """Return a predicate telling whether a job's sub-score for a dimension can have changed."""
+        if dimension == "skills":
+            delta = old["skill_ids"] ^ new["skill_ids"]
+            return lambda requirements: not delta.isdisjoint(requirements["skills"])
+        if dimension == "experience":
+            if old["years"] == new["years"]:
+                return lambda requirements: requirements["seniority"] > min(old["seniority"], new["seniority"])
+            if old["seniority"] == new["seniority"]:
+                return lambda requirements: requirements["years"] > min(old["years"], new["years"])
+            return lambda requirements: True
+        floor = min(old["education"], new["education"])
+        return lambda requirements: requirements["education"] > floor
+
+    def update(self, cv_analysis: Dict[str, Any], jobs: Iterable[Tuple[str, str, str]]) -> Dict[str, Dict[str, Any]]:
+        """
+        Score jobs against the current CV analysis, reusing unaffected sub-scores.
+
+        Args:
+            cv_analysis: Current CV analysis
+            jobs: (job key, job description, job title) tuples
+
+        Returns:
+            Mapping of job key to local compatibility result
+        """
+        scorers = {
+            "skills": self.scorer.score_skills,
+            "experience": self.scorer.score_experience,
+            "education": self.scorer.score_education,
+        }
+        profile = self.scorer.build_profile(cv_analysis)
+        changed = diff_cv_analysis(self.cv_analysis, cv_analysis)
+        if self.profile is not None:
+            # Text edits that don't change the extracted facts don't change any score
+            if self.profile["skill_ids"] == profile["skill_ids"]:
+                changed.discard("skills")
+            if (self.profile["years"], self.profile["seniority"]) == (profile["years"], profile["seniority"]):
+                changed.discard("experience")
+            if self.profile["education"] == profile["education"]:
+                changed.discard("education")
+            affected = {dimension: self._affected(dimension, self.profile, profile) for dimension in changed}
+        else:
+            affected = {}
+
+        if len(self._requirements) > self.max_jobs:
+            self._requirements.clear()
+            self._sub_scores.clear()
+
+        stats = {"jobs": 0, "new_jobs": 0, **{dimension: 0 for dimension in DIMENSIONS}}
+        results: Dict[str, Dict[str, Any]] = {}
+        for key, job_description, job_title in jobs:
+            stats["jobs"] += 1
+            sub_scores = self._sub_scores.get(key)
+            if sub_scores is None:
+                requirements = self._requirements.get(key)
+                if requirements is None:
+                    requirements = self._requirements[key] = self.scorer.job_requirements(job_description, job_title)
+                sub_scores = self._sub_scores[key] = {
+                    dimension: scorer(profile, requirements) for dimension, scorer in scorers.items()
+                }
+                stats["new_jobs"] += 1
+            else:
+                requirements = self._requirements[key]
+                for dimension, is_affected in affected.items():
+                    if is_affected(requirements):
+                        sub_scores[dimension] = scorers[dimension](profile, requirements)
+                        stats[dimension] += 1
+            results[key] = self.scorer.combine(sub_scores["skills"], sub_scores["experience"], sub_scores["education"])
+
+        # Sub-scores of jobs left out of this update are relative to an older profile
+        for key in self._sub_scores.keys() - results.keys():
+            del self._sub_scores[key]
+
+        self.cv_analysis = cv_analysis
+        self.profile = profile
+        self.last_stats = stats
+        return results
@@ -1,13 +1,40 @@
-import pandas as pd
-from typing import List, Dict, Any
+import bisect
+from typing import List, Dict, Any, Callable, Iterable, Optional, TYPE_CHECKING
+from .config import MOCK_JOB_CORPUS_SIZE, MOCK_JOB_CORPUS_SEED
+from .synthetic_jobs import SyntheticJobGenerator
+from .job_table import JobTable
+from .text import tokenize
+
+if TYPE_CHECKING:
+    import pandas as pd
 
 class MockLinkedInJobSearch:
     """Mock implementation of LinkedIn job search for testing purposes."""
     
-    def __init__(self):
-        """Initialize the mock job search."""
-        # Sample job data
-        self.sample_jobs = [
+    def __init__(self, jobs: Optional[Iterable[Dict[str, Any]]] = None, corpus_size: int = MOCK_JOB_CORPUS_SIZE,
+                 seed: int = MOCK_JOB_CORPUS_SEED):
+        """
+        Initialize the mock job search.
+        
+        Args:
+            jobs: Job postings to search; defaults to a synthetic corpus when
+                corpus_size is positive, otherwise to a small hard-coded sample
+            corpus_size: Number of synthetic postings to generate
+            seed: Seed for the synthetic corpus
+        """
+        # Stored columnar: large synthetic corpora repeat titles, companies and locations heavily
+        if jobs is not None:
+            self.sample_jobs = JobTable.from_records(jobs)
+        elif corpus_size > 0:
+            self.sample_jobs = JobTable.from_records(SyntheticJobGenerator(seed=seed).generate(corpus_size))
+        else:
+            self.sample_jobs = JobTable.from_records(self._default_jobs())
+        
+        self._build_indexes()
+    
+    def _default_jobs(self) -> List[Dict[str, Any]]:
+        """Return the built-in sample job data."""
+        return [
             {
                 "title": "Software Engineer",
                 "company": "Google",
@@ -80,6 +107,49 @@ class MockLinkedInJobSearch:
             }
         ]
     
+    def _build_indexes(self):
+        """Build inverted token indexes over job titles/queries and locations."""
+        # Posting lists stay sorted because job ids are appended in order
+        self._token_index: Dict[str, List[int]] = {}
+        self._location_index: Dict[str, List[int]] = {}
+        
+        # Tokenize each distinct title, query and location once, then walk the codes
+        jobs = self.sample_jobs
+        title_tokens = [set(tokenize(title)) for title in jobs.categories("title")]
+        query_tokens = [set(tokenize(query)) for query in jobs.categories("query")]
+        location_tokens = [set(tokenize(location)) for location in jobs.categories("location")]
+        codes = zip(jobs.codes("title").tolist(), jobs.codes("query").tolist(), jobs.codes("location").tolist())
+        for job_id, (title, query, location) in enumerate(codes):
+            for token in title_tokens[title] | query_tokens[query]:
+                self._token_index.setdefault(token, []).append(job_id)
+            for token in location_tokens[location]:
+                self._location_index.setdefault(token, []).append(job_id)
+    
+    def _lookup(self, index: Dict[str, List[int]], text: str) -> Optional[List[List[int]]]:
+        """
+        Fetch the posting lists for every token in text.
+        
+        Returns:
+            Posting lists sorted from shortest to longest, an empty list if any
+            token is unknown, or None if the text has no tokens (no filtering)
+        """
+        tokens = set(tokenize(text))
+        if not tokens:
+            return None
+        postings = []
+        for token in tokens:
+            posting = index.get(token)
+            if not posting:
+                return []
+            postings.append(posting)
+        return sorted(postings, key=len)
+    
+    @staticmethod
+    def _contains(posting: List[int], job_id: int) -> bool:
+        """Check membership in a sorted posting list."""
+        i = bisect.bisect_left(posting, job_id)
+        return i < len(posting) and posting[i] == job_id
+    
     def search_jobs(self, query: str, location: str = "", limit: int = 10) -> List[Dict[str, Any]]:
         """
         Mock search for jobs based on a query and location.
@@ -92,25 +162,39 @@ class MockLinkedInJobSearch:
         Returns:
             List of job listings
         """
-        # Filter jobs based on query (case-insensitive partial match)
-        query_lower = query.lower()
-        filtered_jobs = [
-            job for job in self.sample_jobs 
-            if query_lower in job["title"].lower() or query_lower in job["query"].lower()
-        ]
+        # Every query token must appear in the title or query, and every
+        # location token in the location (case-insensitive)
+        postings = self._lookup(self._token_index, query)
+        location_postings = self._lookup(self._location_index, location) if location else None
+        if postings == [] or location_postings == []:
+            return []
+        
+        postings = (postings or []) + (location_postings or [])
+        if not postings:
+            return [job.to_dict() for job in self.sample_jobs[:limit]]
         
-        # Filter by location if provided
-        if location:
-            location_lower = location.lower()
-            filtered_jobs = [
-                job for job in filtered_jobs
-                if location_lower in job["location"].lower()
-            ]
+        # Walk the shortest posting list in order and stop as soon as the limit is reached
+        postings.sort(key=len)
+        shortest, others = postings[0], postings[1:]
+        results = []
+        for job_id in shortest:
+            if len(results) >= limit:
+                break
+            if all(self._contains(posting, job_id) for posting in others):
+                results.append(self.sample_jobs[job_id].to_dict())
         
-        # Return limited results
-        return filtered_jobs[:limit]
+        return results
+
+    def close(self):
+        """Nothing to release; present so both searchers can be closed alike."""
     
-    def search_multiple_queries(self, queries: List[str], location: str = "", limit_per_query: int = 5) -> pd.DataFrame:
+    def search_multiple_queries(
+        self,
+        queries: List[str],
+        location: str = "",
+        limit_per_query: int = 5,
+        progress: Optional[Callable[[int, int], None]] = None,
+    ) -> "pd.DataFrame":
         """
         Search for jobs using multiple queries and return results as a DataFrame.
         
@@ -118,21 +202,18 @@ class MockLinkedInJobSearch:
             queries: List of job search queries
             location: Location for job search
             limit_per_query: Maximum number of job listings per query
+            progress: Called with (queries searched, total queries) after each
+                query; an exception it raises stops the search
             
         Returns:
-            DataFrame with job listings
+            DataFrame with job listings (title, company, location and query are categorical)
         """
-        all_results = []
+        # Collect into a columnar table, skipping jobs already found by an earlier query
+        jobs = JobTable(unique_by="url")
         
-        for query in queries:
-            results = self.search_jobs(query, location, limit_per_query)
-            all_results.extend(results)
+        for searched, query in enumerate(queries, start=1):
+            jobs.extend(self.search_jobs(query, location, limit_per_query))
+            if progress is not None:
+                progress(searched, len(queries))
             
-        # Convert to DataFrame
-        if all_results:
-            df = pd.DataFrame(all_results)
-            # Remove duplicates based on URL
-            df = df.drop_duplicates(subset=["url"])
-            return df
-        else:
-            return pd.DataFrame(columns=["title", "company", "location", "url", "query"])
\ No newline at end of file
+        return jobs.to_pandas()
\ No newline at end of file
@@ -0,0 +1,162 @@
+import threading
+from collections import OrderedDict
+from typing import List, Dict, Any, Hashable, Optional, Tuple
+from .config import PREFETCH_SEARCH_QUERIES, PREFETCH_SESSION_BUDGET
+from .fingerprint import cv_fingerprint
+from .tasks import Task, TaskRunner, DONE, FAILED, CANCELLED
+
+# Results per query of a speculative search, matching the job search default
+PREFETCH_RESULTS_PER_QUERY = 5
+
+# Sessions whose prefetch state is remembered
+_MAX_SESSIONS = 10_000
+
+
+def queries_task_key(cv_analysis: Dict[str, Any]) -> Tuple:
+    """Task key of generating search queries for a CV."""
+    return ("search_queries", cv_fingerprint(cv_analysis))
+
+
+def search_task_key(queries: List[str], location: str, results_per_query: int, mock: bool) -> Tuple:
+    """Task key of a multi-query job search."""
+    return ("job_search", tuple(queries), location, results_per_query, mock)
+
+
+def generate_queries(task: Task, llm_client, cv_analysis: Dict[str, Any]) -> List[str]:
+    """Task function generating job search queries for a CV."""
+    return llm_client.generate_job_search_queries(cv_analysis)
+
+
+def search_jobs(task: Task, job_searcher, queries: List[str], location: str, results_per_query: int):
+    """Task function searching several queries, reporting progress (and honouring cancellation) after each."""
+    return job_searcher.search_multiple_queries(
+        list(queries), location, results_per_query,
+        progress=lambda searched, total: task.report(searched, total)
+    )
+
+
+class SpeculativePrefetcher:
+    """
+    Starts the work a session will most likely ask for next as soon as its CV analysis lands.
+
+    Query generation is submitted under the same task key the job search uses, so
+    the job search picks up the running (or finished) task instead of generating
+    queries again; the first few generated queries are then searched. Prefetching
+    for a session stops once it has spent its budget of speculative requests (LLM
+    calls plus searched queries), and work prefetched for a previous CV is
+    cancelled when the session's CV changes.
+    """
+
+    def __init__(
+        self,
+        runner: TaskRunner,
+        llm_client,
+        job_searcher,
+        search_queries: int = PREFETCH_SEARCH_QUERIES,
+        session_budget: int = PREFETCH_SESSION_BUDGET,
+    ):
+        """
+        Initialize the prefetcher.
+
+        Args:
+            runner: Task runner executing the prefetched work
+            llm_client: OpenRouterClient generating the queries
+            job_searcher: Job searcher used for the speculative search
+            search_queries: Number of generated queries searched speculatively (0 disables searching)
+            session_budget: Maximum speculative requests per session (0 disables prefetching)
+        """
+        self.runner = runner
+        self.llm_client = llm_client
+        self.job_searcher = job_searcher
+        self.search_queries = search_queries
+        self.session_budget = session_budget
+        self._sessions: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _session(self, session_id: str) -> Dict[str, Any]:
+        """Return a session's prefetch state; the caller holds the lock."""
+        state = self._sessions.get(session_id)
+        if state is None:
+            state = self._sessions[session_id] = {"cv": None, "keys": [], "search_key": None, "spent": 0}
+            if len(self._sessions) > _MAX_SESSIONS:
+                self._sessions.popitem(last=False)
+        self._sessions.move_to_end(session_id)
+        return state
+
+    def _charge(self, session_id: str, cv_hash: str, requests: int) -> int:
+        """Spend up to requests from the session's budget if its CV is still cv_hash; returns how many were granted."""
+        with self._lock:
+            state = self._session(session_id)
+            if state["cv"] != cv_hash:
+                return 0
+            granted = max(0, min(requests, self.session_budget - state["spent"]))
+            state["spent"] += granted
+            return granted
+
+    def _track(self, session_id: str, cv_hash: str, key: Hashable, search: bool = False):
+        with self._lock:
+            state = self._session(session_id)
+            if state["cv"] == cv_hash:
+                state["keys"].append(key)
+                if search:
+                    state["search_key"] = key
+
+    def start(self, session_id: str, cv_analysis: Dict[str, Any]) -> bool:
+        """
+        Prefetch for a session's newly analyzed CV.
+
+        Args:
+            session_id: Session the work is done for
+            cv_analysis: The session's CV analysis
+
+        Returns:
+            True if prefetching runs (or already ran) for this CV, False if the budget is spent
+        """
+        cv_hash = cv_fingerprint(cv_analysis)
+        with self._lock:
+            state = self._session(session_id)
+            if state["cv"] == cv_hash:
+                return True
+            stale = state["keys"]
+            state.update(cv=cv_hash, keys=[], search_key=None)
+        # The CV changed: anything still being prefetched for the previous one is wasted
+        for key in stale:
+            task = self.runner.get(session_id, key)
+            if task is not None and not task.done:
+                self.runner.discard(session_id, key)
+
+        key = queries_task_key(cv_analysis)
+        existing = self.runner.get(session_id, key)
+        if existing is None or existing.state in (FAILED, CANCELLED):
+            if not self._charge(session_id, cv_hash, 1):
+                return False
+        task = self.runner.submit(session_id, key, generate_queries, self.llm_client, cv_analysis)
+        self._track(session_id, cv_hash, key)
+        if self.search_queries > 0:
+            task.add_done_callback(lambda task: self._search(session_id, cv_hash, task))
+        return True
+
+    def _search(self, session_id: str, cv_hash: str, queries_task: Task):
+        """Search the first generated queries once query generation is done."""
+        if queries_task.state != DONE:
+            return
+        queries = list(dict.fromkeys(query for query in queries_task.result if query))[:self.search_queries]
+        queries = queries[:self._charge(session_id, cv_hash, len(queries))]
+        if not queries:
+            return
+
+        from .mock_job_search import MockLinkedInJobSearch
+
+        mock = isinstance(self.job_searcher, MockLinkedInJobSearch)
+        key = search_task_key(queries, "", PREFETCH_RESULTS_PER_QUERY, mock)
+        self.runner.submit(session_id, key, search_jobs, self.job_searcher, queries, "", PREFETCH_RESULTS_PER_QUERY)
+        self._track(session_id, cv_hash, key, search=True)
+
+    def prefetched_search(self, session_id: str, cv_analysis: Dict[str, Any]) -> Optional[Task]:
+        """Return the speculative search for a session's current CV, if one was started."""
+        with self._lock:
+            state = self._sessions.get(session_id)
+            if state is None or state["cv"] != cv_fingerprint(cv_analysis) or state["search_key"] is None:
+                return None
+            key = state["search_key"]
+        return self.runner.get(session_id, key)
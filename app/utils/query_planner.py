@@ -0,0 +1,144 @@
+from typing import List, Dict, Optional, Tuple, FrozenSet
+from .job_store import JobStore
+from .text import normalize_text, tokenize
+
+# Words that don't change which jobs a LinkedIn search returns
+STOP_WORDS = frozenset({
+    "a", "an", "and", "the", "of", "for", "in", "at", "to", "with", "or", "on", "as",
+    "job", "jobs", "position", "positions", "role", "roles", "opening", "openings",
+    "opportunity", "opportunities", "hiring", "vacancy", "vacancies",
+})
+
+
+def query_signature(query: str) -> FrozenSet[str]:
+    """
+    Reduce a query to the set of tokens that matter for matching.
+
+    Args:
+        query: Job search query
+
+    Returns:
+        Lowercase tokens without punctuation and stop-words
+    """
+    return frozenset(token for token in tokenize(query) if token not in STOP_WORDS)
+
+
+def token_set_similarity(a: FrozenSet[str], b: FrozenSet[str]) -> float:
+    """Jaccard similarity of two token sets."""
+    if not a and not b:
+        return 1.0
+    return len(a & b) / len(a | b)
+
+
+class QueryPlanner:
+    """Reduces a list of job search queries to the smallest set that still covers their intent."""
+
+    def __init__(
+        self,
+        store: Optional[JobStore] = None,
+        similarity_threshold: float = 0.75,
+        subsumption_threshold: float = 0.9,
+        min_observed_results: int = 3,
+    ):
+        """
+        Initialize the query planner.
+
+        Args:
+            store: Local job store whose past results are used to learn which
+                queries are subsumed by others
+            similarity_threshold: Token-set similarity above which two queries are merged
+            subsumption_threshold: Fraction of a query's past results that must also
+                be returned by another query for it to be considered subsumed
+            min_observed_results: Minimum number of past results before a query's
+                subsumption is trusted
+        """
+        self.store = store
+        self.similarity_threshold = similarity_threshold
+        self.subsumption_threshold = subsumption_threshold
+        self.min_observed_results = min_observed_results
+
+    def plan(self, queries: List[str], location: str = "") -> Tuple[List[str], Dict[str, str]]:
+        """
+        Plan which searches to issue for a list of queries.
+
+        Queries made only of stop-words have nothing to compare, so they are
+        searched as they are.
+
+        Args:
+            queries: Raw job search queries (LLM-generated or user-entered)
+            location: Location the queries will be searched in; only past results
+                for the same location are used to learn subsumption
+
+        Returns:
+            Tuple containing:
+            - Queries to search, in their original order and phrasing
+            - Mapping of each dropped query to the query that covers it
+        """
+        planned: List[Tuple[str, FrozenSet[str]]] = []
+        merged: Dict[str, str] = {}
+
+        for query in queries:
+            query = query.strip()
+            if not query:
+                continue
+            signature = query_signature(query)
+            if not signature:
+                if query not in (kept for kept, _ in planned):
+                    planned.append((query, signature))
+                continue
+            representative = next(
+                (kept for kept, kept_signature in planned
+                 if kept_signature and token_set_similarity(signature, kept_signature) >= self.similarity_threshold),
+                None,
+            )
+            if representative is None:
+                planned.append((query, signature))
+            elif query != representative:
+                merged[query] = representative
+
+        kept_queries = [query for query, _ in planned]
+        comparable = [query for query, signature in planned if signature]
+        for query, covering in self._subsumed(comparable, location).items():
+            kept_queries.remove(query)
+            merged[query] = covering
+            # Queries merged into a subsumed query are now covered by its cover
+            for original, representative in merged.items():
+                if representative == query:
+                    merged[original] = covering
+
+        return kept_queries, merged
+
+    def _subsumed(self, queries: List[str], location: str) -> Dict[str, str]:
+        """
+        Find queries whose past results in a location are (almost) contained in another query's results there.
+
+        Returns:
+            Mapping of each subsumed query to the query that covers it
+        """
+        if self.store is None or len(queries) < 2:
+            return {}
+
+        # Results differ by location, so history from other locations says nothing about this one
+        location = normalize_text(location)
+        by_normalized: Dict[str, set] = {}
+        for (stored_query, stored_location), urls in self.store.urls_by_query().items():
+            if normalize_text(stored_location) == location:
+                by_normalized.setdefault(normalize_text(stored_query), set()).update(urls)
+        result_sets = {query: by_normalized.get(normalize_text(query), set()) for query in queries}
+
+        subsumed: Dict[str, str] = {}
+        # Check smaller result sets first so the broadest query ends up covering the rest
+        for query in sorted(queries, key=lambda q: len(result_sets[q])):
+            urls = result_sets[query]
+            if len(urls) < self.min_observed_results:
+                continue
+            for other in queries:
+                if other == query or other in subsumed:
+                    continue
+                other_urls = result_sets[other]
+                if len(other_urls) < len(urls):
+                    continue
+                if len(urls & other_urls) / len(urls) >= self.subsumption_threshold:
+                    subsumed[query] = other
+                    break
+        return subsumed
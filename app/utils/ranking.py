@@ -0,0 +1,169 @@
+import heapq
+import threading
+import zlib
+from typing import List, Dict, Any, Iterable, Tuple, TYPE_CHECKING
+from .text import tokenize
+
+# numpy and scipy are imported where they are used: loading them costs more than the rest of the app utilities
+if TYPE_CHECKING:
+    import numpy as np
+    from scipy import sparse
+
+# Fields of a CV analysis that describe what the candidate would be searched for
+CV_RANKING_FIELDS = ("skills", "job_titles", "relevant_job_keywords", "experience")
+
+
+def flatten_text(value: Any) -> str:
+    """
+    Flatten an arbitrarily nested LLM-shaped value into plain text.
+
+    Args:
+        value: String, list or dictionary (possibly nested)
+
+    Returns:
+        All string leaves joined by spaces
+    """
+    if value is None:
+        return ""
+    if isinstance(value, dict):
+        return " ".join(flatten_text(v) for v in value.values())
+    if isinstance(value, (list, tuple, set)):
+        return " ".join(flatten_text(v) for v in value)
+    return str(value)
+
+
+def cv_ranking_text(cv_analysis: Dict[str, Any]) -> str:
+    """Build the text used to rank jobs against a CV analysis."""
+    return " ".join(flatten_text(cv_analysis.get(field)) for field in CV_RANKING_FIELDS)
+
+
+def job_ranking_text(job: Dict[str, Any]) -> str:
+    """Build the text used to rank a job; the title is repeated to weigh it above the description."""
+    title = job.get("title") or ""
+    return f"{title} {title} {job.get('description') or ''}"
+
+
+class TfidfRanker:
+    """Local pre-ranking of jobs against a CV with hashed TF-IDF vectors and cosine similarity."""
+
+    def __init__(self, n_features: int = 2 ** 18, bigrams: bool = True):
+        """
+        Initialize the ranker.
+
+        Args:
+            n_features: Number of hashed feature columns
+            bigrams: Whether to add word bigrams to the unigram features
+        """
+        self.n_features = n_features
+        self.bigrams = bigrams
+        # Job vocabularies repeat heavily, so memoize feature hashes; the same job
+        # lists are also re-ranked on every rerun, so memoize whole documents too
+        self._column_cache: Dict[str, int] = {}
+        self._document_cache: Dict[str, List[int]] = {}
+        # The ranker is shared by every session's script thread
+        self._cache_lock = threading.Lock()
+
+    def _features(self, text: str) -> List[str]:
+        tokens = tokenize(text)
+        if self.bigrams:
+            tokens = tokens + [f"{a} {b}" for a, b in zip(tokens, tokens[1:])]
+        return tokens
+
+    def _columns(self, text: str) -> List[int]:
+        """Map the features of a text to hashed column indexes; the caller holds the cache lock."""
+        cache = self._column_cache
+        if len(cache) > 1_000_000:
+            cache.clear()
+        features = self._features(text)
+        try:
+            return list(map(cache.__getitem__, features))
+        except KeyError:
+            columns = []
+            for feature in features:
+                column = cache.get(feature)
+                if column is None:
+                    # crc32 is stable across processes, unlike hash()
+                    column = cache[feature] = zlib.crc32(feature.encode("utf-8")) % self.n_features
+                columns.append(column)
+            return columns
+
+    def _count_matrix(self, texts: Iterable[str]) -> "sparse.csr_matrix":
+        """Build a sparse document-term count matrix with hashed columns."""
+        import numpy as np
+        from scipy import sparse
+
+        indptr = [0]
+        indices: List[int] = []
+        with self._cache_lock:
+            documents = self._document_cache
+            if len(documents) > 100_000:
+                documents.clear()
+            for text in texts:
+                columns = documents.get(text)
+                if columns is None:
+                    columns = documents[text] = self._columns(text)
+                indices.extend(columns)
+                indptr.append(len(indices))
+        data = np.ones(len(indices), dtype=np.float32)
+        matrix = sparse.csr_matrix(
+            (data, np.asarray(indices, dtype=np.int32), np.asarray(indptr, dtype=np.int64)),
+            shape=(len(indptr) - 1, self.n_features),
+        )
+        # Merge repeated (row, column) entries into counts
+        matrix.sum_duplicates()
+        return matrix
+
+    def similarities(self, query_text: str, documents: List[str]) -> "np.ndarray":
+        """
+        Compute cosine similarities between a query text and every document in one pass.
+
+        Args:
+            query_text: Text of the query (e.g. the CV)
+            documents: Texts of the documents (e.g. jobs)
+
+        Returns:
+            Array of similarities in [0, 1], one per document
+        """
+        import numpy as np
+
+        if not documents:
+            return np.zeros(0, dtype=np.float32)
+
+        from scipy import sparse
+
+        counts = self._count_matrix([query_text] + documents)
+
+        # Sublinear term frequency and smoothed inverse document frequency
+        counts.data = 1.0 + np.log(counts.data)
+        document_frequency = np.bincount(counts.indices, minlength=self.n_features)
+        idf = np.log((1.0 + counts.shape[0]) / (1.0 + document_frequency)) + 1.0
+        weighted = counts.multiply(idf.astype(np.float32)).tocsr()
+
+        # L2-normalize rows so the dot product is the cosine similarity
+        norms = np.sqrt(np.asarray(weighted.multiply(weighted).sum(axis=1)).ravel())
+        norms[norms == 0] = 1.0
+        weighted = sparse.diags(1.0 / norms) @ weighted
+
+        query_vector = weighted[0]
+        return np.asarray((weighted[1:] @ query_vector.T).todense()).ravel()
+
+    def rank(self, cv_analysis: Dict[str, Any], jobs: List[Dict[str, Any]], top_k: int = 20) -> List[Tuple[int, float]]:
+        """
+        Rank jobs by similarity to a CV analysis.
+
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+            jobs: Job listings (title and, if available, description are used)
+            top_k: Number of best matches to return
+
+        Returns:
+            List of (job index, similarity) tuples, best match first
+        """
+        scores = self.similarities(cv_ranking_text(cv_analysis), [job_ranking_text(job) for job in jobs])
+        return heapq.nlargest(top_k, enumerate(scores.tolist()), key=lambda item: item[1])
+
+
+def get_ranker() -> TfidfRanker:
+    """Return the process-wide ranker so its feature caches survive reruns and sessions (owned by the resource registry)."""
+    from .resources import get_resource
+    return get_resource("ranker")
@@ -0,0 +1,179 @@
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from typing import Dict, Any, Optional
+from .config import LINKEDIN_INITIAL_RATE, LINKEDIN_MAX_RATE, LINKEDIN_MAX_WAIT
+
+# Status codes that mean "slow down" rather than "no results"; LinkedIn uses 999 for bot throttling
+THROTTLE_STATUS_CODES = (429, 999)
+
+
+class ThrottledError(Exception):
+    """
+    Raised when a host throttles a request, as opposed to returning no results.
+
+    A status code of None means the request was not sent: the host is blocked by
+    an earlier throttle for longer than callers may wait.
+    """
+
+    def __init__(self, host: str, status_code: Optional[int], retry_after: Optional[float] = None):
+        self.host = host
+        self.status_code = status_code
+        self.retry_after = retry_after
+        if status_code is None:
+            message = f"Requests to {host} are blocked by an earlier throttle"
+        else:
+            message = f"Request to {host} was throttled (HTTP {status_code})"
+        if retry_after is not None:
+            message += f", retry after {retry_after:.0f}s"
+        super().__init__(message)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+
+    Args:
+        value: Header value, either delay seconds or an HTTP date
+
+    Returns:
+        Number of seconds to wait, or None if the header is missing or invalid
+    """
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class _HostState:
+    """Rate state for a single host."""
+
+    __slots__ = ("rate", "next_slot", "blocked_until", "successes", "throttles")
+
+    def __init__(self, rate: float):
+        self.rate = rate
+        self.next_slot = 0.0
+        self.blocked_until = 0.0
+        self.successes = 0
+        self.throttles = 0
+
+
+class PolitenessScheduler:
+    """
+    Per-host request scheduler with an AIMD adaptive rate.
+
+    The request rate grows additively after every successful response and is
+    cut multiplicatively when the host throttles us, so throughput hovers near
+    the highest rate the host tolerates. Retry-After delays block the host for
+    all callers; a caller whose slot is further away than max_wait fails fast
+    instead of sleeping.
+    """
+
+    def __init__(
+        self,
+        initial_rate: float = LINKEDIN_INITIAL_RATE,
+        max_rate: float = LINKEDIN_MAX_RATE,
+        min_rate: float = 0.05,
+        increase: float = 0.05,
+        decrease: float = 0.5,
+        max_wait: float = LINKEDIN_MAX_WAIT,
+    ):
+        """
+        Initialize the scheduler.
+
+        Args:
+            initial_rate: Starting request rate per host (requests per second)
+            max_rate: Upper bound of the request rate
+            min_rate: Lower bound of the request rate
+            increase: Rate added after each successful request
+            decrease: Factor applied to the rate after a throttled request
+            max_wait: Longest a caller sleeps for its slot (seconds)
+        """
+        self.initial_rate = initial_rate
+        self.max_rate = max_rate
+        self.min_rate = min_rate
+        self.increase = increase
+        self.decrease = decrease
+        self.max_wait = max_wait
+        self._hosts: Dict[str, _HostState] = {}
+        self._lock = threading.Lock()
+
+    def _state(self, host: str) -> _HostState:
+        state = self._hosts.get(host)
+        if state is None:
+            state = self._hosts[host] = _HostState(self.initial_rate)
+        return state
+
+    def acquire(self, host: str):
+        """
+        Block until the caller may send a request to host.
+
+        Slots are reserved under the lock so concurrent callers are spaced out
+        by the current rate instead of all firing at once.
+
+        Raises:
+            ThrottledError: If the next slot is more than max_wait away (e.g. after a
+                long Retry-After); no slot is reserved then
+        """
+        with self._lock:
+            state = self._state(host)
+            now = time.monotonic()
+            slot = max(now, state.next_slot, state.blocked_until)
+            if slot - now > self.max_wait:
+                raise ThrottledError(host, None, slot - now)
+            state.next_slot = slot + 1.0 / state.rate
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+    def record_success(self, host: str):
+        """Additively increase the rate after a successful request."""
+        with self._lock:
+            state = self._state(host)
+            state.successes += 1
+            state.rate = min(self.max_rate, state.rate + self.increase)
+
+    def record_throttle(self, host: str, retry_after: Optional[float] = None):
+        """
+        Multiplicatively decrease the rate after a throttled request.
+
+        Args:
+            host: Host that throttled the request
+            retry_after: Seconds the host asked us to wait, if provided
+        """
+        with self._lock:
+            state = self._state(host)
+            state.throttles += 1
+            state.rate = max(self.min_rate, state.rate * self.decrease)
+            backoff = retry_after if retry_after is not None else 1.0 / state.rate
+            now = time.monotonic()
+            state.blocked_until = max(state.blocked_until, now + backoff)
+            state.next_slot = max(state.next_slot, state.blocked_until)
+
+    def wait_time(self, host: str) -> float:
+        """Return the number of seconds until the next request to host may be sent."""
+        with self._lock:
+            state = self._state(host)
+            return max(0.0, max(state.next_slot, state.blocked_until) - time.monotonic())
+
+    def stats(self, host: str) -> Dict[str, Any]:
+        """Return the current rate state of a host."""
+        with self._lock:
+            state = self._state(host)
+            return {
+                "rate": state.rate,
+                "successes": state.successes,
+                "throttles": state.throttles,
+                "blocked_for": max(0.0, state.blocked_until - time.monotonic()),
+            }
+
+
+def get_scheduler() -> PolitenessScheduler:
+    """Return the process-wide scheduler shared by every searcher and session (owned by the resource registry)."""
+    from .resources import get_resource
+    return get_resource("scheduler")
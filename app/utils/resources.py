@@ -0,0 +1,239 @@
+import atexit
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .config import USE_MOCK_JOB_SEARCH
+
+
+class ResourceRegistry:
+    """
+    Process-wide registry of shared resources such as API clients, job searchers, stores and caches.
+
+    Each resource is created lazily by its factory on first use and then shared by every
+    Streamlit session and rerun, so resources must be thread-safe. Resources are closed in
+    reverse creation order on shutdown (registered to run at interpreter exit).
+    """
+
+    def __init__(self):
+        self._factories: Dict[str, Tuple[Callable[[], Any], Optional[Callable[[Any], None]]]] = {}
+        self._instances: Dict[str, Any] = {}
+        self._creation_order: List[str] = []
+        # Reentrant so factories can fetch the resources they depend on
+        self._lock = threading.RLock()
+
+    def register(self, name: str, factory: Callable[[], Any], close: Optional[Callable[[Any], None]] = None):
+        """
+        Register how to create (and optionally close) a resource.
+
+        Re-registering a name replaces its factory; an instance that already exists is
+        closed so the next get() builds one from the new factory.
+
+        Args:
+            name: Resource name
+            factory: Callable returning the resource
+            close: Callable releasing the resource on reset or shutdown
+        """
+        with self._lock:
+            self.reset(name)
+            self._factories[name] = (factory, close)
+
+    def get(self, name: str) -> Any:
+        """
+        Return a resource, creating it on first use.
+
+        Raises:
+            KeyError: If no resource is registered under name
+        """
+        instance = self._instances.get(name)
+        if instance is not None:
+            return instance
+        with self._lock:
+            if name not in self._instances:
+                factory, _ = self._factories[name]
+                self._instances[name] = factory()
+                self._creation_order.append(name)
+            return self._instances[name]
+
+    def created(self, name: str) -> bool:
+        """Check whether a resource has been created."""
+        return name in self._instances
+
+    def reset(self, name: str):
+        """Close and drop a resource so the next get() creates a fresh one."""
+        with self._lock:
+            instance = self._instances.pop(name, None)
+            if name in self._creation_order:
+                self._creation_order.remove(name)
+            if instance is not None:
+                self._close(name, instance)
+
+    def shutdown(self):
+        """Close every created resource, most recently created first."""
+        with self._lock:
+            for name in reversed(list(self._creation_order)):
+                self.reset(name)
+
+    def _close(self, name: str, instance: Any):
+        """Run a resource's close hook, reporting (not raising) errors so shutdown continues."""
+        _, close = self._factories.get(name, (None, None))
+        if close is None:
+            return
+        try:
+            close(instance)
+        except Exception as e:
+            print(f"Error closing resource '{name}': {e}")
+
+
+# Factories import their modules lazily so creating the registry stays cheap and
+# modules whose getters delegate here can import this module without cycles
+
+def _admission(registry: ResourceRegistry):
+    from .admission import AdmissionController
+    return AdmissionController()
+
+
+def _llm_client(registry: ResourceRegistry):
+    from .llm import OpenRouterClient
+    return OpenRouterClient(admission=registry.get("admission"))
+
+
+def _skill_ontology(registry: ResourceRegistry):
+    from .skills import SkillOntology
+    return SkillOntology()
+
+
+def _upload_store(registry: ResourceRegistry):
+    from .upload_store import UploadStore
+    store = UploadStore()
+    store.start()
+    return store
+
+
+def _cv_parser(registry: ResourceRegistry):
+    from .cv_parser import CVParser
+    return CVParser(registry.get("llm_client"), registry.get("skill_ontology"), registry.get("upload_store"))
+
+
+def _advanced_features(registry: ResourceRegistry):
+    from .advanced_features import AdvancedFeatures
+    return AdvancedFeatures(registry.get("llm_client"), registry.get("skill_ontology"))
+
+
+def _local_scorer(registry: ResourceRegistry):
+    from .local_scoring import LocalCompatibilityScorer
+    return LocalCompatibilityScorer(registry.get("skill_ontology"))
+
+
+def _ranker(registry: ResourceRegistry):
+    from .ranking import TfidfRanker
+    return TfidfRanker()
+
+
+def _scheduler(registry: ResourceRegistry):
+    from .rate_limiter import PolitenessScheduler
+    return PolitenessScheduler()
+
+
+def _search_cache(registry: ResourceRegistry):
+    from .search_cache import SearchResultCache
+    return SearchResultCache()
+
+
+def _score_store(registry: ResourceRegistry):
+    from .score_store import ScoreStore
+    return ScoreStore()
+
+
+def _session_store(registry: ResourceRegistry):
+    from .session_store import SessionDataStore
+    return SessionDataStore()
+
+
+def _task_runner(registry: ResourceRegistry):
+    from .tasks import TaskRunner
+    return TaskRunner()
+
+
+def _prefetcher(registry: ResourceRegistry):
+    from .prefetch import SpeculativePrefetcher
+    return SpeculativePrefetcher(registry.get("task_runner"), registry.get("llm_client"), registry.get("job_searcher"))
+
+
+def _user_agent(registry: ResourceRegistry):
+    # Loading the user agent dataset is slow, so it is done once per process
+    from fake_useragent import UserAgent
+    return UserAgent()
+
+
+def _mock_job_searcher(registry: ResourceRegistry):
+    from .mock_job_search import MockLinkedInJobSearch
+    return MockLinkedInJobSearch()
+
+
+def _linkedin_job_searcher(registry: ResourceRegistry):
+    from .job_search import LinkedInJobSearch
+    return LinkedInJobSearch(user_agent=registry.get("user_agent"))
+
+
+def _job_searcher(registry: ResourceRegistry):
+    # The configured searcher is one of the two above, which own closing it
+    return registry.get("mock_job_searcher" if USE_MOCK_JOB_SEARCH else "linkedin_job_searcher")
+
+
+def _crawler(registry: ResourceRegistry):
+    from .job_store import JobStore
+    from .saved_search_crawler import SavedSearchCrawler
+    crawler = SavedSearchCrawler(JobStore())
+    crawler.start()
+    return crawler
+
+
+def _stop_crawler(crawler):
+    crawler.stop(wait=False)
+    crawler.store.close()
+
+
+def _register_defaults(registry: ResourceRegistry):
+    """Register the application's shared resources."""
+    factories = [
+        ("admission", _admission, None),
+        ("llm_client", _llm_client, None),
+        ("skill_ontology", _skill_ontology, None),
+        ("upload_store", _upload_store, lambda store: store.close()),
+        ("cv_parser", _cv_parser, None),
+        ("advanced_features", _advanced_features, None),
+        ("local_scorer", _local_scorer, None),
+        ("ranker", _ranker, None),
+        ("scheduler", _scheduler, None),
+        ("search_cache", _search_cache, lambda cache: cache.close()),
+        ("score_store", _score_store, lambda store: store.close()),
+        ("session_store", _session_store, lambda store: store.close()),
+        ("task_runner", _task_runner, lambda runner: runner.close()),
+        ("prefetcher", _prefetcher, None),
+        ("user_agent", _user_agent, None),
+        ("mock_job_searcher", _mock_job_searcher, lambda searcher: searcher.close()),
+        ("linkedin_job_searcher", _linkedin_job_searcher, lambda searcher: searcher.close()),
+        ("job_searcher", _job_searcher, None),
+        ("crawler", _crawler, _stop_crawler),
+    ]
+    for name, factory, close in factories:
+        registry.register(name, lambda factory=factory: factory(registry), close=close)
+
+
+_registry: Optional[ResourceRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> ResourceRegistry:
+    """Return the process-wide resource registry, shut down automatically at exit."""
+    global _registry
+    with _registry_lock:
+        if _registry is None:
+            _registry = ResourceRegistry()
+            _register_defaults(_registry)
+            atexit.register(_registry.shutdown)
+        return _registry
+
+
+def get_resource(name: str) -> Any:
+    """Return a shared resource from the process-wide registry."""
+    return get_registry().get(name)
@@ -0,0 +1,144 @@
+import random
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional
+from .config import (
+    SAVED_SEARCH_INTERVAL,
+    SAVED_SEARCH_CONCURRENCY,
+    SAVED_SEARCH_JITTER,
+)
+from .job_store import JobStore
+from .resources import get_resource
+
+
+def _default_searcher_factory():
+    """Return the application's shared job searcher, built once per process by the resource registry."""
+    return get_resource("job_searcher")
+
+
+class SavedSearchCrawler:
+    """Background scheduler that periodically refreshes saved searches into the job store."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        searcher_factory: Callable[[], Any] = _default_searcher_factory,
+        interval: float = SAVED_SEARCH_INTERVAL,
+        jitter: float = SAVED_SEARCH_JITTER,
+        max_workers: int = SAVED_SEARCH_CONCURRENCY,
+        poll_interval: float = 30.0,
+    ):
+        """
+        Initialize the crawler.
+
+        Args:
+            store: Job store holding saved searches and their results
+            searcher_factory: Callable returning the job searcher; called on each run,
+                so the searcher is only created once a search is due
+            interval: Seconds between refreshes of the same saved search
+            jitter: Fraction of the interval to randomly add or subtract so
+                refreshes don't all fire together
+            max_workers: Maximum number of searches running concurrently
+            poll_interval: Seconds between checks for due searches
+        """
+        self.store = store
+        self.searcher_factory = searcher_factory
+        self.interval = interval
+        self.jitter = jitter
+        self.max_workers = max_workers
+        self.poll_interval = poll_interval
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="saved-search")
+        self._in_flight: set = set()
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._rng = random.Random()
+
+    def start(self):
+        """Start the background scheduling thread if it is not running."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="saved-search-crawler", daemon=True)
+            self._thread.start()
+
+    def stop(self, wait: bool = True):
+        """Stop the scheduling thread and the worker pool."""
+        self._stop.set()
+        self._wake.set()
+        if self._thread and wait:
+            self._thread.join()
+        self._executor.shutdown(wait=wait)
+
+    def trigger(self, owner: str, search_id: Optional[int] = None):
+        """
+        Refresh one of an owner's saved searches (or all of them) as soon as possible.
+
+        Args:
+            owner: Tenant whose saved searches are refreshed
+            search_id: ID of the saved search; None refreshes every saved search of the owner
+        """
+        searches = self.store.list_saved_searches(owner)
+        for search in searches:
+            if search_id is None or search["id"] == search_id:
+                self.store.schedule(search["id"], 0)
+        self._wake.set()
+
+    def _loop(self):
+        while not self._stop.is_set():
+            try:
+                self.run_once()
+            except Exception as e:
+                print(f"Error running saved searches: {e}")
+            self._wake.wait(self.poll_interval)
+            self._wake.clear()
+
+    def run_once(self) -> List[Any]:
+        """
+        Submit every due saved search to the worker pool.
+
+        Returns:
+            Futures of the submitted runs
+        """
+        futures = []
+        for search in self.store.due_searches():
+            with self._lock:
+                if search["id"] in self._in_flight:
+                    continue
+                self._in_flight.add(search["id"])
+            futures.append(self._executor.submit(self._run_search, search))
+        return futures
+
+    def _next_run_at(self) -> float:
+        spread = self.interval * self.jitter
+        return time.time() + self.interval + self._rng.uniform(-spread, spread)
+
+    def _run_search(self, search: Dict[str, Any]) -> List[str]:
+        """
+        Refresh a single saved search.
+
+        Returns:
+            URLs of postings that are new since the previous run
+        """
+        started_at = time.time()
+        try:
+            searcher = self.searcher_factory()
+            jobs = searcher.search_jobs(search["query"], search["location"], search["limit_per_query"])
+            _, new_urls = self.store.record_run(search["id"], jobs, started_at)
+            return new_urls
+        except Exception as e:
+            print(f"Error refreshing saved search '{search['query']}': {e}")
+            self.store.record_run(search["id"], [], started_at, error=str(e))
+            return []
+        finally:
+            self.store.schedule(search["id"], self._next_run_at())
+            with self._lock:
+                self._in_flight.discard(search["id"])
+
+
+def get_crawler() -> SavedSearchCrawler:
+    """Return the process-wide saved-search crawler, started on first use (owned by the resource registry)."""
+    return get_resource("crawler")
@@ -0,0 +1,209 @@
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, Iterable, NamedTuple, Optional, Tuple
+from .config import SCORE_STORE_PATH, SCORE_STORE_TTL, ensure_data_dir
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS compatibility_scores (
+    cv_hash TEXT NOT NULL,
+    job_id TEXT NOT NULL,
+    description_hash TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (cv_hash, job_id, description_hash, model, prompt_version)
+);
+CREATE TABLE IF NOT EXISTS cv_optimizations (
+    cv_hash TEXT NOT NULL,
+    canonical_title TEXT NOT NULL,
+    model TEXT NOT NULL,
+    prompt_version TEXT NOT NULL,
+    title TEXT NOT NULL,
+    result TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    PRIMARY KEY (cv_hash, canonical_title, model, prompt_version)
+);
+CREATE INDEX IF NOT EXISTS compatibility_scores_created_at ON compatibility_scores (created_at);
+CREATE INDEX IF NOT EXISTS cv_optimizations_created_at ON cv_optimizations (created_at);
+"""
+
+# Seconds between passes removing expired scores and optimizations
+_PURGE_INTERVAL = 3600
+
+
+class ScoreKey(NamedTuple):
+    """Everything a compatibility score depends on; a change in any part invalidates the score."""
+
+    cv_hash: str
+    job_id: str
+    description_hash: str
+    model: str
+    prompt_version: str
+
+
+class ScoreStore:
+    """
+    Durable SQLite store of compatibility scores and CV optimizations, so the same
+    job is never scored (and the same role never optimized) twice for the same CV.
+    Entries older than ttl are purged when the store is opened and, at most once
+    per purge interval, as new entries are written.
+    """
+
+    def __init__(self, path: str = SCORE_STORE_PATH, ttl: float = SCORE_STORE_TTL):
+        """
+        Open (and create if needed) the score store.
+
+        Args:
+            path: Path of the SQLite database file
+            ttl: Seconds a score or optimization is kept (0 keeps them forever)
+        """
+        self.path = path
+        self.ttl = ttl
+        self._purged_at = 0.0
+        self._lock = threading.Lock()
+        if path != ":memory:":
+            ensure_data_dir(os.path.dirname(os.path.abspath(path)))
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+        self._expire(time.time())
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+    def get(self, key: ScoreKey) -> Optional[Dict[str, Any]]:
+        """Return the stored score for key, if any."""
+        return self.get_many([key]).get(key)
+
+    def get_many(self, keys: Iterable[ScoreKey]) -> Dict[ScoreKey, Dict[str, Any]]:
+        """
+        Look up many scores at once.
+
+        Args:
+            keys: Score keys
+
+        Returns:
+            Mapping of the keys that were found to their stored results
+        """
+        keys = list(dict.fromkeys(keys))
+        found: Dict[ScoreKey, Dict[str, Any]] = {}
+        # Stay well below SQLite's bound-parameter limit
+        for start in range(0, len(keys), 150):
+            batch = keys[start:start + 150]
+            clause = " OR ".join(
+                ["(cv_hash = ? AND job_id = ? AND description_hash = ? AND model = ? AND prompt_version = ?)"] * len(batch)
+            )
+            params = [part for key in batch for part in key]
+            with self._lock:
+                rows = self._conn.execute(
+                    "SELECT cv_hash, job_id, description_hash, model, prompt_version, result "
+                    f"FROM compatibility_scores WHERE {clause}",
+                    params,
+                ).fetchall()
+            for row in rows:
+                found[ScoreKey(*row[:5])] = json.loads(row[5])
+        return found
+
+    def put(self, key: ScoreKey, result: Dict[str, Any]):
+        """Store a single score."""
+        self.put_many([(key, result)])
+
+    def put_many(self, items: Iterable[Tuple[ScoreKey, Dict[str, Any]]]):
+        """
+        Store many scores at once.
+
+        Scores previously stored for the same CV and job under a different
+        description, model or prompt version are superseded and removed.
+
+        Args:
+            items: (key, result) pairs; results containing an error are skipped
+        """
+        items = [(key, result) for key, result in items if "error" not in result]
+        if not items:
+            return
+        now = time.time()
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "DELETE FROM compatibility_scores WHERE cv_hash = ? AND job_id = ? "
+                "AND NOT (description_hash = ? AND model = ? AND prompt_version = ?)",
+                [(key.cv_hash, key.job_id, key.description_hash, key.model, key.prompt_version) for key, _ in items],
+            )
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO compatibility_scores "
+                "(cv_hash, job_id, description_hash, model, prompt_version, result, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                [(*key, json.dumps(result), now) for key, result in items],
+            )
+        self._expire(now)
+
+    def optimized_titles(self, cv_hash: str, model: str, prompt_version: str) -> Dict[str, str]:
+        """
+        List the target titles a CV has been optimized for.
+
+        Returns:
+            Mapping of canonical title to the title as it was first entered
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT canonical_title, title FROM cv_optimizations "
+                "WHERE cv_hash = ? AND model = ? AND prompt_version = ?",
+                (cv_hash, model, prompt_version),
+            ).fetchall()
+        return dict(rows)
+
+    def get_optimization(
+        self, cv_hash: str, canonical_title: str, model: str, prompt_version: str
+    ) -> Optional[Dict[str, Any]]:
+        """Return the stored optimization of a CV for a canonical target title, if any."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT result FROM cv_optimizations "
+                "WHERE cv_hash = ? AND canonical_title = ? AND model = ? AND prompt_version = ?",
+                (cv_hash, canonical_title, model, prompt_version),
+            ).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def put_optimization(
+        self, cv_hash: str, canonical_title: str, model: str, prompt_version: str, title: str, result: Dict[str, Any]
+    ):
+        """Store the optimization of a CV for a target title; results containing an error are skipped."""
+        if "error" in result:
+            return
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO cv_optimizations "
+                "(cv_hash, canonical_title, model, prompt_version, title, result, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (cv_hash, canonical_title, model, prompt_version, title, json.dumps(result), time.time()),
+            )
+        self._expire(time.time())
+
+    def purge(self, older_than: float):
+        """Delete scores and optimizations created more than older_than seconds ago."""
+        cutoff = time.time() - older_than
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM compatibility_scores WHERE created_at < ?", (cutoff,))
+            self._conn.execute("DELETE FROM cv_optimizations WHERE created_at < ?", (cutoff,))
+
+    def _expire(self, now: float):
+        """Purge entries older than ttl, unless that was done less than a purge interval ago."""
+        if not self.ttl:
+            return
+        with self._lock:
+            if now - self._purged_at < _PURGE_INTERVAL:
+                return
+            self._purged_at = now
+        self.purge(self.ttl)
+
+
+def get_score_store() -> ScoreStore:
+    """Return the process-wide score store (owned by the resource registry)."""
+    from .resources import get_resource
+    return get_resource("score_store")
@@ -0,0 +1,173 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import List, Dict, Any, Optional
+from .admission import BATCH, bind_scope
+from .config import SCORING_CONCURRENCY
+from .score_store import ScoreStore
+
+
+def job_key(job: Dict[str, Any]) -> str:
+    """Return a stable identifier for a job listing (its URL, or title and company)."""
+    url = job.get("url")
+    if url:
+        return str(url)
+    return f"{job.get('title', '')}|{job.get('company', '')}|{job.get('location', '')}"
+
+
+def job_description_text(job: Dict[str, Any]) -> str:
+    """Return the job description, or a minimal one built from the listing fields."""
+    description = job.get("description", "")
+    if description:
+        return description
+    return f"Job Title: {job.get('title', '')}\nCompany: {job.get('company', '')}\nLocation: {job.get('location', '')}"
+
+
+def parse_score(value: Any) -> int:
+    """
+    Parse a score returned by the LLM into an integer percentage.
+
+    Args:
+        value: Score such as 85, 85.0, "85%", "85 / 100" or {"score": 85}
+
+    Returns:
+        Score between 0 and 100 (0 if it can't be parsed)
+    """
+    if isinstance(value, dict):
+        value = value.get("score", 0)
+    if isinstance(value, str):
+        value = value.strip().rstrip("%").split("/")[0].strip()
+    # Some models answer on a 0-1 scale
+    fractional = isinstance(value, float) or (isinstance(value, str) and "." in value)
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return 0
+    if fractional and 0 < score <= 1:
+        score *= 100
+    return int(round(min(max(score, 0), 100)))
+
+
+class BatchScorer:
+    """Scores many jobs against a CV concurrently, with progress reporting and cancellation."""
+
+    def __init__(
+        self,
+        advanced_features,
+        store: Optional[ScoreStore] = None,
+        max_workers: int = SCORING_CONCURRENCY,
+        fallback=None,
+    ):
+        """
+        Initialize the batch scorer.
+
+        Args:
+            advanced_features: AdvancedFeatures instance used to score each job
+            store: Score store consulted before and updated after scoring
+            max_workers: Maximum number of concurrent scoring requests
+            fallback: LocalCompatibilityScorer used when the LLM fails; fallback
+                results are reported but not stored
+        """
+        self.advanced_features = advanced_features
+        self.store = store
+        self.fallback = fallback
+        self.degraded: List[str] = []
+        self.max_workers = max_workers
+        self.results: Dict[str, Dict[str, Any]] = {}
+        self.errors: Dict[str, str] = {}
+        self.total = 0
+        self._futures: List[Future] = []
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def start(self, cv_analysis: Dict[str, Any], jobs: List[Dict[str, Any]]):
+        """
+        Start scoring jobs in the background; jobs are submitted in the given order.
+
+        Args:
+            cv_analysis: Dictionary with CV analysis results
+            jobs: Job listings to score
+        """
+        self.total = len(jobs)
+        
+        # Serve previously stored scores with one bulk lookup and only score the rest
+        if self.store is not None:
+            keys = {
+                job_key(job): self.advanced_features.match_score_key(cv_analysis, job_key(job), job_description_text(job))
+                for job in jobs
+            }
+            stored = self.store.get_many(keys.values())
+            with self._lock:
+                for key, store_key in keys.items():
+                    if store_key in stored:
+                        self.results[key] = stored[store_key]
+            jobs = [job for job in jobs if job_key(job) not in self.results]
+        
+        # Scoring runs for the caller's tenant, queued behind interactive requests
+        score = bind_scope(self._score, workload=BATCH)
+        self._executor = ThreadPoolExecutor(max_workers=self.max_workers, thread_name_prefix="batch-score")
+        self._futures = [self._executor.submit(score, cv_analysis, job) for job in jobs]
+        # Let the pool wind down on its own once every job is done or cancelled
+        self._executor.shutdown(wait=False)
+
+    def _score(self, cv_analysis: Dict[str, Any], job: Dict[str, Any]):
+        key = job_key(job)
+        if self._cancelled.is_set():
+            return
+        job_description = job_description_text(job)
+        try:
+            result = self.advanced_features.calculate_job_match_score(cv_analysis, job_description)
+            if "error" in result:
+                raise ValueError(result["error"])
+            if self.store is not None:
+                self.store.put(self.advanced_features.match_score_key(cv_analysis, key, job_description), result)
+            with self._lock:
+                self.results[key] = result
+        except Exception as e:
+            if self.fallback is None:
+                with self._lock:
+                    self.errors[key] = str(e)
+                return
+            try:
+                result = self.fallback.score(cv_analysis, job_description, job.get("title", ""))
+            except Exception as fallback_error:
+                with self._lock:
+                    self.errors[key] = f"{e}; local fallback failed: {fallback_error}"
+                return
+            with self._lock:
+                self.degraded.append(key)
+                self.results[key] = result
+
+    def cancel(self):
+        """Cancel every job that has not started; jobs already being scored still finish."""
+        self._cancelled.set()
+        for future in self._futures:
+            future.cancel()
+
+    @property
+    def cancelled(self) -> bool:
+        return self._cancelled.is_set()
+
+    @property
+    def running(self) -> bool:
+        return any(not future.done() for future in self._futures)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the results so far.
+
+        Returns:
+            Dictionary with 'results', 'errors', 'degraded' (keys scored by the
+            fallback), 'completed' and 'total'
+        """
+        with self._lock:
+            results = dict(self.results)
+            errors = dict(self.errors)
+            degraded = list(self.degraded)
+        return {
+            "results": results,
+            "errors": errors,
+            "degraded": degraded,
+            "completed": len(results) + len(errors),
+            "total": self.total,
+        }
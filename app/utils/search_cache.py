@@ -0,0 +1,179 @@
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, List, Dict, Any, Optional, Tuple
+from .config import SEARCH_CACHE_TTL, SEARCH_CACHE_STALE_TTL, SEARCH_CACHE_MAX_BYTES
+from .text import normalize_text
+
+SearchKey = Tuple[str, str, int, Tuple[Tuple[str, str], ...]]
+
+
+def make_search_key(query: str, location: str = "", limit: int = 10,
+                    filters: Optional[Dict[str, str]] = None) -> SearchKey:
+    """
+    Build a cache key that treats cosmetically different searches as equal.
+
+    Args:
+        query: Job search query
+        location: Location for job search
+        limit: Maximum number of job listings
+        filters: Additional search filters (e.g. remote-only)
+
+    Returns:
+        Hashable key of normalized query, location, limit and sorted filters
+    """
+    return (
+        normalize_text(query),
+        normalize_text(location),
+        limit,
+        tuple(sorted((filters or {}).items())),
+    )
+
+
+def _estimate_size(results: List[Dict[str, Any]]) -> int:
+    """Roughly estimate the memory held by a list of job listings, in bytes."""
+    return sum(64 + sum(len(str(value)) for value in job.values()) for job in results)
+
+
+class _Entry:
+    __slots__ = ("results", "stored_at", "size")
+
+    def __init__(self, results: List[Dict[str, Any]], size: int):
+        self.results = results
+        self.stored_at = time.monotonic()
+        self.size = size
+
+
+class SearchResultCache:
+    """
+    Thread-safe TTL cache for job search results with stale-while-revalidate.
+
+    Fresh entries are served directly. Entries past their TTL but within the
+    stale window are still served, while a background refresh replaces them.
+    Entries are evicted least-recently-used once the memory cap is exceeded.
+    """
+
+    def __init__(
+        self,
+        ttl: float = SEARCH_CACHE_TTL,
+        stale_ttl: float = SEARCH_CACHE_STALE_TTL,
+        max_bytes: int = SEARCH_CACHE_MAX_BYTES,
+        max_workers: int = 2,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Seconds an entry is considered fresh
+            stale_ttl: Seconds (from storage) an expired entry may still be served while revalidating
+            max_bytes: Approximate memory cap for all cached results
+            max_workers: Number of background revalidation threads
+        """
+        self.ttl = ttl
+        self.stale_ttl = max(stale_ttl, ttl)
+        self.max_bytes = max_bytes
+        self._entries: "OrderedDict[SearchKey, _Entry]" = OrderedDict()
+        self._in_flight: Dict[SearchKey, Future] = {}
+        self._size = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="search-revalidate")
+        self._counters = {"hits": 0, "stale_hits": 0, "misses": 0, "revalidations": 0, "evictions": 0}
+
+    def get_or_load(self, key: SearchKey, loader: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        """
+        Return cached results for key, loading them with loader on a miss.
+
+        Concurrent misses for the same key share a single load.
+
+        Args:
+            key: Cache key from make_search_key
+            loader: Callable performing the actual search
+
+        Returns:
+            List of job listings
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                age = time.monotonic() - entry.stored_at
+                if age < self.stale_ttl:
+                    self._entries.move_to_end(key)
+                    if age < self.ttl:
+                        self._counters["hits"] += 1
+                    else:
+                        self._counters["stale_hits"] += 1
+                        if key not in self._in_flight:
+                            self._counters["revalidations"] += 1
+                            self._in_flight[key] = self._executor.submit(self._load, key, loader)
+                    return entry.results
+
+            self._counters["misses"] += 1
+            future = self._in_flight.get(key)
+            if future is None:
+                future = Future()
+                self._in_flight[key] = future
+                owner = True
+            else:
+                owner = False
+
+        if not owner:
+            return future.result()
+        try:
+            results = self._load(key, loader)
+            future.set_result(results)
+            return results
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+
+    def _load(self, key: SearchKey, loader: Callable[[], List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+        try:
+            results = loader()
+            # Empty results are often transient (blocked request, selector change), so don't pin them
+            if results:
+                self.put(key, results)
+            return results
+        finally:
+            with self._lock:
+                self._in_flight.pop(key, None)
+
+    def put(self, key: SearchKey, results: List[Dict[str, Any]]):
+        """Store results under key, evicting least-recently-used entries over the memory cap."""
+        entry = _Entry(results, _estimate_size(results))
+        with self._lock:
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self._size -= previous.size
+            self._entries[key] = entry
+            self._size += entry.size
+            while self._size > self.max_bytes and len(self._entries) > 1:
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= evicted.size
+                self._counters["evictions"] += 1
+
+    def clear(self):
+        """Drop every cached entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def close(self):
+        """Stop the revalidation threads, abandoning revalidations not yet started."""
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+    def metrics(self) -> Dict[str, Any]:
+        """Return hit/miss counters, hit rate and memory usage."""
+        with self._lock:
+            metrics = dict(self._counters)
+            metrics["entries"] = len(self._entries)
+            metrics["bytes"] = self._size
+        lookups = metrics["hits"] + metrics["stale_hits"] + metrics["misses"]
+        metrics["hit_rate"] = (metrics["hits"] + metrics["stale_hits"]) / lookups if lookups else 0.0
+        return metrics
+
+
+def get_search_cache() -> SearchResultCache:
+    """Return the process-wide search result cache shared by every session (owned by the resource registry)."""
+    from .resources import get_resource
+    return get_resource("search_cache")
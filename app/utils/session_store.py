@@ -0,0 +1,259 @@
+import hashlib
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Callable, NamedTuple, Optional
+from .config import (
+    SESSION_STORE_PATH, SESSION_SPILL_THRESHOLD, SESSION_MEMORY_BYTES, SESSION_STORE_MAX_BYTES, SESSION_STORE_TTL,
+    ensure_data_dir,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS session_values (
+    digest TEXT PRIMARY KEY,
+    data BLOB NOT NULL,
+    size INTEGER NOT NULL,
+    last_used REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS session_values_last_used ON session_values (last_used);
+"""
+
+# Seconds between refreshes of a value's last use on disk while it is served from memory
+_TOUCH_INTERVAL = 60
+
+# Seconds between passes removing expired values from disk
+_PRUNE_INTERVAL = 60
+
+
+class SpilledValue(NamedTuple):
+    """Handle a session keeps in place of a large value held by the SessionDataStore."""
+
+    digest: str
+    size: int
+    type_name: str
+
+
+class _Entry:
+    """A value held in memory, with the objects derived from it."""
+
+    __slots__ = ("value", "size", "derived", "touched")
+
+    def __init__(self, value: Any, size: int, touched: float):
+        self.value = value
+        self.size = size
+        self.derived: Dict[str, Any] = {}
+        self.touched = touched
+
+
+class SessionDataStore:
+    """
+    Process-wide home of large session values (job results, analyses), so sessions only keep handles.
+
+    Values at least threshold bytes large (pickled) are written to a local SQLite
+    store shared by every session and worker process, keyed by the hash of their
+    content: identical results found by several sessions are stored once. The
+    deserialized values are kept in an in-memory LRU capped at memory_bytes per
+    process and reloaded from disk when evicted. Values on disk expire after ttl
+    seconds unused, or least recently used first when the store outgrows max_bytes.
+
+    Values may be shared by several sessions and must not be mutated.
+    """
+
+    def __init__(
+        self,
+        path: str = SESSION_STORE_PATH,
+        threshold: int = SESSION_SPILL_THRESHOLD,
+        memory_bytes: int = SESSION_MEMORY_BYTES,
+        max_bytes: int = SESSION_STORE_MAX_BYTES,
+        ttl: float = SESSION_STORE_TTL,
+    ):
+        """
+        Open (and create if needed) the store.
+
+        Args:
+            path: Path of the SQLite database file
+            threshold: Pickled size in bytes from which a value is offloaded
+            memory_bytes: Pickled size of the values kept deserialized in memory
+            max_bytes: Size of the values kept on disk
+            ttl: Seconds an unused value is kept on disk
+        """
+        self.path = path
+        self.threshold = threshold
+        self.memory_bytes = memory_bytes
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self._memory: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._memory_used = 0
+        self._counters = {"offloaded": 0, "deduplicated": 0, "loads": 0, "expired": 0,
+                          "memory_evictions": 0, "disk_evictions": 0}
+        self._pruned_at = 0.0
+        self._lock = threading.Lock()
+        self._db_lock = threading.Lock()
+        if path != ":memory:":
+            ensure_data_dir(os.path.dirname(os.path.abspath(path)))
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        with self._db_lock, self._conn:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.executescript(_SCHEMA)
+
+    def close(self):
+        """Close the underlying database connection."""
+        with self._db_lock:
+            self._conn.close()
+
+    def offload(self, value: Any) -> Any:
+        """
+        Take a value out of a session if it is large.
+
+        Args:
+            value: Any picklable value
+
+        Returns:
+            The value itself if it is smaller than the threshold, otherwise a
+            SpilledValue to pass to load()
+        """
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(data) < self.threshold:
+            return value
+        digest = hashlib.sha256(data).hexdigest()
+        now = time.time()
+        with self._lock:
+            self._counters["offloaded"] += 1
+            entry = self._memory.get(digest)
+            if entry is not None:
+                self._counters["deduplicated"] += 1
+                self._memory.move_to_end(digest)
+            else:
+                self._remember(digest, value, len(data), now)
+        with self._db_lock, self._conn:
+            self._conn.execute(
+                "INSERT INTO session_values (digest, data, size, last_used) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (digest) DO UPDATE SET last_used = excluded.last_used",
+                (digest, data, len(data), now),
+            )
+        self._prune(now)
+        return SpilledValue(digest, len(data), type(value).__name__)
+
+    def load(self, handle: SpilledValue) -> Optional[Any]:
+        """
+        Return the value behind a handle.
+
+        Returns:
+            The value, or None if it expired from the store
+        """
+        entry = self._entry(handle)
+        return entry.value if entry is not None else None
+
+    def derived(self, handle: SpilledValue, name: str, factory: Callable[[Any], Any]) -> Optional[Any]:
+        """
+        Return an object computed from a value (e.g. an index over it), computing it on first use.
+
+        Derived objects live in memory alongside their value, are shared by every
+        session holding the same value and are dropped when it is evicted.
+
+        Args:
+            handle: Handle of the value
+            name: Name of the derived object
+            factory: Called with the value to compute the object
+
+        Returns:
+            The derived object, or None if the value expired from the store
+        """
+        entry = self._entry(handle)
+        if entry is None:
+            return None
+        if name not in entry.derived:
+            entry.derived[name] = factory(entry.value)
+        return entry.derived[name]
+
+    def _entry(self, handle: SpilledValue) -> Optional[_Entry]:
+        """Return a value's memory entry, loading it from disk if it was evicted from memory."""
+        now = time.time()
+        with self._lock:
+            entry = self._memory.get(handle.digest)
+            if entry is not None:
+                self._memory.move_to_end(handle.digest)
+                stale = now - entry.touched > _TOUCH_INTERVAL
+                if stale:
+                    entry.touched = now
+        if entry is not None:
+            if stale:
+                # Keep values in use from expiring on disk while they are served from memory
+                with self._db_lock, self._conn:
+                    self._conn.execute("UPDATE session_values SET last_used = ? WHERE digest = ?", (now, handle.digest))
+            return entry
+
+        with self._db_lock, self._conn:
+            row = self._conn.execute("SELECT data FROM session_values WHERE digest = ?", (handle.digest,)).fetchone()
+            if row is not None:
+                self._conn.execute("UPDATE session_values SET last_used = ? WHERE digest = ?", (now, handle.digest))
+        with self._lock:
+            if row is None:
+                self._counters["expired"] += 1
+                return None
+            self._counters["loads"] += 1
+            entry = self._memory.get(handle.digest)
+            if entry is None:
+                # Only the application writes this local store, so unpickling its data is safe
+                entry = self._remember(handle.digest, pickle.loads(row[0]), len(row[0]), now)
+            return entry
+
+    def _remember(self, digest: str, value: Any, size: int, now: float) -> _Entry:
+        """Keep a value in memory, evicting the least recently used ones over the cap; the caller holds the lock."""
+        entry = self._memory[digest] = _Entry(value, size, now)
+        self._memory_used += size
+        # The newest value stays even if it alone exceeds the cap, since a session is about to use it
+        while self._memory_used > self.memory_bytes and len(self._memory) > 1:
+            _, evicted = self._memory.popitem(last=False)
+            self._memory_used -= evicted.size
+            self._counters["memory_evictions"] += 1
+        return entry
+
+    def _prune(self, now: float):
+        """Remove values unused for ttl from disk, then the least recently used ones over max_bytes."""
+        with self._lock:
+            if now - self._pruned_at < _PRUNE_INTERVAL:
+                return
+            self._pruned_at = now
+        with self._db_lock, self._conn:
+            removed = self._conn.execute("DELETE FROM session_values WHERE last_used < ?", (now - self.ttl,)).rowcount
+            total = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM session_values").fetchone()[0]
+            if total > self.max_bytes:
+                victims = []
+                for digest, size in self._conn.execute("SELECT digest, size FROM session_values ORDER BY last_used"):
+                    if total <= self.max_bytes:
+                        break
+                    victims.append((digest,))
+                    total -= size
+                self._conn.executemany("DELETE FROM session_values WHERE digest = ?", victims)
+                removed += len(victims)
+        if removed:
+            with self._lock:
+                self._counters["disk_evictions"] += removed
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the store's usage.
+
+        Returns:
+            Dictionary with 'memory_entries', 'memory_bytes' and 'memory_cap' (this
+            process), 'disk_entries' and 'disk_bytes' (shared), and counters of
+            values 'offloaded', 'deduplicated', 'loads' from disk, 'expired'
+            handles, 'memory_evictions' and 'disk_evictions'
+        """
+        with self._db_lock:
+            disk_entries, disk_bytes = self._conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM session_values"
+            ).fetchone()
+        with self._lock:
+            return {
+                "memory_entries": len(self._memory),
+                "memory_bytes": self._memory_used,
+                "memory_cap": self.memory_bytes,
+                "disk_entries": disk_entries,
+                "disk_bytes": disk_bytes,
+                **self._counters,
+            }
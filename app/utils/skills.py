@@ -0,0 +1,564 @@
+import json
+import zlib
+from collections import deque
+from typing import List, Dict, Any, Iterable, Iterator, NamedTuple, Optional, Tuple
+
+# Canonical skills: id -> (display name, aliases found in free text, aliases only trusted as a whole skill entry).
+# Aliases are other spellings of the same skill only; a tool that belongs to a broader
+# skill is a skill of its own, related to it in SKILL_IMPLIES.
+# Short or common-word aliases ("go", "r", "c") are too ambiguous to scan for in prose.
+DEFAULT_SKILLS: Dict[str, Tuple[str, List[str], List[str]]] = {
+    "python": ("Python", ["python", "python3", "cpython"], ["py"]),
+    "java": ("Java", ["java", "java 8", "java 11", "java 17"], []),
+    "java_ee": ("Java EE", ["java ee", "j2ee", "jakarta ee"], []),
+    "javascript": ("JavaScript", ["javascript", "ecmascript", "es6", "es2015", "vanilla js"], ["js"]),
+    "typescript": ("TypeScript", ["typescript"], ["ts"]),
+    "go": ("Go", ["golang", "go lang"], ["go"]),
+    "rust": ("Rust", ["rust", "rustlang"], []),
+    "c": ("C", ["c programming", "ansi c", "c99", "c11"], ["c"]),
+    "cpp": ("C++", ["c++", "cpp", "c++11", "c++14", "c++17", "c++20"], []),
+    "csharp": ("C#", ["c#", "csharp", "c sharp"], []),
+    "dotnet": (".NET", [".net", "dotnet", ".net core"], []),
+    "aspnet": ("ASP.NET", ["asp.net", "asp.net core"], []),
+    "kotlin": ("Kotlin", ["kotlin"], []),
+    "swift": ("Swift", ["swift"], []),
+    "swiftui": ("SwiftUI", ["swiftui"], []),
+    "scala": ("Scala", ["scala"], []),
+    "r": ("R", ["r programming", "r language"], ["r"]),
+    "rstudio": ("RStudio", ["rstudio"], []),
+    "tidyverse": ("tidyverse", ["tidyverse"], []),
+    "ruby": ("Ruby", ["ruby"], []),
+    "rails": ("Ruby on Rails", ["ruby on rails", "rails", "ror"], []),
+    "php": ("PHP", ["php"], []),
+    "laravel": ("Laravel", ["laravel"], []),
+    "symfony": ("Symfony", ["symfony"], []),
+    "sql": ("SQL", ["sql"], []),
+    "tsql": ("T-SQL", ["t-sql", "tsql", "transact-sql"], []),
+    "plsql": ("PL/SQL", ["pl/sql", "plsql"], []),
+    "shell_scripting": ("Shell Scripting", ["shell scripting"], ["shell"]),
+    "bash": ("Bash", ["bash"], []),
+    "zsh": ("Zsh", ["zsh"], []),
+    "html": ("HTML", ["html", "html5"], []),
+    "css": ("CSS", ["css", "css3"], []),
+    "sass": ("Sass", ["sass", "scss"], []),
+    "tailwind": ("Tailwind CSS", ["tailwind", "tailwindcss", "tailwind css"], []),
+    "react": ("React", ["react", "reactjs", "react.js"], []),
+    "react_native": ("React Native", ["react native"], []),
+    "angular": ("Angular", ["angular", "angularjs"], []),
+    "vue": ("Vue.js", ["vue", "vuejs", "vue.js"], []),
+    "nodejs": ("Node.js", ["node.js", "nodejs", "node js"], ["node"]),
+    "django": ("Django", ["django"], []),
+    "flask": ("Flask", ["flask"], []),
+    "fastapi": ("FastAPI", ["fastapi"], []),
+    "spring": ("Spring", ["spring framework"], ["spring"]),
+    "spring_boot": ("Spring Boot", ["spring boot", "springboot"], []),
+    "graphql": ("GraphQL", ["graphql"], []),
+    "rest_api": ("REST APIs", ["rest api", "rest apis", "restful", "restful api", "restful apis"], ["rest"]),
+    "grpc": ("gRPC", ["grpc"], []),
+    "microservices": ("Microservices", ["microservices", "microservice architecture"], []),
+    "postgresql": ("PostgreSQL", ["postgresql", "postgres"], []),
+    "mysql": ("MySQL", ["mysql"], []),
+    "mariadb": ("MariaDB", ["mariadb"], []),
+    "oracle": ("Oracle Database", ["oracle database", "oracle db"], ["oracle"]),
+    "mongodb": ("MongoDB", ["mongodb", "mongo"], []),
+    "redis": ("Redis", ["redis"], []),
+    "elasticsearch": ("Elasticsearch", ["elasticsearch", "elastic search"], []),
+    "opensearch": ("OpenSearch", ["opensearch"], []),
+    "kafka": ("Kafka", ["kafka", "apache kafka"], []),
+    "rabbitmq": ("RabbitMQ", ["rabbitmq"], []),
+    "spark": ("Spark", ["spark", "apache spark"], []),
+    "pyspark": ("PySpark", ["pyspark"], []),
+    "hadoop": ("Hadoop", ["hadoop", "apache hadoop"], []),
+    "hdfs": ("HDFS", ["hdfs"], []),
+    "mapreduce": ("MapReduce", ["mapreduce"], []),
+    "airflow": ("Airflow", ["airflow", "apache airflow"], []),
+    "dbt": ("dbt", ["dbt"], []),
+    "snowflake": ("Snowflake", ["snowflake"], []),
+    "aws": ("AWS", ["aws", "amazon web services"], []),
+    "ec2": ("EC2", ["ec2", "amazon ec2"], []),
+    "aws_lambda": ("AWS Lambda", ["aws lambda"], []),
+    "azure": ("Azure", ["azure", "microsoft azure"], []),
+    "gcp": ("GCP", ["gcp", "google cloud", "google cloud platform"], []),
+    "bigquery": ("BigQuery", ["bigquery", "big query"], []),
+    "containers": ("Containerization", ["containers", "containerization"], []),
+    "docker": ("Docker", ["docker"], []),
+    "kubernetes": ("Kubernetes", ["kubernetes", "k8s"], []),
+    "eks": ("Amazon EKS", ["eks", "amazon eks"], []),
+    "gke": ("Google Kubernetes Engine", ["gke", "google kubernetes engine"], []),
+    "aks": ("Azure Kubernetes Service", ["aks", "azure kubernetes service"], []),
+    "iac": ("Infrastructure as Code", ["infrastructure as code"], ["iac"]),
+    "terraform": ("Terraform", ["terraform"], []),
+    "ansible": ("Ansible", ["ansible"], []),
+    "ci_cd": ("CI/CD", ["ci/cd", "continuous integration", "continuous delivery", "continuous deployment"], ["cicd"]),
+    "jenkins": ("Jenkins", ["jenkins"], []),
+    "github_actions": ("GitHub Actions", ["github actions"], []),
+    "git": ("Git", ["git"], []),
+    "github": ("GitHub", ["github"], []),
+    "gitlab": ("GitLab", ["gitlab"], []),
+    "bitbucket": ("Bitbucket", ["bitbucket"], []),
+    "linux": ("Linux", ["linux"], []),
+    "unix": ("Unix", ["unix"], []),
+    "ubuntu": ("Ubuntu", ["ubuntu"], []),
+    "debian": ("Debian", ["debian"], []),
+    "centos": ("CentOS", ["centos"], []),
+    "rhel": ("Red Hat Enterprise Linux", ["rhel", "red hat enterprise linux"], []),
+    "monitoring": ("Monitoring", ["monitoring", "observability"], []),
+    "prometheus": ("Prometheus", ["prometheus"], []),
+    "grafana": ("Grafana", ["grafana"], []),
+    "machine_learning": ("Machine Learning", ["machine learning", "ml models", "predictive modeling"], ["ml"]),
+    "deep_learning": ("Deep Learning", ["deep learning", "neural networks", "neural network"], ["dl"]),
+    "nlp": ("NLP", ["nlp", "natural language processing"], []),
+    "llms": ("LLMs", ["llm", "llms", "large language models", "large language model"], []),
+    "computer_vision": ("Computer Vision", ["computer vision", "image recognition"], ["cv"]),
+    "opencv": ("OpenCV", ["opencv"], []),
+    "pytorch": ("PyTorch", ["pytorch", "torch"], []),
+    "tensorflow": ("TensorFlow", ["tensorflow"], ["tf"]),
+    "keras": ("Keras", ["keras"], []),
+    "scikit_learn": ("scikit-learn", ["scikit-learn", "scikit learn", "sklearn"], []),
+    "pandas": ("Pandas", ["pandas"], []),
+    "numpy": ("NumPy", ["numpy"], []),
+    "statistics": ("Statistics", ["statistics", "statistical analysis", "statistical modeling"], []),
+    "ab_testing": ("A/B Testing", ["a/b testing", "ab testing", "split testing"], []),
+    "mlops": ("MLOps", ["mlops"], []),
+    "mlflow": ("MLflow", ["mlflow"], []),
+    "kubeflow": ("Kubeflow", ["kubeflow"], []),
+    "tableau": ("Tableau", ["tableau"], []),
+    "power_bi": ("Power BI", ["power bi", "powerbi"], []),
+    "looker": ("Looker", ["looker"], []),
+    "excel": ("Excel", ["excel", "microsoft excel"], []),
+    "spreadsheets": ("Spreadsheets", ["spreadsheets"], []),
+    "figma": ("Figma", ["figma"], []),
+    "user_research": ("User Research", ["user research"], []),
+    "usability_testing": ("Usability Testing", ["usability testing"], []),
+    "user_interviews": ("User Interviews", ["user interviews"], []),
+    "prototyping": ("Prototyping", ["prototyping"], []),
+    "wireframing": ("Wireframing", ["wireframing", "wireframes"], []),
+    "selenium": ("Selenium", ["selenium", "selenium webdriver"], []),
+    "test_automation": ("Test Automation", ["test automation", "automated testing"], []),
+    "pytest": ("pytest", ["pytest"], []),
+    "junit": ("JUnit", ["junit"], []),
+    "cypress": ("Cypress", ["cypress"], []),
+    "agile": ("Agile", ["agile"], []),
+    "scrum": ("Scrum", ["scrum"], []),
+    "kanban": ("Kanban", ["kanban"], []),
+    "jira": ("Jira", ["jira"], []),
+    "project_management": ("Project Management", ["project management"], []),
+    "pmp": ("PMP", ["pmp"], []),
+    "stakeholder_management": ("Stakeholder Management", ["stakeholder management", "stakeholder communication"], []),
+    "system_design": ("System Design", ["system design"], []),
+    "distributed_systems": ("Distributed Systems", ["distributed systems"], []),
+    "software_architecture": ("Software Architecture", ["software architecture"], []),
+    "unity": ("Unity", ["unity3d", "unity engine"], ["unity"]),
+    "unreal": ("Unreal Engine", ["unreal engine", "unreal"], []),
+    "ios": ("iOS", ["ios"], []),
+    "android": ("Android", ["android"], []),
+    "networking": ("Networking", ["networking"], []),
+    "tcp_ip": ("TCP/IP", ["tcp/ip"], []),
+    "dns": ("DNS", ["dns"], []),
+    "security": ("Security", ["cybersecurity", "information security"], ["security"]),
+    "network_security": ("Network Security", ["network security"], []),
+    "application_security": ("Application Security", ["application security", "appsec"], []),
+    "penetration_testing": ("Penetration Testing", ["penetration testing", "pentesting"], []),
+    "siem": ("SIEM", ["siem"], []),
+    "owasp": ("OWASP", ["owasp"], []),
+}
+
+# Skills a skill implies: knowing a tool counts as having the broader skill it belongs to
+# (a job asking for Test Automation is matched by pytest), never the other way around
+SKILL_IMPLIES: Dict[str, List[str]] = {
+    "java_ee": ["java"],
+    "typescript": ["javascript"],
+    "aspnet": ["dotnet"],
+    "csharp": ["dotnet"],
+    "swiftui": ["swift", "ios"],
+    "rstudio": ["r"],
+    "tidyverse": ["r"],
+    "rails": ["ruby"],
+    "laravel": ["php"],
+    "symfony": ["php"],
+    "tsql": ["sql"],
+    "plsql": ["sql"],
+    "postgresql": ["sql"],
+    "mysql": ["sql"],
+    "mariadb": ["sql"],
+    "bash": ["shell_scripting"],
+    "zsh": ["shell_scripting"],
+    "sass": ["css"],
+    "tailwind": ["css"],
+    "react": ["javascript"],
+    "react_native": ["react"],
+    "angular": ["javascript"],
+    "vue": ["javascript"],
+    "nodejs": ["javascript"],
+    "django": ["python"],
+    "flask": ["python"],
+    "fastapi": ["python"],
+    "spring_boot": ["spring"],
+    "spring": ["java"],
+    "opensearch": ["elasticsearch"],
+    "pyspark": ["spark", "python"],
+    "hdfs": ["hadoop"],
+    "mapreduce": ["hadoop"],
+    "ec2": ["aws"],
+    "aws_lambda": ["aws"],
+    "bigquery": ["gcp", "sql"],
+    "docker": ["containers"],
+    "kubernetes": ["containers"],
+    "eks": ["kubernetes", "aws"],
+    "gke": ["kubernetes", "gcp"],
+    "aks": ["kubernetes", "azure"],
+    "terraform": ["iac"],
+    "ansible": ["iac"],
+    "jenkins": ["ci_cd"],
+    "github_actions": ["ci_cd", "github"],
+    "github": ["git"],
+    "gitlab": ["git"],
+    "bitbucket": ["git"],
+    "ubuntu": ["linux"],
+    "debian": ["linux"],
+    "centos": ["linux"],
+    "rhel": ["linux"],
+    "prometheus": ["monitoring"],
+    "grafana": ["monitoring"],
+    "deep_learning": ["machine_learning"],
+    "llms": ["nlp"],
+    "nlp": ["machine_learning"],
+    "computer_vision": ["machine_learning"],
+    "opencv": ["computer_vision"],
+    "pytorch": ["deep_learning"],
+    "tensorflow": ["deep_learning"],
+    "keras": ["deep_learning"],
+    "scikit_learn": ["machine_learning", "python"],
+    "pandas": ["python"],
+    "numpy": ["python"],
+    "ab_testing": ["statistics"],
+    "mlflow": ["mlops"],
+    "kubeflow": ["mlops", "kubernetes"],
+    "excel": ["spreadsheets"],
+    "usability_testing": ["user_research"],
+    "user_interviews": ["user_research"],
+    "pytest": ["test_automation", "python"],
+    "junit": ["test_automation", "java"],
+    "cypress": ["test_automation", "javascript"],
+    "selenium": ["test_automation"],
+    "scrum": ["agile"],
+    "kanban": ["agile"],
+    "pmp": ["project_management"],
+    "distributed_systems": ["system_design"],
+    "software_architecture": ["system_design"],
+    "tcp_ip": ["networking"],
+    "dns": ["networking"],
+    "network_security": ["security", "networking"],
+    "application_security": ["security"],
+    "penetration_testing": ["security"],
+    "siem": ["security"],
+    "owasp": ["application_security"],
+}
+
+
+def flatten_skills(value: Any) -> List[str]:
+    """
+    Flatten an LLM-shaped skills value into a list of skill strings.
+
+    Args:
+        value: List of skills, dictionary of skill categories, or comma-separated string
+
+    Returns:
+        List of skill strings
+    """
+    if value is None:
+        return []
+    if isinstance(value, str):
+        return [skill.strip() for skill in value.split(",") if skill.strip()]
+    if isinstance(value, dict):
+        return [skill for item in value.values() for skill in flatten_skills(item)]
+    if isinstance(value, (list, tuple, set)):
+        return [skill for item in value for skill in flatten_skills(item)]
+    return [str(value)]
+
+
+class SkillMatch(NamedTuple):
+    """A canonical skill found in a text, with its character span."""
+
+    skill_id: str
+    start: int
+    end: int
+
+
+class AhoCorasick:
+    """Aho-Corasick automaton for finding many patterns in a single linear pass."""
+
+    def __init__(self, patterns: Optional[Iterable[str]] = None):
+        """
+        Build the automaton.
+
+        Args:
+            patterns: Patterns to match; pattern i is reported with index i
+        """
+        # State 0 is the root; transitions[s] maps a character to the next state
+        self.transitions: List[Dict[str, int]] = [{}]
+        self.fail: List[int] = [0]
+        self.outputs: List[List[int]] = [[]]
+        self.lengths: List[int] = []
+        if patterns is not None:
+            for pattern in patterns:
+                self._add(pattern)
+            self._link()
+
+    def _add(self, pattern: str):
+        state = 0
+        for char in pattern:
+            next_state = self.transitions[state].get(char)
+            if next_state is None:
+                next_state = len(self.transitions)
+                self.transitions[state][char] = next_state
+                self.transitions.append({})
+                self.fail.append(0)
+                self.outputs.append([])
+            state = next_state
+        self.outputs[state].append(len(self.lengths))
+        self.lengths.append(len(pattern))
+
+    def _link(self):
+        """Compute failure links breadth-first and merge outputs along them."""
+        queue = deque(self.transitions[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, next_state in self.transitions[state].items():
+                queue.append(next_state)
+                fallback = self.fail[state]
+                while fallback and char not in self.transitions[fallback]:
+                    fallback = self.fail[fallback]
+                target = self.transitions[fallback].get(char, 0)
+                self.fail[next_state] = target if target != next_state else 0
+                self.outputs[next_state] = self.outputs[next_state] + self.outputs[self.fail[next_state]]
+
+    def iter_matches(self, text: str) -> Iterator[Tuple[int, int, int]]:
+        """
+        Find every occurrence of every pattern in text.
+
+        Args:
+            text: Text to scan
+
+        Returns:
+            Iterator over (start, end, pattern index) tuples
+        """
+        transitions, fail, outputs, lengths = self.transitions, self.fail, self.outputs, self.lengths
+        state = 0
+        for position, char in enumerate(text):
+            while state and char not in transitions[state]:
+                state = fail[state]
+            state = transitions[state].get(char, 0)
+            for pattern_index in outputs[state]:
+                end = position + 1
+                yield end - lengths[pattern_index], end, pattern_index
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the compiled automaton as plain JSON-serializable data."""
+        return {"transitions": self.transitions, "fail": self.fail, "outputs": self.outputs, "lengths": self.lengths}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "AhoCorasick":
+        """Restore a compiled automaton without rebuilding it."""
+        automaton = cls()
+        automaton.transitions = data["transitions"]
+        automaton.fail = data["fail"]
+        automaton.outputs = data["outputs"]
+        automaton.lengths = data["lengths"]
+        return automaton
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    """Check that the character at index (if any) does not continue a word."""
+    return index < 0 or index >= len(text) or not text[index].isalnum()
+
+
+class SkillOntology:
+    """Skill dictionary with aliases, compiled into an Aho-Corasick automaton for fast extraction."""
+
+    def __init__(self, skills: Dict[str, Tuple[str, List[str], List[str]]] = DEFAULT_SKILLS,
+                 implies: Dict[str, List[str]] = SKILL_IMPLIES,
+                 automaton: Optional[AhoCorasick] = None, pattern_ids: Optional[List[str]] = None):
+        """
+        Initialize the ontology.
+
+        Args:
+            skills: Mapping of skill ID to (display name, text aliases, whole-entry aliases)
+            implies: Mapping of skill ID to the broader skill IDs it implies
+            automaton: Precompiled automaton (from a serialized ontology)
+            pattern_ids: Skill ID of each automaton pattern (from a serialized ontology)
+        """
+        self.skills = skills
+        self.implies = implies
+        self._exact: Dict[str, str] = {}
+        for skill_id, (name, aliases, exact_aliases) in skills.items():
+            for alias in [name] + list(aliases) + list(exact_aliases):
+                self._exact.setdefault(alias.lower(), skill_id)
+
+        if automaton is None:
+            patterns = [(alias.lower(), skill_id) for skill_id, (_, aliases, _) in skills.items() for alias in aliases]
+            pattern_ids = [skill_id for _, skill_id in patterns]
+            automaton = AhoCorasick(pattern for pattern, _ in patterns)
+        self.automaton = automaton
+        self.pattern_ids = pattern_ids
+
+    def name(self, skill_id: str) -> str:
+        """Return the display name of a canonical skill."""
+        return self.skills[skill_id][0]
+
+    def extract(self, text: str) -> List[SkillMatch]:
+        """
+        Find canonical skills mentioned in free text.
+
+        Overlapping matches are resolved leftmost-longest, and matches must
+        start and end on word boundaries (so "Java" is not found in "JavaScript").
+
+        Args:
+            text: CV or job description text
+
+        Returns:
+            List of skill matches in text order
+        """
+        lowered = text.lower()
+        candidates = [
+            (start, end, self.pattern_ids[pattern_index])
+            for start, end, pattern_index in self.automaton.iter_matches(lowered)
+            if _is_boundary(lowered, start - 1) and _is_boundary(lowered, end)
+        ]
+        candidates.sort(key=lambda match: (match[0], -match[1]))
+
+        matches = []
+        last_end = 0
+        for start, end, skill_id in candidates:
+            if start >= last_end:
+                matches.append(SkillMatch(skill_id, start, end))
+                last_end = end
+        return matches
+
+    def skill_ids(self, text: str) -> List[str]:
+        """Return the unique canonical skill IDs mentioned in text, in order of first mention."""
+        return list(dict.fromkeys(match.skill_id for match in self.extract(text)))
+
+    def entry_skill_ids(self, skill: str) -> List[str]:
+        """
+        Return the canonical IDs of every skill named in a single skill entry.
+
+        An entry matching a name or alias exactly maps to that skill; anything
+        else is scanned like free text, so "Python and Django" yields both.
+
+        Args:
+            skill: Skill entry as written (e.g. from an LLM skills list)
+
+        Returns:
+            Canonical skill IDs in order of mention (empty if none are known)
+        """
+        skill_id = self._exact.get(skill.strip().lower())
+        if skill_id is not None:
+            return [skill_id]
+        return self.skill_ids(skill)
+
+    def canonicalize(self, skill: str) -> Optional[str]:
+        """
+        Map a single skill entry (e.g. from an LLM skills list) to its canonical ID.
+
+        Args:
+            skill: Skill name as written
+
+        Returns:
+            Canonical skill ID, or None if the entry names no known skill or several
+        """
+        found = self.entry_skill_ids(skill)
+        return found[0] if len(found) == 1 else None
+
+    def implied(self, skill_ids: Iterable[str]) -> set:
+        """
+        Expand skill IDs with every broader skill they imply, transitively.
+
+        Args:
+            skill_ids: Canonical skill IDs
+
+        Returns:
+            Set of the given skill IDs and all skills they imply (e.g. keras -> deep_learning -> machine_learning)
+        """
+        expanded = set()
+        pending = list(skill_ids)
+        while pending:
+            skill_id = pending.pop()
+            if skill_id not in expanded:
+                expanded.add(skill_id)
+                pending.extend(self.implies.get(skill_id, ()))
+        return expanded
+
+    def normalize_skills(self, skills: Iterable[Any]) -> List[str]:
+        """
+        Normalize a list of skills to canonical display names, removing duplicates.
+
+        Entries naming several skills are expanded, and unknown skills are kept as written.
+
+        Args:
+            skills: Skill entries (non-string entries are kept unchanged)
+
+        Returns:
+            Deduplicated list of skills, e.g. ["JS", "Javascript", "Keras"] -> ["JavaScript", "Keras"]
+        """
+        normalized: Dict[Any, Any] = {}
+        for skill in skills:
+            if not isinstance(skill, str):
+                normalized.setdefault(id(skill), skill)
+                continue
+            found = self.entry_skill_ids(skill)
+            if not found:
+                normalized.setdefault(skill.strip().lower(), skill.strip())
+            for skill_id in found:
+                normalized.setdefault(skill_id, self.name(skill_id))
+        return list(normalized.values())
+
+    def missing_skills(self, cv_skills: Iterable[Any], job_text: str) -> List[str]:
+        """
+        List skills mentioned in a job description that the CV does not have.
+
+        Args:
+            cv_skills: Skill entries from the CV analysis
+            job_text: Job description text
+
+        Returns:
+            Display names of the missing skills, in order of mention
+        """
+        have = self.implied(
+            skill_id for skill in cv_skills if isinstance(skill, str) for skill_id in self.entry_skill_ids(skill)
+        )
+        return [self.name(skill_id) for skill_id in self.skill_ids(job_text) if skill_id not in have]
+
+    def dumps(self) -> bytes:
+        """Serialize the ontology with its compiled automaton to compact bytes."""
+        data = {
+            "skills": self.skills,
+            "implies": self.implies,
+            "pattern_ids": self.pattern_ids,
+            "automaton": self.automaton.to_dict(),
+        }
+        return zlib.compress(json.dumps(data, separators=(",", ":")).encode("utf-8"), 9)
+
+    @classmethod
+    def loads(cls, payload: bytes) -> "SkillOntology":
+        """Load an ontology serialized with dumps() without recompiling the automaton."""
+        data = json.loads(zlib.decompress(payload).decode("utf-8"))
+        skills = {skill_id: (name, aliases, exact) for skill_id, (name, aliases, exact) in data["skills"].items()}
+        return cls(skills, data.get("implies", {}), AhoCorasick.from_dict(data["automaton"]), data["pattern_ids"])
+
+    def save(self, path: str):
+        """Write the serialized ontology to a file."""
+        with open(path, "wb") as f:
+            f.write(self.dumps())
+
+    @classmethod
+    def load(cls, path: str) -> "SkillOntology":
+        """Read an ontology written by save()."""
+        with open(path, "rb") as f:
+            return cls.loads(f.read())
+
+
+def get_skill_ontology() -> SkillOntology:
+    """Return the process-wide skill ontology built from DEFAULT_SKILLS (owned by the resource registry)."""
+    from .resources import get_resource
+    return get_resource("skill_ontology")
@@ -0,0 +1,197 @@
+import argparse
+import itertools
+import json
+import random
+import re
+from typing import List, Dict, Any, Iterator, Sequence, Tuple
+
+# Base roles: (title, search query, core skills)
+ROLES: List[Tuple[str, str, List[str]]] = [
+    ("Software Engineer", "software engineer", ["Python", "Java", "Git", "SQL", "Docker", "REST APIs"]),
+    ("Data Scientist", "data scientist", ["Python", "SQL", "Machine Learning", "Statistics", "Pandas", "scikit-learn"]),
+    ("Data Engineer", "data engineer", ["Python", "SQL", "Spark", "Airflow", "AWS", "Kafka"]),
+    ("Backend Developer", "backend developer", ["Python", "Go", "PostgreSQL", "Docker", "Kubernetes", "REST APIs"]),
+    ("Frontend Developer", "frontend developer", ["JavaScript", "TypeScript", "React", "CSS", "HTML", "Webpack"]),
+    ("Full Stack Developer", "full stack developer", ["JavaScript", "React", "Node.js", "Python", "SQL", "Docker"]),
+    ("Machine Learning Engineer", "machine learning engineer", ["Python", "PyTorch", "TensorFlow", "MLOps", "Docker", "AWS"]),
+    ("DevOps Engineer", "devops engineer", ["Kubernetes", "Terraform", "AWS", "Docker", "CI/CD", "Linux"]),
+    ("Product Manager", "product manager", ["Roadmapping", "Agile", "Stakeholder Management", "Analytics", "Jira"]),
+    ("UX Designer", "ux designer", ["Figma", "User Research", "Prototyping", "Wireframing", "Design Systems"]),
+    ("Data Analyst", "data analyst", ["SQL", "Excel", "Tableau", "Python", "Statistics", "Power BI"]),
+    ("Mobile Developer", "mobile developer", ["Swift", "Kotlin", "iOS", "Android", "React Native", "Git"]),
+    ("Site Reliability Engineer", "site reliability engineer", ["Linux", "Kubernetes", "Prometheus", "Go", "AWS", "Terraform"]),
+    ("Security Engineer", "security engineer", ["Network Security", "Python", "SIEM", "Penetration Testing", "AWS", "Linux"]),
+    ("Cloud Architect", "cloud architect", ["AWS", "Azure", "GCP", "Terraform", "Kubernetes", "Networking"]),
+    ("QA Engineer", "qa engineer", ["Selenium", "Test Automation", "Python", "Java", "CI/CD", "Jira"]),
+    ("AI Research Scientist", "ai research scientist", ["Deep Learning", "PyTorch", "Python", "NLP", "Computer Vision", "Statistics"]),
+    ("Business Analyst", "business analyst", ["SQL", "Excel", "Requirements Gathering", "Stakeholder Management", "Tableau"]),
+    ("Engineering Manager", "engineering manager", ["People Management", "Agile", "System Design", "Hiring", "Roadmapping"]),
+    ("Database Administrator", "database administrator", ["PostgreSQL", "MySQL", "Oracle", "Backup and Recovery", "SQL", "Linux"]),
+    ("Embedded Software Engineer", "embedded software engineer", ["C", "C++", "RTOS", "Embedded Linux", "Microcontrollers"]),
+    ("Technical Writer", "technical writer", ["Documentation", "Markdown", "API Documentation", "Git"]),
+    ("Solutions Architect", "solutions architect", ["AWS", "System Design", "Stakeholder Management", "Networking", "Docker"]),
+    ("Game Developer", "game developer", ["C++", "Unity", "C#", "Unreal Engine", "3D Math"]),
+]
+
+# Seniority prefixes with the experience range they imply: (prefix, min years, max years)
+SENIORITY_LEVELS: List[Tuple[str, int, int]] = [
+    ("", 2, 5),
+    ("Senior", 5, 8),
+    ("Junior", 0, 2),
+    ("Lead", 7, 10),
+    ("Staff", 8, 12),
+    ("Principal", 10, 15),
+]
+
+LOCATIONS: List[str] = [
+    "Remote", "New York, NY", "San Francisco, CA", "Seattle, WA", "Austin, TX", "Boston, MA",
+    "London, United Kingdom", "Berlin, Germany", "Chicago, IL", "Los Angeles, CA", "Toronto, Canada",
+    "Amsterdam, Netherlands", "Denver, CO", "Atlanta, GA", "Mountain View, CA", "Redmond, WA",
+    "Dublin, Ireland", "Paris, France", "Bangalore, India", "Singapore", "Sydney, Australia",
+    "Washington, DC", "San Jose, CA", "Portland, OR", "Raleigh, NC", "Pittsburgh, PA", "Miami, FL",
+    "Salt Lake City, UT", "Minneapolis, MN", "Phoenix, AZ", "Zurich, Switzerland", "Stockholm, Sweden",
+    "Madrid, Spain", "Warsaw, Poland", "Tel Aviv, Israel", "Munich, Germany", "Vancouver, Canada",
+    "Manchester, United Kingdom", "Lisbon, Portugal", "Copenhagen, Denmark",
+]
+
+EXTRA_SKILLS: List[str] = [
+    "Communication", "Mentoring", "GraphQL", "Redis", "Elasticsearch", "MongoDB", "Scala", "Rust",
+    "Snowflake", "dbt", "Looker", "FastAPI", "Django", "Flask", "Spring Boot", "Microservices",
+    "gRPC", "RabbitMQ", "Hadoop", "Jenkins", "GitHub Actions", "Ansible", "Bash", "R",
+]
+
+EDUCATION_REQUIREMENTS: List[str] = [
+    "Bachelor's degree in Computer Science or a related field",
+    "Bachelor's degree or equivalent practical experience",
+    "Master's degree in a quantitative field preferred",
+    "PhD in Computer Science, Statistics or a related field",
+    "No formal degree required",
+]
+
+_COMPANY_STEMS = [
+    "Nova", "Blue", "Peak", "Bright", "Quant", "Data", "Cloud", "Stack", "Iron", "Silver", "Red",
+    "Green", "North", "Apex", "Core", "Hyper", "Pixel", "Logic", "Vector", "Orbit", "Nimbus", "Atlas",
+    "Echo", "Lumen", "Spark", "Terra", "Zen", "Flux", "Helix", "Prism",
+]
+_COMPANY_TAILS = [
+    "ware", "labs", "soft", "works", "loop", "ly", "hub", "base", "forge", "mind", "scale", "path",
+]
+_COMPANY_KINDS = [
+    "Inc.", "Technologies", "Systems", "Labs", "Group", "Solutions", "Analytics", "AI", "Software", "Health",
+]
+
+
+def _zipf_cum_weights(size: int, exponent: float) -> List[float]:
+    """Cumulative Zipf weights so that early items dominate and later ones form a long tail."""
+    return list(itertools.accumulate(1.0 / (rank ** exponent) for rank in range(1, size + 1)))
+
+
+def _slugify(text: str) -> str:
+    return re.sub(r"[^a-z0-9]+", "-", text.lower()).strip("-")
+
+
+class SyntheticJobGenerator:
+    """Seeded generator of plausible LinkedIn-style job postings for load testing."""
+
+    def __init__(self, seed: int = 42, num_companies: int = 5000, chunk_size: int = 10000):
+        """
+        Initialize the generator.
+
+        Args:
+            seed: Random seed; the same seed always produces the same corpus
+            num_companies: Number of distinct synthetic companies to draw from
+            chunk_size: Number of postings sampled per batch when generating
+        """
+        self.seed = seed
+        self.chunk_size = chunk_size
+        self.companies = self._build_companies(num_companies)
+
+        # Long-tail distributions: a few popular values, many rare ones
+        self._role_weights = _zipf_cum_weights(len(ROLES), 0.8)
+        self._seniority_weights = _zipf_cum_weights(len(SENIORITY_LEVELS), 1.2)
+        self._company_weights = _zipf_cum_weights(len(self.companies), 1.1)
+        self._location_weights = _zipf_cum_weights(len(LOCATIONS), 1.0)
+        self._education_weights = _zipf_cum_weights(len(EDUCATION_REQUIREMENTS), 1.0)
+
+    def _build_companies(self, num_companies: int) -> List[str]:
+        """Build a deterministic pool of unique company names."""
+        rng = random.Random(self.seed)
+        names = [f"{stem}{tail} {kind}" for stem in _COMPANY_STEMS for tail in _COMPANY_TAILS for kind in _COMPANY_KINDS]
+        rng.shuffle(names)
+        if num_companies <= len(names):
+            return names[:num_companies]
+        # Extend the pool with numbered subsidiaries once the combinations run out
+        extra = [f"{names[i % len(names)]} {i // len(names) + 1}" for i in range(len(names), num_companies)]
+        return names + extra
+
+    def _describe(self, rng: random.Random, title: str, company: str, location: str,
+                  skills: Sequence[str], years: int, education: str) -> str:
+        """Compose a job description from the sampled attributes."""
+        required = rng.sample(list(skills), k=min(len(skills), rng.randint(3, 5)))
+        nice_to_have = rng.sample(EXTRA_SKILLS, k=rng.randint(1, 3))
+        return (
+            f"{company} is hiring a {title} in {location}. "
+            f"Requirements: {years}+ years of experience with {', '.join(required)}. "
+            f"{education}. "
+            f"Nice to have: {', '.join(nice_to_have)}."
+        )
+
+    def generate(self, count: int) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily generate job postings.
+
+        Args:
+            count: Number of job postings to generate
+
+        Returns:
+            Iterator over job dictionaries with the same keys as real search
+            results plus a 'description'
+        """
+        rng = random.Random(self.seed)
+        job_id = 0
+
+        while job_id < count:
+            batch = min(self.chunk_size, count - job_id)
+            roles = rng.choices(ROLES, cum_weights=self._role_weights, k=batch)
+            levels = rng.choices(SENIORITY_LEVELS, cum_weights=self._seniority_weights, k=batch)
+            companies = rng.choices(self.companies, cum_weights=self._company_weights, k=batch)
+            locations = rng.choices(LOCATIONS, cum_weights=self._location_weights, k=batch)
+            educations = rng.choices(EDUCATION_REQUIREMENTS, cum_weights=self._education_weights, k=batch)
+
+            for (base_title, query, skills), (prefix, min_years, max_years), company, location, education in zip(
+                roles, levels, companies, locations, educations
+            ):
+                title = f"{prefix} {base_title}" if prefix else base_title
+                years = rng.randint(min_years, max_years)
+                yield {
+                    "title": title,
+                    "company": company,
+                    "location": location,
+                    "url": f"https://www.linkedin.com/jobs/view/{_slugify(title)}-at-{_slugify(company)}-{job_id}",
+                    "query": query,
+                    "description": self._describe(rng, title, company, location, skills, years, education),
+                }
+                job_id += 1
+
+    def generate_list(self, count: int) -> List[Dict[str, Any]]:
+        """Generate job postings eagerly as a list."""
+        return list(self.generate(count))
+
+
+def main():
+    """Write a synthetic job corpus as JSON lines."""
+    parser = argparse.ArgumentParser(description="Generate a synthetic job corpus for load testing.")
+    parser.add_argument("--count", type=int, default=100000, help="Number of job postings to generate")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--companies", type=int, default=5000, help="Number of distinct companies")
+    parser.add_argument("--output", required=True, help="Path of the JSON lines file to write")
+    args = parser.parse_args()
+
+    generator = SyntheticJobGenerator(seed=args.seed, num_companies=args.companies)
+    with open(args.output, "w", encoding="utf-8") as f:
+        for job in generator.generate(args.count):
+            f.write(json.dumps(job) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,243 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Dict, Any, Callable, Hashable, List, Optional, Tuple
+from .admission import admission_scope
+from .config import BACKGROUND_WORKERS, BACKGROUND_RESULT_TTL
+
+# Task states
+PENDING = "pending"
+RUNNING = "running"
+DONE = "done"
+FAILED = "failed"
+CANCELLED = "cancelled"
+
+FINISHED_STATES = frozenset({DONE, FAILED, CANCELLED})
+
+
+class TaskCancelled(Exception):
+    """Raised inside a task when it reports progress after being cancelled."""
+
+
+class Task:
+    """
+    A long operation running in the background on behalf of one session.
+
+    The task function receives the Task as its first argument and may call
+    report() to publish progress and partial results; reporting is also where a
+    cancelled task stops (cancellation is cooperative once the task has started).
+    """
+
+    def __init__(self, session_id: str, key: Hashable, fn: Callable[..., Any], args: Tuple, kwargs: Dict[str, Any]):
+        self.session_id = session_id
+        self.key = key
+        self.state = PENDING
+        self.result: Any = None
+        self.error: Optional[str] = None
+        self.completed = 0
+        self.total = 0
+        self.partial: Any = None
+        self.message = ""
+        self.finished_at: Optional[float] = None
+        self._fn = fn
+        self._args = args
+        self._kwargs = kwargs
+        self._future: Optional[Future] = None
+        self._callbacks: List[Callable[["Task"], None]] = []
+        self._cancelled = threading.Event()
+        self._lock = threading.Lock()
+
+    def _run(self):
+        with self._lock:
+            cancelled = self._cancelled.is_set()
+            if not cancelled:
+                self.state = RUNNING
+        if cancelled:
+            self._finish(CANCELLED)
+            return
+        try:
+            # LLM requests made by the task count against its session's admission budget
+            with admission_scope(self.session_id):
+                result = self._fn(self, *self._args, **self._kwargs)
+        except TaskCancelled:
+            self._finish(CANCELLED)
+        except Exception as e:
+            self._finish(FAILED, error=str(e))
+        else:
+            # A task cancelled while it ran to completion is still cancelled: its result is dropped
+            self._finish(CANCELLED if self._cancelled.is_set() else DONE, result=result)
+
+    def _finish(self, state: str, result: Any = None, error: Optional[str] = None):
+        with self._lock:
+            if self.state in FINISHED_STATES:
+                return
+            self.state = state
+            self.result = result if state == DONE else None
+            self.error = error
+            self.finished_at = time.monotonic()
+            callbacks, self._callbacks = self._callbacks, []
+        for callback in callbacks:
+            try:
+                callback(self)
+            except Exception as e:
+                print(f"Error in callback of task {self.key!r}: {e}")
+
+    def add_done_callback(self, callback: Callable[["Task"], None]):
+        """Call callback(task) once the task finishes (right away if it already has), in the finishing thread."""
+        with self._lock:
+            if self.state not in FINISHED_STATES:
+                self._callbacks.append(callback)
+                return
+        callback(self)
+
+    def report(self, completed: Optional[int] = None, total: Optional[int] = None,
+               partial: Any = None, message: Optional[str] = None):
+        """
+        Publish progress from inside the task.
+
+        Args:
+            completed: Units of work done so far
+            total: Total units of work
+            partial: Results so far, shown while the task is still running
+            message: Short description of the current step
+
+        Raises:
+            TaskCancelled: If the task was cancelled
+        """
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+        with self._lock:
+            if completed is not None:
+                self.completed = completed
+            if total is not None:
+                self.total = total
+            if partial is not None:
+                self.partial = partial
+            if message is not None:
+                self.message = message
+
+    def cancel(self):
+        """Cancel the task: a pending task never starts, a running one stops at its next report()."""
+        self._cancelled.set()
+        with self._lock:
+            never_started = self.state == PENDING and (self._future is None or self._future.cancel())
+        if never_started:
+            self._finish(CANCELLED)
+
+    @property
+    def cancelled(self) -> bool:
+        """Whether cancellation was requested (the task may still be winding down)."""
+        return self._cancelled.is_set()
+
+    @property
+    def done(self) -> bool:
+        return self.state in FINISHED_STATES
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Return the task's status.
+
+        Returns:
+            Dictionary with 'state', 'result', 'error', 'partial', 'message',
+            'completed' and 'total'
+        """
+        with self._lock:
+            return {
+                "state": self.state,
+                "result": self.result,
+                "error": self.error,
+                "partial": self.partial,
+                "message": self.message,
+                "completed": self.completed,
+                "total": self.total,
+            }
+
+
+class TaskRunner:
+    """
+    Process-wide executor of background tasks, keyed per session.
+
+    A Streamlit rerun (e.g. after any widget interaction) interrupts the script
+    but not the task: the next rerun finds it by key and keeps polling it. The
+    same key is never executed twice while its task is pending, running or has a
+    result; finished tasks are kept as the session's result store for a while.
+    """
+
+    def __init__(self, max_workers: int = BACKGROUND_WORKERS, result_ttl: float = BACKGROUND_RESULT_TTL):
+        """
+        Initialize the runner.
+
+        Args:
+            max_workers: Number of tasks run concurrently across all sessions
+            result_ttl: Seconds a finished task (and its result) is kept
+        """
+        self.result_ttl = result_ttl
+        self._tasks: Dict[Tuple[str, Hashable], Task] = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="background-task")
+
+    def submit(self, session_id: str, key: Hashable, fn: Callable[..., Any], *args, **kwargs) -> Task:
+        """
+        Start a task unless one with the same key already exists for the session.
+
+        A failed or cancelled task is replaced, so submitting again retries it.
+
+        Args:
+            session_id: Session the task belongs to
+            key: Identifies the work, e.g. ("search", queries, location); include
+                everything the result depends on
+            fn: Function called as fn(task, *args, **kwargs)
+
+        Returns:
+            The new or existing task
+        """
+        with self._lock:
+            self._prune()
+            task = self._tasks.get((session_id, key))
+            if task is not None and task.state not in (FAILED, CANCELLED) and not task.cancelled:
+                return task
+            task = Task(session_id, key, fn, args, kwargs)
+            self._tasks[(session_id, key)] = task
+            task._future = self._executor.submit(task._run)
+            return task
+
+    def get(self, session_id: str, key: Hashable) -> Optional[Task]:
+        """Return a session's task by key, if any."""
+        with self._lock:
+            return self._tasks.get((session_id, key))
+
+    def cancel(self, session_id: str, key: Hashable):
+        """Cancel a session's task, if any."""
+        task = self.get(session_id, key)
+        if task is not None:
+            task.cancel()
+
+    def discard(self, session_id: str, key: Hashable):
+        """Cancel a session's task and forget its result."""
+        with self._lock:
+            task = self._tasks.pop((session_id, key), None)
+        if task is not None:
+            task.cancel()
+
+    def session_tasks(self, session_id: str) -> List[Task]:
+        """Return every task of a session, oldest first."""
+        with self._lock:
+            return [task for (session, _), task in self._tasks.items() if session == session_id]
+
+    def _prune(self):
+        """Drop finished tasks older than result_ttl; the caller holds the lock."""
+        cutoff = time.monotonic() - self.result_ttl
+        expired = [
+            key for key, task in self._tasks.items()
+            if task.finished_at is not None and task.finished_at < cutoff
+        ]
+        for key in expired:
+            del self._tasks[key]
+
+    def close(self):
+        """Cancel every task and stop the worker threads."""
+        with self._lock:
+            tasks = list(self._tasks.values())
+        for task in tasks:
+            task.cancel()
+        self._executor.shutdown(wait=False, cancel_futures=True)
@@ -0,0 +1,33 @@
+import re
+from typing import List
+
+# Keep '+' and '#' so tokens like "c++" and "c#" survive tokenization
+_TOKEN_PATTERN = re.compile(r"[a-z0-9+#]+")
+
+
+def tokenize(text: str) -> List[str]:
+    """
+    Split text into lowercase alphanumeric tokens.
+
+    Args:
+        text: Text to tokenize
+
+    Returns:
+        List of tokens in the order they appear
+    """
+    if not text:
+        return []
+    return _TOKEN_PATTERN.findall(text.lower())
+
+
+def normalize_text(text: str) -> str:
+    """
+    Normalize text for comparison: lowercase, drop punctuation and collapse whitespace.
+
+    Args:
+        text: Text to normalize
+
+    Returns:
+        Normalized text, e.g. " Senior  Python-Developer" -> "senior python developer"
+    """
+    return " ".join(tokenize(text))
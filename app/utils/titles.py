@@ -0,0 +1,177 @@
+from typing import List, Dict, Optional, Tuple, FrozenSet
+from .text import tokenize
+
+# Abbreviations expanded before titles are compared
+ABBREVIATIONS = {
+    "sr": "senior", "snr": "senior", "sen": "senior",
+    "jr": "junior", "jnr": "junior",
+    "mgr": "manager", "mngr": "manager",
+    "eng": "engineer", "engr": "engineer",
+    "dev": "developer",
+    "swe": "software engineer", "sde": "software engineer",
+    "ml": "machine learning",
+    "ai": "artificial intelligence",
+    "vp": "vice president",
+    "dir": "director",
+    "assoc": "associate",
+    "admin": "administrator",
+    "ops": "operations",
+    "mgmt": "management",
+    "sw": "software",
+}
+
+# Multi-word spellings collapsed to one token
+PHRASES = {
+    "front end": "frontend",
+    "back end": "backend",
+    "full stack": "fullstack",
+    "dev ops": "devops",
+    "entry level": "junior",
+    "full time": "",
+    "part time": "",
+}
+
+# Seniority words, normalized to one spelling each; "" means the default (mid) level
+SENIORITY = {
+    "intern": "intern", "internship": "intern", "trainee": "intern",
+    "junior": "junior", "graduate": "junior", "i": "junior", "1": "junior",
+    "mid": "", "intermediate": "", "experienced": "", "ii": "", "2": "",
+    "senior": "senior", "iii": "senior", "3": "senior",
+    "lead": "lead",
+    "staff": "staff", "iv": "staff", "4": "staff",
+    "principal": "principal",
+    "head": "head",
+    "director": "director",
+    "chief": "chief",
+}
+
+# Words that don't change what a title means
+NOISE_WORDS = frozenset({
+    "a", "an", "and", "the", "of", "for", "in", "at", "to", "with", "or",
+    "remote", "hybrid", "onsite", "contract", "permanent", "temporary",
+    "m", "f", "d", "w", "x",
+})
+
+
+def _normalized_tokens(title: str) -> List[str]:
+    """Lowercase, expand abbreviations and collapse multi-word spellings."""
+    tokens: List[str] = []
+    for token in tokenize(title):
+        tokens.extend(ABBREVIATIONS.get(token, token).split())
+    text = " ".join(tokens)
+    for phrase, replacement in PHRASES.items():
+        text = f" {text} ".replace(f" {phrase} ", f" {replacement} ").strip()
+    return text.split()
+
+
+def title_parts(title: str) -> Tuple[FrozenSet[str], Tuple[str, ...]]:
+    """
+    Split a job title into its seniority and its function.
+
+    Args:
+        title: Job title, e.g. "Data Scientist (Sr.)"
+
+    Returns:
+        Tuple containing:
+        - Normalized seniority words (empty for mid-level)
+        - The remaining words in sorted order, so word order doesn't matter
+    """
+    seniority = set()
+    function = []
+    for token in _normalized_tokens(title):
+        if token in SENIORITY:
+            if SENIORITY[token]:
+                seniority.add(SENIORITY[token])
+        elif token not in NOISE_WORDS:
+            function.append(token)
+    return frozenset(seniority), tuple(sorted(set(function)))
+
+
+def canonical_title(title: str) -> str:
+    """
+    Canonicalize a job title so different phrasings of the same role compare equal.
+
+    "Sr. Data Scientist", "senior data scientist " and "Data Scientist, Senior"
+    all become "senior data scientist".
+
+    Args:
+        title: Job title
+
+    Returns:
+        Seniority words followed by the function words, space-separated
+    """
+    seniority, function = title_parts(title)
+    return " ".join(sorted(seniority) + list(function))
+
+
+def _trigrams(text: str) -> FrozenSet[str]:
+    padded = f"  {text} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class TitleIndex:
+    """Nearest-neighbour lookup of job titles by canonical form and character trigram similarity."""
+
+    def __init__(self, titles: Optional[List[str]] = None):
+        """
+        Initialize the index.
+
+        Args:
+            titles: Titles to index
+        """
+        self._titles: Dict[str, str] = {}
+        self._seniority: Dict[str, FrozenSet[str]] = {}
+        self._trigrams: Dict[str, FrozenSet[str]] = {}
+        self._postings: Dict[str, List[str]] = {}
+        for title in titles or []:
+            self.add(title)
+
+    def __len__(self) -> int:
+        return len(self._titles)
+
+    def add(self, title: str):
+        """Index a title under its canonical form (the first title added for a form is kept)."""
+        canonical = canonical_title(title)
+        if not canonical or canonical in self._titles:
+            return
+        seniority, function = title_parts(title)
+        self._titles[canonical] = title
+        self._seniority[canonical] = seniority
+        self._trigrams[canonical] = _trigrams(" ".join(function))
+        for trigram in self._trigrams[canonical]:
+            self._postings.setdefault(trigram, []).append(canonical)
+
+    def nearest(self, title: str, threshold: float = 0.7) -> Optional[Tuple[str, str, float]]:
+        """
+        Find the indexed title closest to a title.
+
+        Only titles with the same seniority are considered, so "Senior Data Scientist"
+        never matches "Junior Data Scientist"; their functions are compared by trigram
+        Jaccard similarity to tolerate typos and small wording differences.
+
+        Args:
+            title: Job title to look up
+            threshold: Minimum similarity for a match
+
+        Returns:
+            Tuple of (indexed title, its canonical form, similarity), or None if no match
+        """
+        canonical = canonical_title(title)
+        if canonical in self._titles:
+            return self._titles[canonical], canonical, 1.0
+
+        seniority, function = title_parts(title)
+        trigrams = _trigrams(" ".join(function))
+        shared: Dict[str, int] = {}
+        for trigram in trigrams:
+            for candidate in self._postings.get(trigram, ()):
+                shared[candidate] = shared.get(candidate, 0) + 1
+
+        best = None
+        for candidate, overlap in shared.items():
+            if self._seniority[candidate] != seniority:
+                continue
+            similarity = overlap / (len(trigrams) + len(self._trigrams[candidate]) - overlap)
+            if similarity >= threshold and (best is None or similarity > best[2]):
+                best = (self._titles[candidate], candidate, similarity)
+        return best
@@ -0,0 +1,308 @@
+import hashlib
+import os
+import shutil
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+from .config import (
+    CV_UPLOAD_FOLDER, UPLOAD_STORE_PATH, UPLOAD_STORE_MAX_BYTES, UPLOAD_STORE_MAX_AGE, UPLOAD_COMPACTION_INTERVAL, ensure_data_dir,
+)
+
+# Name of the uploaded file inside its entry (the extension is kept)
+ORIGINAL = "original"
+
+# Entries used this recently are never evicted, so a CV being analyzed keeps its file
+EVICTION_GRACE = 300
+
+# Partially written files older than this are removed by compaction
+_STALE_TEMP_AGE = 3600
+
+_TEMP_SUFFIX = ".tmp"
+
+# Extensions of the CVs earlier versions saved directly in the data folder (only PDFs were accepted)
+LEGACY_UPLOAD_EXTENSIONS = (".pdf",)
+
+
+class UploadStore:
+    """
+    Content-addressed storage of uploaded CVs and the artifacts derived from them, capped in size.
+
+    Each upload lives in its own entry directory named by the SHA-256 of its content
+    and sharded by the first two hex digits (root/ab/abcd.../original.pdf), so
+    identical uploads are stored once and no directory grows large. Artifacts
+    derived from an upload (e.g. its extracted text) are stored next to it and
+    evicted with it. When the store exceeds max_bytes, or an entry hasn't been
+    used for max_age, the least recently used entries are removed; a background
+    compaction pass rescans the disk (other worker processes share it), removes
+    leftovers and applies the same policy. CVs that earlier versions saved
+    directly in the legacy data folder are moved into the store by compaction,
+    keeping their age, so the same policy cleans them up.
+    """
+
+    def __init__(
+        self,
+        root: str = UPLOAD_STORE_PATH,
+        max_bytes: int = UPLOAD_STORE_MAX_BYTES,
+        max_age: float = UPLOAD_STORE_MAX_AGE,
+        compaction_interval: float = UPLOAD_COMPACTION_INTERVAL,
+        legacy_folder: Optional[str] = CV_UPLOAD_FOLDER,
+    ):
+        """
+        Initialize the store.
+
+        Args:
+            root: Directory holding the store
+            max_bytes: Total size the store is kept under
+            max_age: Seconds an unused entry is kept (0 keeps entries until the size cap evicts them)
+            compaction_interval: Seconds between background compaction passes
+            legacy_folder: Folder where earlier versions saved uploads unmanaged (None to skip)
+        """
+        self.root = ensure_data_dir(root)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self.compaction_interval = compaction_interval
+        self.legacy_folder = legacy_folder
+        # Entry digest -> (size in bytes, last used), least recently used first
+        self._entries: "OrderedDict[str, Tuple[int, float]]" = OrderedDict()
+        self._bytes = 0
+        self._evicted: Dict[str, int] = {}
+        self._evicted_bytes = 0
+        self._compactions = 0
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._scan()
+
+    def _entry_dir(self, digest: str) -> str:
+        return os.path.join(self.root, digest[:2], digest)
+
+    def _entry_size(self, digest: str) -> int:
+        entry_dir = self._entry_dir(digest)
+        try:
+            return sum(entry.stat().st_size for entry in os.scandir(entry_dir) if entry.is_file())
+        except FileNotFoundError:
+            return 0
+
+    def _record(self, digest: str, size: int, used: float):
+        """Add or update an entry in the index; the caller holds the lock."""
+        previous = self._entries.pop(digest, None)
+        if previous is not None:
+            self._bytes -= previous[0]
+        self._entries[digest] = (size, used)
+        self._bytes += size
+
+    def _scan(self):
+        """Rebuild the index from the disk; entry directories' modification times are their last use."""
+        entries = []
+        for shard in os.scandir(self.root):
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            for entry in os.scandir(shard.path):
+                if entry.is_dir():
+                    entries.append((entry.stat().st_mtime, entry.name, self._entry_size(entry.name)))
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            for used, digest, size in sorted(entries):
+                self._record(digest, size, used)
+
+    def save(self, data: bytes, filename: str = "") -> str:
+        """
+        Store an upload, unless identical content is already stored.
+
+        Args:
+            data: File content
+            filename: Original file name, whose extension is kept
+
+        Returns:
+            Path to the stored file
+        """
+        digest = hashlib.sha256(data).hexdigest()
+        extension = os.path.splitext(filename)[1].lower()
+        path = os.path.join(self._entry_dir(digest), ORIGINAL + extension)
+        if os.path.exists(path):
+            self.touch(digest)
+            return path
+        self._write(path, data)
+        self._added(digest)
+        return path
+
+    def _write(self, path: str, data: bytes):
+        """Write a file atomically, so readers never see a partial upload or artifact."""
+        ensure_data_dir(os.path.dirname(path))
+        temp_path = f"{path}.{os.getpid()}.{threading.get_ident()}{_TEMP_SUFFIX}"
+        with open(temp_path, "wb") as f:
+            f.write(data)
+        os.replace(temp_path, path)
+
+    def _added(self, digest: str):
+        """Account for a new or grown entry and evict what no longer fits."""
+        size = self._entry_size(digest)
+        with self._lock:
+            self._record(digest, size, time.time())
+        self._evict()
+
+    def digest_of(self, path: str) -> Optional[str]:
+        """Return the digest of the entry a stored file belongs to, or None if it isn't in the store."""
+        digest = os.path.basename(os.path.dirname(os.path.abspath(path)))
+        if os.path.abspath(path) != os.path.join(os.path.abspath(self._entry_dir(digest)), os.path.basename(path)):
+            return None
+        return digest
+
+    def touch(self, digest: str):
+        """Mark an entry as just used."""
+        now = time.time()
+        try:
+            os.utime(self._entry_dir(digest), (now, now))
+        except FileNotFoundError:
+            return
+        with self._lock:
+            entry = self._entries.get(digest)
+            self._record(digest, entry[0] if entry else self._entry_size(digest), now)
+
+    def get_artifact(self, digest: str, name: str) -> Optional[bytes]:
+        """Return an artifact derived from an upload, or None if it was never stored (or was evicted)."""
+        try:
+            with open(os.path.join(self._entry_dir(digest), name), "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return None
+        self.touch(digest)
+        return data
+
+    def put_artifact(self, digest: str, name: str, data: bytes):
+        """
+        Store an artifact derived from an upload; it is evicted together with the upload.
+
+        Args:
+            digest: Digest of the upload's entry
+            name: Artifact file name, e.g. "text.txt"
+            data: Artifact content
+        """
+        if not os.path.isdir(self._entry_dir(digest)):
+            # The upload itself was evicted meanwhile; an orphaned artifact is useless
+            return
+        self._write(os.path.join(self._entry_dir(digest), name), data)
+        self._added(digest)
+
+    def _evict(self, now: Optional[float] = None):
+        """Remove least recently used entries while the store is over its cap, and entries unused for max_age."""
+        now = now if now is not None else time.time()
+        victims = []
+        with self._lock:
+            total = self._bytes
+            for digest, (size, used) in self._entries.items():
+                if now - used < EVICTION_GRACE:
+                    # Entries are ordered by last use, so every later one is recent too
+                    break
+                if total > self.max_bytes:
+                    reason = "size"
+                elif self.max_age and now - used > self.max_age:
+                    reason = "age"
+                else:
+                    break
+                victims.append((digest, size, reason))
+                total -= size
+            for digest, size, reason in victims:
+                del self._entries[digest]
+                self._bytes -= size
+                self._evicted[reason] = self._evicted.get(reason, 0) + 1
+                self._evicted_bytes += size
+        for digest, size, reason in victims:
+            shutil.rmtree(self._entry_dir(digest), ignore_errors=True)
+
+    def _migrate_legacy(self):
+        """Move CVs saved directly in the legacy folder into the store; an entry's last use is the file's mtime."""
+        if not self.legacy_folder or os.path.abspath(self.legacy_folder) == os.path.abspath(self.root):
+            return
+        try:
+            items = list(os.scandir(self.legacy_folder))
+        except FileNotFoundError:
+            return
+        for item in items:
+            extension = os.path.splitext(item.name)[1].lower()
+            if not item.is_file() or extension not in LEGACY_UPLOAD_EXTENSIONS:
+                continue
+            try:
+                used = item.stat().st_mtime
+                with open(item.path, "rb") as f:
+                    data = f.read()
+                digest = hashlib.sha256(data).hexdigest()
+                path = os.path.join(self._entry_dir(digest), ORIGINAL + extension)
+                if not os.path.exists(path):
+                    self._write(path, data)
+                    os.utime(self._entry_dir(digest), (used, used))
+                os.remove(item.path)
+            except FileNotFoundError:
+                # Another process migrated it first
+                continue
+
+    def compact(self):
+        """
+        Reconcile the index with the disk and enforce the retention policy.
+
+        Moves legacy uploads into the store, picks up entries written by other
+        processes, removes abandoned partial writes and empty shard directories,
+        then evicts as needed.
+        """
+        now = time.time()
+        self._migrate_legacy()
+        for shard in os.scandir(self.root):
+            if not shard.is_dir() or len(shard.name) != 2:
+                continue
+            for entry in os.scandir(shard.path):
+                if not entry.is_dir():
+                    continue
+                for item in os.scandir(entry.path):
+                    if item.name.endswith(_TEMP_SUFFIX) and now - item.stat().st_mtime > _STALE_TEMP_AGE:
+                        os.remove(item.path)
+        self._scan()
+        self._evict(now)
+        for shard in os.scandir(self.root):
+            if shard.is_dir() and len(shard.name) == 2 and not any(os.scandir(shard.path)):
+                try:
+                    os.rmdir(shard.path)
+                except OSError:
+                    # Another process just stored something in it
+                    pass
+        with self._lock:
+            self._compactions += 1
+
+    def start(self):
+        """Start the background compaction thread if it is not running."""
+        with self._lock:
+            if self._thread and self._thread.is_alive():
+                return
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._loop, name="upload-compaction", daemon=True)
+            self._thread.start()
+
+    def _loop(self):
+        while not self._stop.wait(self.compaction_interval):
+            try:
+                self.compact()
+            except Exception as e:
+                print(f"Error compacting uploads: {e}")
+
+    def close(self):
+        """Stop the background compaction thread."""
+        self._stop.set()
+
+    def stats(self) -> Dict[str, Any]:
+        """
+        Return the store's usage.
+
+        Returns:
+            Dictionary with 'entries', 'bytes', 'max_bytes', 'evicted' (entries
+            evicted per reason: 'size' or 'age'), 'evicted_bytes' and 'compactions'
+        """
+        with self._lock:
+            return {
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "evicted": dict(self._evicted),
+                "evicted_bytes": self._evicted_bytes,
+                "compactions": self._compactions,
+            }
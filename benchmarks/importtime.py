@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Import-time budget for the application's entry points.
+
+Each target is imported in a fresh interpreter with ``python -X importtime`` and
+its cumulative import time (median of several runs) is compared to a budget.
+Targets also list heavy dependencies that must stay lazy; loading one of them
+fails the check regardless of timing, which keeps the check meaningful on
+machines of any speed.
+
+    python benchmarks/importtime.py                   # check every target
+    python benchmarks/importtime.py --target app.main --top 20
+    python benchmarks/importtime.py --scale 2         # slower CI machines
+
+Exits with status 1 if any budget is exceeded.
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+from typing import List, Dict, Tuple
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Dependencies only needed for real LinkedIn scraping, PDF parsing, HTTP calls or ranking
+HEAVY_MODULES = (
+    "selenium", "webdriver_manager", "bs4", "lxml", "fake_useragent", "PyPDF2", "requests", "scipy",
+)
+
+# Target -> (budget in milliseconds, modules that must not be imported)
+BUDGETS: Dict[str, Tuple[float, Tuple[str, ...]]] = {
+    "app.utils": (50, HEAVY_MODULES + ("pandas", "numpy")),
+    "app.utils.mock_job_search": (100, HEAVY_MODULES + ("pandas", "numpy")),
+    "app.components": (50, HEAVY_MODULES + ("pandas", "numpy", "streamlit")),
+    # Streamlit itself accounts for most of this
+    "app.main": (800, HEAVY_MODULES + ("pandas", "numpy")),
+}
+
+
+def measure(target: str) -> Tuple[float, List[Tuple[int, str, float]]]:
+    """
+    Import a module in a fresh interpreter.
+
+    Returns:
+        Tuple containing:
+        - Cumulative import time of the target in milliseconds
+        - (depth, name, cumulative milliseconds) of every module the target's import
+          loaded, excluding the interpreter startup; direct imports have depth 1
+    """
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {target}"],
+        capture_output=True, text=True, env=env, cwd=PROJECT_ROOT,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {target} failed:\n{result.stderr}")
+
+    # Modules are listed after the modules they import, indented two spaces per level;
+    # the target's subtree is everything since the previous unindented line
+    subtree: List[Tuple[int, str, float]] = []
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "[us]" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        elapsed = int(cumulative) / 1000
+        if depth > 0:
+            subtree.append((depth, name.strip(), elapsed))
+        elif name.strip() == target:
+            return elapsed, subtree
+        else:
+            subtree = []
+    raise RuntimeError(f"{target} was not reported by -X importtime")
+
+
+def check(target: str, budget_ms: float, forbidden: Tuple[str, ...], repeat: int, top: int) -> bool:
+    """Measure a target, print a report and return whether it is within budget."""
+    # The first run also compiles bytecode, so it isn't counted
+    measure(target)
+    runs = [measure(target) for _ in range(repeat)]
+    median = statistics.median(elapsed for elapsed, _ in runs)
+    modules = runs[-1][1]
+    imported = {name for _, name, _ in modules}
+    loaded = [name for name in forbidden if name in imported]
+
+    ok = median <= budget_ms and not loaded
+    print(f"{'OK  ' if ok else 'FAIL'} {target}: {median:.1f} ms (budget {budget_ms:.0f} ms, {repeat} runs)")
+    if loaded:
+        print(f"     eagerly imports: {', '.join(loaded)}")
+    direct = sorted(((elapsed, name) for depth, name, elapsed in modules if depth == 1), reverse=True)
+    for elapsed, name in direct[:top]:
+        print(f"     {elapsed:8.1f} ms  {name}")
+    return ok
+
+
+def main():
+    """Check the import-time budgets from the command line."""
+    parser = argparse.ArgumentParser(description="Check the import time of the application's entry points.")
+    parser.add_argument("--target", action="append", choices=sorted(BUDGETS), help="Target to check (default: all)")
+    parser.add_argument("--repeat", type=int, default=5, help="Timed runs per target; the median is compared")
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every budget, e.g. for slower machines")
+    parser.add_argument("--top", type=int, default=8, help="Number of slowest direct imports to list")
+    args = parser.parse_args()
+
+    results: List[bool] = []
+    for target in args.target or list(BUDGETS):
+        budget_ms, forbidden = BUDGETS[target]
+        results.append(check(target, budget_ms * args.scale, forbidden, args.repeat, args.top))
+    sys.exit(0 if all(results) else 1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,497 @@
+#!/usr/bin/env python3
+"""
+End-to-end benchmark of the CV-to-jobs pipeline.
+
+Drives the whole pipeline headlessly, the way a session or the HTTP API does:
+storing and extracting a PDF CV (CVParser), analyzing it, generating search
+queries, searching them (search_multiple_queries), scoring the jobs found
+(BatchScorer) and optimizing the CV for the top job titles. OpenRouter and
+LinkedIn are replaced by stand-ins with configurable latency, while everything
+in between (admission control, parsing, validation, search indexes, stores) is
+the real code. Each concurrency level runs a number of pipelines for distinct
+CVs, so no cache serves one pipeline from another's work.
+
+Per-stage and end-to-end latency percentiles (p50/p95/p99, in milliseconds)
+and throughput (pipelines per second) are written as JSON and compared to a
+stored baseline. Each level is run several times and every figure is the
+median of the runs', since tail latencies under contention vary from run to run.
+
+    python benchmarks/pipeline.py                        # run and compare to the baseline
+    python benchmarks/pipeline.py --concurrency 1 8 32 --pipelines 64
+    python benchmarks/pipeline.py --llm-latency 1.5 --search-latency 0.5 --no-baseline
+    python benchmarks/pipeline.py --output result.json   # keep the results
+    python benchmarks/pipeline.py --save-baseline        # record a new baseline
+
+Exits with status 1 if a percentile or the throughput regressed beyond the
+tolerance, or if pipelines failed that didn't fail in the baseline.
+"""
+import argparse
+import hashlib
+import json
+import math
+import os
+import random
+import statistics
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Dict, List
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, PROJECT_ROOT)
+
+from app.utils.admission import AdmissionController, admission_scope  # noqa: E402
+from app.utils.advanced_features import AdvancedFeatures  # noqa: E402
+from app.utils.config import LLM_CONCURRENCY, SCORING_CONCURRENCY  # noqa: E402
+from app.utils.cv_parser import CVParser  # noqa: E402
+from app.utils.llm import OpenRouterClient  # noqa: E402
+from app.utils.mock_job_search import MockLinkedInJobSearch  # noqa: E402
+from app.utils.score_store import ScoreStore  # noqa: E402
+from app.utils.scoring import BatchScorer  # noqa: E402
+from app.utils.upload_store import UploadStore  # noqa: E402
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "pipeline_baseline.json")
+
+STAGES = ("extract", "analyze", "queries", "search", "score", "optimize")
+
+PERCENTILES = (50, 95, 99)
+
+# Seconds between checks for the end of batch scoring
+_SCORE_POLL_INTERVAL = 0.002
+
+# Role, search title and skills of the stand-in candidates; titles match the synthetic job corpus
+_PROFILES = [
+    ("Data Scientist", ["Data Scientist", "Machine Learning Engineer", "Data Analyst", "Data Engineer"],
+     ["Python", "SQL", "Machine Learning", "Statistics", "Pandas", "scikit-learn", "Docker"]),
+    ("Backend Developer", ["Backend Developer", "Software Engineer", "Full Stack Developer", "DevOps Engineer"],
+     ["Python", "Go", "PostgreSQL", "Docker", "Kubernetes", "REST APIs", "AWS"]),
+    ("Frontend Developer", ["Frontend Developer", "Full Stack Developer", "Software Engineer", "Mobile Developer"],
+     ["JavaScript", "TypeScript", "React", "CSS", "HTML", "Node.js", "Git"]),
+]
+
+
+class Latency:
+    """Simulated latency of a remote service: a mean delay varied uniformly by a jitter fraction."""
+
+    def __init__(self, seconds: float, jitter: float, seed: int):
+        self.seconds = seconds
+        self.jitter = jitter
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def wait(self):
+        if self.seconds <= 0:
+            return
+        with self._lock:
+            factor = self._random.uniform(1 - self.jitter, 1 + self.jitter)
+        time.sleep(self.seconds * factor)
+
+
+class StandInOpenRouterClient(OpenRouterClient):
+    """
+    OpenRouter client answering from canned responses after a simulated delay.
+
+    Only the HTTP transport is replaced: admission control and response
+    parsing are the real client's. The answer is chosen by the prompt's role.
+    """
+
+    def __init__(self, latency: Latency, admission: AdmissionController):
+        super().__init__(api_key="benchmark", admission=admission)
+        self.latency = latency
+
+    def _post(self, payload: Dict[str, Any]) -> Dict[str, Any]:
+        self.latency.wait()
+        system, user = payload["messages"][0]["content"], payload["messages"][-1]["content"]
+        if "CV analyzer" in system:
+            content = json.dumps(self._analysis(user.split("\n\n", 1)[-1]))
+        elif "job search assistant" in system:
+            titles = json.loads(user.split("CV Analysis: ", 1)[1])["job_titles"]
+            content = "\n".join(f"{number}. {title}" for number, title in enumerate(titles, start=1))
+        elif "compatibility analyst" in system:
+            score = int(hashlib.sha256(user.encode("utf-8")).hexdigest()[:8], 16) % 61 + 40
+            content = "```json\n" + json.dumps({
+                "overall_score": score,
+                "skills_match": min(100, score + 5),
+                "experience_match": score,
+                "education_match": max(0, score - 5),
+                "missing_skills": ["Kubernetes", "Spark"],
+                "missing_experiences": ["Team leadership"],
+                "recommendations": ["Quantify the impact of recent projects"],
+            }) + "\n```"
+        elif "optimization assistant" in system:
+            content = "```json\n" + json.dumps({
+                "skills_to_add": ["Kubernetes", "Airflow"],
+                "skills_to_emphasize": ["Python", "SQL"],
+                "experiences_to_emphasize": ["Production deployments"],
+                "items_to_remove": ["Unrelated summer jobs"],
+                "general_recommendations": ["Lead with measurable results"],
+            }) + "\n```"
+        else:
+            content = "{}"
+        return {"choices": [{"message": {"role": "assistant", "content": content}}]}
+
+    @staticmethod
+    def _analysis(cv_text: str) -> Dict[str, Any]:
+        lines = [line.strip() for line in cv_text.splitlines() if line.strip()]
+        name, role = lines[0], lines[1] if len(lines) > 1 else ""
+        _, titles, skills = next((profile for profile in _PROFILES if profile[0] == role), _PROFILES[0])
+        return {
+            # The candidate's name keeps every CV's analysis, and so its scores, distinct
+            "skills": skills,
+            "experience": [f"{name}: {role} at Example Corp (2019-2024)", f"Junior {role} at Sample Ltd (2016-2019)"],
+            "education": ["MSc Computer Science, Example University"],
+            "job_titles": titles,
+            "relevant_job_keywords": skills[:4],
+        }
+
+
+class StandInJobSearch(MockLinkedInJobSearch):
+    """LinkedIn stand-in: the mock searcher over a synthetic corpus, with simulated request latency."""
+
+    def __init__(self, latency: Latency, corpus_size: int, seed: int):
+        super().__init__(corpus_size=corpus_size, seed=seed)
+        self.latency = latency
+
+    def search_jobs(self, query: str, location: str = "", limit: int = 10) -> List[Dict[str, Any]]:
+        self.latency.wait()
+        return super().search_jobs(query, location, limit)
+
+
+def _pdf_string(text: str) -> str:
+    return "(" + text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)") + ")"
+
+
+def cv_pdf(lines: List[str]) -> bytes:
+    """Build a one-page PDF with a line of text per entry."""
+    text = " T* ".join(f"{_pdf_string(line)} Tj" for line in lines)
+    stream = f"BT /F1 10 Tf 14 TL 56 780 Td {text} ET".encode("latin-1")
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 595 842] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n" % len(stream) + stream + b"\nendstream",
+    ]
+    pdf = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(pdf))
+        pdf += b"%d 0 obj\n" % number + body + b"\nendobj\n"
+    xref = len(pdf)
+    pdf += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    pdf += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    pdf += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    return bytes(pdf)
+
+
+def candidate_cv(name: str, number: int) -> bytes:
+    """Build a plausible CV for a stand-in candidate."""
+    role, titles, skills = _PROFILES[number % len(_PROFILES)]
+    lines = [name, role, "", "Summary",
+             f"{role} with eight years of experience building and shipping production systems.", "",
+             "Skills", ", ".join(skills), "", "Experience"]
+    for year in range(2024, 2012, -2):
+        lines += [f"{titles[year % len(titles)]}, Example Corp {year - 2}-{year}",
+                  f"- Delivered {year % 7 + 2} projects using {skills[year % len(skills)]} and {skills[(year + 1) % len(skills)]}",
+                  "- Worked with product, design and operations teams on roadmap and releases"]
+    lines += ["", "Education", "MSc Computer Science, Example University"]
+    return cv_pdf(lines)
+
+
+class Pipeline:
+    """The pipeline's components, wired to the stand-ins and to throwaway stores."""
+
+    def __init__(self, args: argparse.Namespace, workdir: str):
+        self.args = args
+        self.admission = AdmissionController(max_concurrency=args.llm_concurrency)
+        self.llm_client = StandInOpenRouterClient(Latency(args.llm_latency, args.jitter, args.seed), self.admission)
+        self.upload_store = UploadStore(os.path.join(workdir, "uploads"))
+        self.cv_parser = CVParser(self.llm_client, upload_store=self.upload_store)
+        self.advanced_features = AdvancedFeatures(self.llm_client)
+        self.score_store = ScoreStore(os.path.join(workdir, "scores.db"))
+        self.searcher = StandInJobSearch(Latency(args.search_latency, args.jitter, args.seed + 1),
+                                         args.corpus_size, args.seed)
+
+    def close(self):
+        self.score_store.close()
+        self.upload_store.close()
+
+    def run(self, name: str, number: int) -> Dict[str, float]:
+        """
+        Take one CV through the pipeline on behalf of its own tenant.
+
+        Returns:
+            Seconds spent in each stage
+
+        Raises:
+            RuntimeError: If a stage failed
+        """
+        timings: Dict[str, float] = {}
+        pdf = candidate_cv(name, number)
+        with admission_scope(name):
+            started = time.perf_counter()
+            path = self.upload_store.save(pdf, "cv.pdf")
+            cv_text = self.cv_parser.extract_text_from_pdf(path)
+            timings["extract"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            cv_analysis = self.cv_parser.analyze_text(cv_text)
+            timings["analyze"] = time.perf_counter() - started
+            if "error" in cv_analysis:
+                raise RuntimeError(f"analysis failed: {cv_analysis['error']}")
+
+            started = time.perf_counter()
+            queries = self.llm_client.generate_job_search_queries(cv_analysis)
+            timings["queries"] = time.perf_counter() - started
+
+            started = time.perf_counter()
+            jobs = self.searcher.search_multiple_queries(
+                queries, limit_per_query=self.args.jobs_per_query
+            ).to_dict("records")
+            timings["search"] = time.perf_counter() - started
+            if not jobs:
+                raise RuntimeError(f"no jobs found for {queries}")
+
+            started = time.perf_counter()
+            scorer = BatchScorer(self.advanced_features, self.score_store, max_workers=self.args.scoring_concurrency)
+            scorer.start(cv_analysis, jobs)
+            while scorer.running:
+                time.sleep(_SCORE_POLL_INTERVAL)
+            snapshot = scorer.snapshot()
+            timings["score"] = time.perf_counter() - started
+            if snapshot["errors"]:
+                raise RuntimeError(f"scoring failed: {next(iter(snapshot['errors'].values()))}")
+
+            started = time.perf_counter()
+            titles = list(dict.fromkeys(job["title"] for job in jobs))[:self.args.titles]
+            results = self.advanced_features.optimize_cv_for_titles(cv_analysis, titles)
+            timings["optimize"] = time.perf_counter() - started
+            failed = [result["error"] for result in results.values() if "error" in result]
+            if failed:
+                raise RuntimeError(f"optimization failed: {failed[0]}")
+        return timings
+
+
+def percentiles(samples: List[float]) -> Dict[str, float]:
+    """Nearest-rank percentiles and mean of durations in seconds, reported in milliseconds."""
+    if not samples:
+        return {}
+    ordered = sorted(samples)
+    summary = {
+        f"p{p}": round(ordered[max(0, math.ceil(p / 100 * len(ordered)) - 1)] * 1000, 2) for p in PERCENTILES
+    }
+    summary["mean"] = round(statistics.fmean(ordered) * 1000, 2)
+    return summary
+
+
+def run_level(pipeline: Pipeline, concurrency: int, count: int, repetition: int = 0) -> Dict[str, Any]:
+    """Run count pipelines, concurrency at a time, and summarize their latencies."""
+    samples: Dict[str, List[float]] = {stage: [] for stage in STAGES + ("end_to_end",)}
+    errors: List[str] = []
+    lock = threading.Lock()
+
+    def one(number: int):
+        started = time.perf_counter()
+        try:
+            timings = pipeline.run(f"Candidate c{concurrency}-r{repetition}-{number}", number)
+        except Exception as e:
+            with lock:
+                errors.append(str(e))
+            return
+        timings["end_to_end"] = time.perf_counter() - started
+        with lock:
+            for stage, seconds in timings.items():
+                samples[stage].append(seconds)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="pipeline") as executor:
+        list(executor.map(one, range(count)))
+    wall = time.perf_counter() - started
+
+    completed = len(samples["end_to_end"])
+    return {
+        "pipelines": count,
+        "completed": completed,
+        "errors": len(errors),
+        "error_samples": errors[:3],
+        "wall_seconds": round(wall, 3),
+        "throughput": round(completed / wall, 3) if wall > 0 else 0.0,
+        "stages": {stage: percentiles(samples[stage]) for stage in STAGES},
+        "end_to_end": percentiles(samples["end_to_end"]),
+    }
+
+
+def median_summary(runs: List[Dict[str, Any]]) -> Dict[str, Any]:
+    """Combine repeated runs of a level: each figure is the median of the runs', errors are summed."""
+    def median(values: List[Any]) -> Any:
+        if isinstance(values[0], dict):
+            return {key: median([value[key] for value in values]) for key in values[0] if all(key in value for value in values)}
+        return round(statistics.median(values), 3)
+
+    summary = median([{key: run[key] for key in ("wall_seconds", "throughput", "stages", "end_to_end")} for run in runs])
+    return {
+        "pipelines": sum(run["pipelines"] for run in runs),
+        "completed": sum(run["completed"] for run in runs),
+        "errors": sum(run["errors"] for run in runs),
+        "error_samples": [sample for run in runs for sample in run["error_samples"]][:3],
+        **summary,
+    }
+
+
+def compare(
+    result: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float,
+    stage_tolerance: float,
+    min_delta_ms: float,
+) -> List[str]:
+    """
+    Compare a run to a baseline.
+
+    An end-to-end percentile regresses when it is more than tolerance (a
+    fraction) and more than min_delta_ms above the baseline's; throughput when
+    it is more than tolerance below it. Stage percentiles are held to
+    stage_tolerance instead: under contention, how long each stage waits for
+    the LLM depends on how the pipelines interleave. A percentile is only checked when it isn't simply
+    the slowest pipeline of a run (p99 needs 100 pipelines), since that one is
+    mostly scheduling noise. Levels missing from either run are skipped.
+
+    Returns:
+        A description of every regression
+    """
+    regressions = []
+    pipelines = result["settings"]["pipelines"]
+    checked = [p for p in PERCENTILES if pipelines * (100 - p) / 100 >= 1]
+    for level, current in result["levels"].items():
+        before = baseline.get("levels", {}).get(level)
+        if before is None:
+            continue
+        if current["errors"] > before["errors"]:
+            regressions.append(f"concurrency {level}: {current['errors']} failed pipelines (baseline {before['errors']})")
+        if current["throughput"] < before["throughput"] * (1 - tolerance):
+            regressions.append(f"concurrency {level}: throughput {current['throughput']:.2f}/s "
+                               f"(baseline {before['throughput']:.2f}/s)")
+        pairs = [(stage, current["stages"].get(stage, {}), before["stages"].get(stage, {}), stage_tolerance)
+                 for stage in STAGES]
+        pairs.append(("end_to_end", current["end_to_end"], before["end_to_end"], tolerance))
+        for stage, now, then, allowed in pairs:
+            for p in checked:
+                key = f"p{p}"
+                if key not in now or key not in then:
+                    continue
+                if now[key] > then[key] * (1 + allowed) and now[key] - then[key] > min_delta_ms:
+                    regressions.append(f"concurrency {level}: {stage} {key} {now[key]:.1f} ms (baseline {then[key]:.1f} ms)")
+    return regressions
+
+
+def report(result: Dict[str, Any]):
+    """Print a table of the results to stderr, keeping stdout for the JSON."""
+    columns = STAGES + ("end_to_end",)
+    print(f"{'level':>7} {'thru/s':>7} {'err':>4}  " + " ".join(f"{stage:>18}" for stage in columns), file=sys.stderr)
+    print(f"{'':>21}" + " ".join(f"{'p50/p95/p99 ms':>18}" for _ in columns), file=sys.stderr)
+    for level, summary in result["levels"].items():
+        cells = []
+        for stage in columns:
+            stats = summary["end_to_end"] if stage == "end_to_end" else summary["stages"][stage]
+            cell = "/".join(f"{stats['p%d' % p]:.0f}" for p in PERCENTILES) if stats else "-"
+            cells.append(f"{cell:>18}")
+        print(f"{level:>7} {summary['throughput']:>7.2f} {summary['errors']:>4}  " + " ".join(cells), file=sys.stderr)
+
+
+def settings(args: argparse.Namespace) -> Dict[str, Any]:
+    """The run's parameters, recorded with the results so baselines are compared like for like."""
+    keys = ("pipelines", "repeat", "llm_latency", "search_latency", "jitter", "llm_concurrency", "scoring_concurrency",
+            "corpus_size", "jobs_per_query", "titles", "seed")
+    return {key: getattr(args, key) for key in keys}
+
+
+def main():
+    """Run the benchmark from the command line."""
+    parser = argparse.ArgumentParser(description="Benchmark the CV-to-jobs pipeline end to end with stand-in services.")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16],
+                        help="Pipelines run at once; one run per level")
+    parser.add_argument("--pipelines", type=int, default=32, help="Pipelines (distinct CVs) run per level")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="Runs per level; the median of each figure is reported and compared")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="Mean seconds per stand-in LLM request")
+    parser.add_argument("--search-latency", type=float, default=0.02, help="Mean seconds per stand-in LinkedIn search")
+    parser.add_argument("--jitter", type=float, default=0.2, help="Fraction by which each simulated latency varies")
+    parser.add_argument("--llm-concurrency", type=int, default=LLM_CONCURRENCY,
+                        help="LLM requests in flight at once (the admission controller's capacity)")
+    parser.add_argument("--scoring-concurrency", type=int, default=SCORING_CONCURRENCY,
+                        help="Concurrent scoring requests per pipeline")
+    parser.add_argument("--corpus-size", type=int, default=5000, help="Synthetic jobs the LinkedIn stand-in searches")
+    parser.add_argument("--jobs-per-query", type=int, default=3, help="Jobs kept per search query")
+    parser.add_argument("--titles", type=int, default=3, help="Job titles the CV is optimized for")
+    parser.add_argument("--seed", type=int, default=42, help="Seed of the corpus and the simulated latencies")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="Baseline results to compare to")
+    parser.add_argument("--no-baseline", action="store_true", help="Don't compare to a baseline")
+    parser.add_argument("--save-baseline", action="store_true", help="Store the results as the new baseline")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="Fraction by which an end-to-end percentile may rise (or throughput fall) "
+                             "before it is a regression")
+    parser.add_argument("--stage-tolerance", type=float, default=0.5,
+                        help="Fraction by which a stage's percentile may rise before it is a regression")
+    parser.add_argument("--min-delta-ms", type=float, default=20.0,
+                        help="Latency increases smaller than this are never regressions")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="pipeline-bench-") as workdir:
+        pipeline = Pipeline(args, workdir)
+        try:
+            # The first pipeline also imports PyPDF2 and pandas, so it isn't counted
+            pipeline.run("Candidate warmup", 0)
+            levels = {}
+            for concurrency in args.concurrency:
+                print(f"Running {args.pipelines} pipelines, {concurrency} at a time, {args.repeat} times...",
+                      file=sys.stderr)
+                runs = [run_level(pipeline, concurrency, args.pipelines, repetition) for repetition in range(args.repeat)]
+                levels[str(concurrency)] = median_summary(runs)
+            admission = pipeline.admission.metrics()
+        finally:
+            pipeline.close()
+
+    result = {
+        "settings": settings(args),
+        "python": sys.version.split()[0],
+        "levels": levels,
+        "admission": {key: admission[key] for key in ("capacity", "max_queued", "admitted", "rejected", "waits")},
+    }
+    report(result)
+    output = json.dumps(result, indent=2)
+    if args.output:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+    else:
+        print(output)
+
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            f.write(output + "\n")
+        print(f"Saved baseline to {args.baseline}", file=sys.stderr)
+        return
+    if args.no_baseline:
+        return
+    if not os.path.exists(args.baseline):
+        print(f"No baseline at {args.baseline}; record one with --save-baseline", file=sys.stderr)
+        return
+
+    with open(args.baseline) as f:
+        baseline = json.load(f)
+    if baseline.get("settings") != result["settings"]:
+        print("Warning: the baseline was recorded with different settings", file=sys.stderr)
+    regressions = compare(result, baseline, args.tolerance, args.stage_tolerance, args.min_delta_ms)
+    for regression in regressions:
+        print(f"REGRESSION {regression}", file=sys.stderr)
+    print(f"{'FAIL' if regressions else 'OK'}: compared to {args.baseline} "
+          f"(tolerance {args.tolerance:.0%}, stages {args.stage_tolerance:.0%}, {args.min_delta_ms:g} ms)",
+          file=sys.stderr)
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,30 @@
+#!/usr/bin/env python3
+import os
+import sys
+
+def main():
+    """Run the CV-Based Job Finder HTTP API."""
+    # Ensure we're in the correct directory
+    script_dir = os.path.dirname(os.path.abspath(__file__))
+    os.chdir(script_dir)
+    
+    # Add the project root to Python path (worker processes inherit PYTHONPATH)
+    if script_dir not in sys.path:
+        sys.path.insert(0, script_dir)
+    os.environ["PYTHONPATH"] = script_dir + os.pathsep + os.environ.get("PYTHONPATH", "")
+    
+    import uvicorn
+    from app.utils.config import API_HOST, API_PORT, API_WORKERS
+    
+    try:
+        print(f"Starting CV-Based Job Finder API on http://{API_HOST}:{API_PORT} with {API_WORKERS} workers...")
+        # Workers are separate processes, so the app is passed by import path
+        uvicorn.run("app.api.server:app", host=API_HOST, port=API_PORT, workers=API_WORKERS)
+    except KeyboardInterrupt:
+        print("\nAPI stopped.")
+    except Exception as e:
+        print(f"Error running API: {e}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()